@@ -1,7 +1,11 @@
 from flask import Flask
 from flask_cors import CORS
-from app.database import db
+from app.database import db, migrate
 from app.routes import register_routes
+from app.services.cache import init_cache
+from app.services.inverted_index import init_search_index
+from app.utils.json_provider import init_json_provider
+from app.utils.compression import init_compression
 import logging
 from app.utils.logging import configure_app_logging
 
@@ -17,15 +21,24 @@ def create_app(config_name='default'):
     else:
         app.config.from_object('config.DevelopmentConfig')
     
+    # Serialize responses with the configured JSON provider
+    init_json_provider(app)
+    
     # Enable CORS
     CORS(app)
     
     # Initialize extensions
     db.init_app(app)
+    migrate.init_app(app, db)
+    init_cache(app)
+    init_search_index(app)
     
     # Register blueprints
     register_routes(app)
     
+    # Compress large responses for clients that accept it
+    init_compression(app)
+    
     # Configure logging
     configure_app_logging(app)
     
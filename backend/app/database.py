@@ -7,5 +7,8 @@ migrate = Migrate()
 
 def init_db(app):
     """Initialize database with the Flask app."""
-    db.init_app(app)
-    migrate.init_app(app, db)
\ No newline at end of file
+    # create_app already registers both extensions; registering twice is an error
+    if 'sqlalchemy' not in app.extensions:
+        db.init_app(app)
+    if 'migrate' not in app.extensions:
+        migrate.init_app(app, db)
\ No newline at end of file
@@ -1,2 +1,8 @@
 # Import models to ensure they are registered with SQLAlchemy
-from app.models.executive_order import ExecutiveOrder
\ No newline at end of file
+from app.models.dataset_version import DatasetVersion
+from app.models.executive_order import ExecutiveOrder
+from app.models.executive_order_neighbor import ExecutiveOrderNeighbor
+from app.models.executive_order_tombstone import ExecutiveOrderTombstone
+from app.models.ingest_watermark import IngestWatermark
+# Registers the full-text search DDL on the executive_orders table
+from app.models import search_index
\ No newline at end of file
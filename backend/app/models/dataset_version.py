@@ -0,0 +1,15 @@
+from app.database import db
+from datetime import datetime
+
+class DatasetVersion(db.Model):
+    """Single-row counter bumped by every ingest commit that changes data."""
+    __tablename__ = 'dataset_version'
+    
+    # Always DATASET_VERSION_ROW_ID; a table rather than a cache key so every
+    # web and worker process reads the same value and it survives cache restarts
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    version = db.Column(db.BigInteger, nullable=False)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<DatasetVersion {self.version}>"
@@ -3,6 +3,17 @@ from datetime import datetime
 
 class ExecutiveOrder(db.Model):
     __tablename__ = 'executive_orders'
+    __table_args__ = (
+        # Serves president-filtered listings sorted by date, and keyset paging on (date, id)
+        db.Index('ix_executive_orders_president_issuance_date_id', 'president', 'issuance_date', 'id'),
+        # Serves year (date range) filters, date sorting and latest-executive-orders
+        db.Index('ix_executive_orders_issuance_date_id', 'issuance_date', 'id'),
+        # Serve sorting and keyset paging by title and by president
+        db.Index('ix_executive_orders_title_id', 'title', 'id'),
+        db.Index('ix_executive_orders_president_id', 'president', 'id'),
+        # Serves the change feed's keyset scan on (updated_at, id)
+        db.Index('ix_executive_orders_updated_at_id', 'updated_at', 'id'),
+    )
     
     id = db.Column(db.String(20), primary_key=True)
     title = db.Column(db.String(255), nullable=False)
@@ -11,12 +22,46 @@ class ExecutiveOrder(db.Model):
     federal_register_citation = db.Column(db.String(50), nullable=True)
     url = db.Column(db.String(255), nullable=True)
     plain_language_summary = db.Column(db.Text, nullable=True)
+    # SHA-256 of the transformed source document, used by ingest to skip no-op updates
+    content_hash = db.Column(db.String(64), nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def __repr__(self):
         return f"<ExecutiveOrder {self.id}: {self.title}>"
     
+    # Fields returned by the API, in to_dict() order
+    SERIALIZED_FIELDS = (
+        'id',
+        'title',
+        'issuance_date',
+        'president',
+        'federal_register_citation',
+        'url',
+        'plain_language_summary',
+        'created_at',
+        'updated_at',
+    )
+    
+    @classmethod
+    def serialized_columns(cls, fields=None):
+        """Columns to select for row_to_dict, avoiding ORM instance hydration."""
+        return [getattr(cls, field) for field in (fields or cls.SERIALIZED_FIELDS)]
+    
+    @staticmethod
+    def row_to_dict(row, fields=None):
+        """
+        Convert a row selected with serialized_columns() to a dictionary.
+        
+        Dates are left as date objects for the app's JSON provider, which writes
+        them in the same ISO 8601 form as to_dict(). When fields is given, only
+        those keys are included.
+        """
+        data = row._asdict()
+        if fields:
+            return {field: data[field] for field in fields}
+        return data
+    
     def to_dict(self):
         """Convert the model instance to a dictionary."""
         return {
@@ -0,0 +1,16 @@
+from app.database import db
+from datetime import datetime
+
+class ExecutiveOrderNeighbor(db.Model):
+    """One entry of an executive order's precomputed top-k related orders."""
+    __tablename__ = 'executive_order_neighbors'
+    
+    # The primary key (eo_id, rank) serves the related-orders lookup in rank order
+    eo_id = db.Column(db.String(20), db.ForeignKey('executive_orders.id', ondelete='CASCADE'), primary_key=True)
+    rank = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    neighbor_id = db.Column(db.String(20), db.ForeignKey('executive_orders.id', ondelete='CASCADE'), nullable=False)
+    score = db.Column(db.Float, nullable=False)
+    computed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<ExecutiveOrderNeighbor {self.eo_id} #{self.rank}: {self.neighbor_id}>"
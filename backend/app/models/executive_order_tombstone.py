@@ -0,0 +1,60 @@
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from sqlalchemy import DDL, event
+
+class ExecutiveOrderTombstone(db.Model):
+    """Record of a deleted executive order, served by the change feed."""
+    __tablename__ = 'executive_order_tombstones'
+    __table_args__ = (
+        # Serves the change feed's keyset scan on (deleted_at, id)
+        db.Index('ix_executive_order_tombstones_deleted_at_id', 'deleted_at', 'id'),
+    )
+    
+    # No foreign key: the order is gone
+    id = db.Column(db.String(20), primary_key=True)
+    deleted_at = db.Column(db.DateTime, nullable=False)
+    
+    def __repr__(self):
+        return f"<ExecutiveOrderTombstone {self.id} at {self.deleted_at}>"
+
+# Deletes are recorded by database triggers so bulk deletes and manual SQL
+# are covered too. Timestamps are UTC, like the datetime.utcnow() column defaults.
+# Migration a1f6d8e2c4b9 creates the same triggers on existing databases.
+POSTGRESQL_CREATE = [
+    """
+    CREATE OR REPLACE FUNCTION record_executive_order_tombstone() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO executive_order_tombstones (id, deleted_at)
+        VALUES (OLD.id, timezone('utc', clock_timestamp()))
+        ON CONFLICT (id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+        RETURN OLD;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER executive_orders_tombstone AFTER DELETE ON executive_orders
+    FOR EACH ROW EXECUTE FUNCTION record_executive_order_tombstone()
+    """,
+]
+
+# strftime's %f has millisecond precision; pad it to the microseconds SQLAlchemy writes
+# (percent signs are doubled for DDL's string formatting)
+SQLITE_CREATE = [
+    """
+    CREATE TRIGGER executive_orders_tombstone AFTER DELETE ON executive_orders BEGIN
+        INSERT OR REPLACE INTO executive_order_tombstones (id, deleted_at)
+        VALUES (old.id, strftime('%%Y-%%m-%%d %%H:%%M:%%f', 'now') || '000');
+    END
+    """,
+]
+
+# The trigger is dropped with executive_orders; the PostgreSQL function is not
+POSTGRESQL_DROP = ["DROP FUNCTION IF EXISTS record_executive_order_tombstone()"]
+
+# Trigger bodies are resolved when they fire, so the tombstones table may be created after executive_orders
+for statement in POSTGRESQL_CREATE:
+    event.listen(ExecutiveOrder.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+for statement in SQLITE_CREATE:
+    event.listen(ExecutiveOrder.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+for statement in POSTGRESQL_DROP:
+    event.listen(ExecutiveOrder.__table__, 'after_drop', DDL(statement).execute_if(dialect='postgresql'))
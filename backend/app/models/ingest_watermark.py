@@ -0,0 +1,16 @@
+from app.database import db
+from datetime import datetime
+
+class IngestWatermark(db.Model):
+    """Newest document stored from an ingest source, where the next incremental run resumes."""
+    __tablename__ = 'ingest_watermarks'
+    
+    source = db.Column(db.String(50), primary_key=True)
+    last_publication_date = db.Column(db.Date, nullable=False)
+    last_document_number = db.Column(db.String(50), nullable=False)
+    # First publication date requested by the run that set the watermark (None for no lower bound)
+    last_window_start = db.Column(db.Date)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f"<IngestWatermark {self.source}: {self.last_publication_date} {self.last_document_number}>"
@@ -0,0 +1,75 @@
+from sqlalchemy import DDL, event
+from app.models.executive_order import ExecutiveOrder
+
+# Full-text search objects live outside the ORM metadata: PostgreSQL gets a
+# generated tsvector column with a GIN index, SQLite (tests and local
+# development) an FTS5 table kept in sync by triggers. Migrations
+# d7b3e5f1a9c2 and d9f2b4c6e8a1 create the same objects on existing databases.
+
+SEARCH_VECTOR_COLUMN = 'search_vector'
+SEARCH_VECTOR_INDEX = 'ix_executive_orders_search_vector'
+FTS_TABLE = 'executive_orders_fts'
+
+# Title matches outrank summary matches (weight A vs B)
+POSTGRESQL_CREATE = [
+    f"""
+    ALTER TABLE executive_orders ADD COLUMN {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(plain_language_summary, '')), 'B')
+    ) STORED
+    """,
+    f"CREATE INDEX {SEARCH_VECTOR_INDEX} ON executive_orders USING gin ({SEARCH_VECTOR_COLUMN})",
+]
+
+# The FTS table stores its own copy of the text under executive_orders' rowid,
+# so the triggers find the row to replace by rowid instead of scanning the
+# unindexed id column. VACUUM may renumber rowids of a table without an
+# INTEGER PRIMARY KEY, so searches also check id; should that ever happen, refill
+# the table from executive_orders as migration d9f2b4c6e8a1 does.
+SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        id UNINDEXED, title, plain_language_summary, tokenize='porter unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON executive_orders BEGIN
+        INSERT INTO {FTS_TABLE} (rowid, id, title, plain_language_summary)
+        VALUES (new.rowid, new.id, new.title, new.plain_language_summary);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON executive_orders BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid;
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF id, title, plain_language_summary ON executive_orders BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.rowid;
+        INSERT INTO {FTS_TABLE} (rowid, id, title, plain_language_summary)
+        VALUES (new.rowid, new.id, new.title, new.plain_language_summary);
+    END
+    """,
+]
+
+# Triggers are dropped with executive_orders; the FTS table is not
+SQLITE_DROP = [f"DROP TABLE IF EXISTS {FTS_TABLE}"]
+
+def is_search_index_object(name, type_):
+    """Whether a schema object belongs to the search index (ignored by autogenerate)."""
+    if type_ == 'table':
+        return name == FTS_TABLE or name.startswith(f"{FTS_TABLE}_")
+    if type_ == 'column':
+        return name == SEARCH_VECTOR_COLUMN
+    if type_ == 'index':
+        return name == SEARCH_VECTOR_INDEX
+    return False
+
+# Mirror the migration when tables are created with create_all()
+for statement in POSTGRESQL_CREATE:
+    event.listen(ExecutiveOrder.__table__, 'after_create', DDL(statement).execute_if(dialect='postgresql'))
+for statement in SQLITE_CREATE:
+    event.listen(ExecutiveOrder.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+for statement in SQLITE_DROP:
+    event.listen(ExecutiveOrder.__table__, 'after_drop', DDL(statement).execute_if(dialect='sqlite'))
@@ -1,14 +1,104 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
 from app.models.executive_order import ExecutiveOrder
+from app.models.executive_order_neighbor import ExecutiveOrderNeighbor
+from app.database import db
 from app.utils.http import not_found, bad_request, server_error, paginated_response, success_response
-from sqlalchemy import desc, extract
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_filter
+from app.services.count_cache import COUNT_MODES, count_executive_orders
+from app.services.view_cache import cached_view
+from app.services.search import search_executive_orders
+from app.services.inverted_index import get_search_index
+from app.services.stats import get_executive_order_stats
+from app.services.changes import get_changes
+from app.services.export import EXPORT_FORMATS, available_formats, export_executive_orders
+from app.services.timeline import TIMELINE_LEVELS, bucket_span, choose_level, get_timeline_index
+from sqlalchemy import desc
+from datetime import date
 import logging
 
 # Create Blueprint
 bp = Blueprint('executive_orders', __name__)
 logger = logging.getLogger(__name__)
 
+# Most executive orders a batch lookup may request
+BATCH_MAX_IDS = 100
+
+def _apply_filters(query, president=None, year=None):
+    """Apply the shared president/year filters to an ExecutiveOrder query."""
+    if president:
+        query = query.filter(ExecutiveOrder.president == president)
+    
+    if year:
+        # A half-open date range (unlike extract('year', ...)) can use the issuance_date indexes
+        query = query.filter(
+            ExecutiveOrder.issuance_date >= date(year, 1, 1),
+            ExecutiveOrder.issuance_date < date(year + 1, 1, 1)
+        )
+    
+    return query
+
+def _parse_fields(value):
+    """
+    Parse a comma-separated `fields` parameter.
+    
+    Returns:
+        list or None: Requested fields in SERIALIZED_FIELDS order, or None for every field
+    
+    Raises:
+        ValueError: If a field is not one the API returns
+    """
+    if value is None:
+        return None
+    
+    requested = {field.strip() for field in value.split(',') if field.strip()}
+    if not requested:
+        return None
+    
+    invalid = requested.difference(ExecutiveOrder.SERIALIZED_FIELDS)
+    if invalid:
+        raise ValueError(f"Invalid fields: {', '.join(sorted(invalid))}. Valid options are: {', '.join(ExecutiveOrder.SERIALIZED_FIELDS)}")
+    
+    return [field for field in ExecutiveOrder.SERIALIZED_FIELDS if field in requested]
+
+def _batch_lookup(ids, fields=None):
+    """
+    Look up many executive orders with one IN query.
+    
+    Returns:
+        tuple: (orders in the order of first appearance in ids, ids not found)
+    """
+    selected_fields = fields and fields + (['id'] if 'id' not in fields else [])
+    rows = ExecutiveOrder.query \
+        .with_entities(*ExecutiveOrder.serialized_columns(selected_fields)) \
+        .filter(ExecutiveOrder.id.in_(ids)) \
+        .all()
+    found = {row.id: row for row in rows}
+    
+    items = [ExecutiveOrder.row_to_dict(found[eo_id], fields) for eo_id in ids if eo_id in found]
+    missing = [eo_id for eo_id in ids if eo_id not in found]
+    return items, missing
+
+def _batch_response(ids):
+    """Validate a batch of ids and respond with the orders found and the ids missing."""
+    # Drop blanks and repeats, keeping first-appearance order
+    ids = list(dict.fromkeys(eo_id.strip() for eo_id in ids if eo_id and eo_id.strip()))
+    
+    if not ids:
+        return bad_request("Missing ids. Provide one or more executive order IDs")
+    
+    if len(ids) > BATCH_MAX_IDS:
+        return bad_request(f"Too many ids. At most {BATCH_MAX_IDS} can be requested at once")
+    
+    try:
+        fields = _parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return bad_request(str(e))
+    
+    items, missing = _batch_lookup(ids, fields)
+    return success_response(data={'items': items, 'missing': missing})
+
 @bp.route('/executive-orders', methods=['GET'])
+@cached_view(params=('page', 'per_page', 'president', 'year', 'sort', 'order', 'count', 'cursor', 'fields'))
 def get_executive_orders():
     """Get a list of executive orders with filtering options."""
     try:
@@ -18,7 +108,12 @@ def get_executive_orders():
         president = request.args.get('president')
         year = request.args.get('year', type=int)
         sort_field = request.args.get('sort', 'issuance_date')
-        sort_order = request.args.get('order', 'desc')
+        sort_order = 'asc' if request.args.get('order', 'desc').lower() == 'asc' else 'desc'
+        count_mode = request.args.get('count', 'exact').lower()
+        
+        # Presence of the cursor parameter (even empty) selects keyset pagination
+        cursor = request.args.get('cursor')
+        use_cursor = cursor is not None
         
         # Validate pagination parameters
         if page < 1:
@@ -26,57 +121,339 @@ def get_executive_orders():
         if per_page < 1 or per_page > 100:
             per_page = 20
         
-        # Build query
-        query = ExecutiveOrder.query
+        if year and not 1 <= year < 9999:
+            return bad_request("Invalid year. Must be between 1 and 9998")
         
-        # Apply filters
-        if president:
-            query = query.filter(ExecutiveOrder.president == president)
-        
-        if year:
-            query = query.filter(extract('year', ExecutiveOrder.issuance_date) == year)
+        # Build query with filters
+        query = _apply_filters(ExecutiveOrder.query, president, year)
         
         # Validate sort field
         valid_sort_fields = ['issuance_date', 'id', 'title', 'president']
         if sort_field not in valid_sort_fields:
             return bad_request(f"Invalid sort field. Valid options are: {', '.join(valid_sort_fields)}")
         
-        # Apply sorting
-        if sort_order.lower() == 'asc':
-            query = query.order_by(getattr(ExecutiveOrder, sort_field))
+        if count_mode not in COUNT_MODES:
+            return bad_request(f"Invalid count mode. Valid options are: {', '.join(COUNT_MODES)}")
+        
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        sort_column = getattr(ExecutiveOrder, sort_field)
+        
+        # Count before the keyset predicate so totals describe the whole filtered set;
+        # cached per filter set until the next ingest commit
+        total = count_executive_orders(query, {'president': president, 'year': year}, count_mode)
+        
+        if use_cursor and cursor:
+            try:
+                value, last_id = decode_cursor(cursor, sort_field, sort_order)
+            except ValueError as e:
+                return bad_request(f"Invalid cursor: {str(e)}")
+            query = query.filter(keyset_filter(sort_column, ExecutiveOrder.id, value, last_id, sort_order))
+        
+        # Apply sorting, with id as a tie-breaker so page boundaries are stable
+        order_columns = [sort_column] if sort_field == 'id' else [sort_column, ExecutiveOrder.id]
+        if sort_order == 'asc':
+            query = query.order_by(*order_columns)
         else:
-            query = query.order_by(desc(getattr(ExecutiveOrder, sort_field)))
+            query = query.order_by(*[desc(column) for column in order_columns])
         
-        # Execute query with pagination
-        total = query.count()
-        items = query.limit(per_page).offset((page - 1) * per_page).all()
+        # Select plain column rows rather than ORM instances; the JSON provider serializes dates.
+        # Sparse fieldsets narrow the SELECT, keeping id and the sort field for the cursor.
+        selected_fields = fields and fields + [field for field in ('id', sort_field) if field not in fields]
+        query = query.with_entities(*ExecutiveOrder.serialized_columns(selected_fields))
+        
+        # Fetch one extra row to learn whether another page follows
+        if use_cursor:
+            rows = query.limit(per_page + 1).all()
+        else:
+            rows = query.limit(per_page + 1).offset((page - 1) * per_page).all()
+        
+        items = rows[:per_page]
+        has_more = len(rows) > per_page
+        
+        next_cursor = None
+        if has_more and items:
+            last = items[-1]
+            next_cursor = encode_cursor(sort_field, sort_order, getattr(last, sort_field), last.id)
         
         # Format results
-        results = [eo.to_dict() for eo in items]
+        results = [ExecutiveOrder.row_to_dict(row, fields) for row in items]
         
-        # Return paginated response
-        return paginated_response(results, page, per_page, total)
+        # Return paginated response (keyset pages have no absolute page number)
+        return paginated_response(results, None if use_cursor else page, per_page, total, next_cursor=next_cursor)
     
     except Exception as e:
         logger.error(f"Error retrieving executive orders: {str(e)}")
         return server_error(f"An error occurred while retrieving executive orders: {str(e)}")
 
+@bp.route('/executive-orders/search', methods=['GET'])
+@cached_view(params=('q', 'page', 'per_page', 'president', 'year', 'fields'))
+def search_executive_orders_route():
+    """Full-text search over executive order titles and summaries, best matches first."""
+    try:
+        text = (request.args.get('q') or '').strip()
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        president = request.args.get('president')
+        year = request.args.get('year', type=int)
+        
+        if not text:
+            return bad_request("Missing search query. Provide it as the 'q' parameter")
+        
+        if page < 1:
+            page = 1
+        if per_page < 1 or per_page > 100:
+            per_page = 20
+        
+        if year and not 1 <= year < 9999:
+            return bad_request("Invalid year. Must be between 1 and 9998")
+        
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        if current_app.config.get('SEARCH_BACKEND') == 'memory':
+            # Answered from the in-process index; the database is only read to sync it after ingest
+            total, documents = get_search_index().search(
+                text, president, year, limit=per_page, offset=(page - 1) * per_page
+            )
+            results = [{field: document[field] for field in fields} if fields else document for document in documents]
+            return paginated_response(results, page, per_page, total)
+        
+        query, rank_order = search_executive_orders(_apply_filters(ExecutiveOrder.query, president, year), text)
+        
+        total = count_executive_orders(query, {'q': text, 'president': president, 'year': year})
+        
+        rows = query \
+            .order_by(*rank_order) \
+            .with_entities(*ExecutiveOrder.serialized_columns(fields)) \
+            .limit(per_page) \
+            .offset((page - 1) * per_page) \
+            .all()
+        
+        results = [ExecutiveOrder.row_to_dict(row) for row in rows]
+        
+        return paginated_response(results, page, per_page, total)
+    
+    except Exception as e:
+        logger.error(f"Error searching executive orders: {str(e)}")
+        return server_error(f"An error occurred while searching executive orders: {str(e)}")
+
+@bp.route('/executive-orders/stats', methods=['GET'])
+@cached_view(params=())
+def get_executive_order_stats_route():
+    """Get executive order counts by president, year and month."""
+    try:
+        return success_response(data=get_executive_order_stats())
+    
+    except Exception as e:
+        logger.error(f"Error retrieving executive order stats: {str(e)}")
+        return server_error(f"An error occurred while retrieving executive order stats: {str(e)}")
+
+@bp.route('/executive-orders/timeline', methods=['GET'])
+@cached_view(params=('start', 'end', 'buckets', 'level'))
+def get_executive_order_timeline():
+    """Get executive orders clustered into date buckets for the timeline."""
+    try:
+        max_buckets = request.args.get('buckets', 100, type=int)
+        level = request.args.get('level')
+        
+        if max_buckets < 1 or max_buckets > 1000:
+            return bad_request("Invalid buckets. Must be between 1 and 1000")
+        
+        if level is not None and level not in TIMELINE_LEVELS:
+            return bad_request(f"Invalid level. Valid options are: {', '.join(TIMELINE_LEVELS)}")
+        
+        try:
+            start = date.fromisoformat(request.args['start']) if request.args.get('start') else None
+            end = date.fromisoformat(request.args['end']) if request.args.get('end') else None
+        except ValueError:
+            return bad_request("Invalid date. Use YYYY-MM-DD")
+        
+        if start and end and start > end:
+            return bad_request("Invalid date range. start must not be after end")
+        
+        timeline = get_timeline_index()
+        start = start or timeline.first_date
+        end = end or timeline.last_date
+        
+        if start is None or end is None:
+            # Empty archive
+            return success_response(data={'level': level or TIMELINE_LEVELS[0], 'start': None, 'end': None, 'buckets': []})
+        
+        if level is None:
+            level = choose_level(start, end, max_buckets)
+        elif bucket_span(level, start, end) > max_buckets:
+            # An explicit level must respect the bucket limit too
+            return bad_request(
+                f"Level '{level}' needs {bucket_span(level, start, end)} buckets for this range, more than buckets={max_buckets}. "
+                "Narrow the range or choose a coarser level"
+            )
+        
+        return success_response(data={
+            'level': level,
+            'start': start.isoformat(),
+            'end': end.isoformat(),
+            'buckets': timeline.lookup(level, start, end)
+        })
+    
+    except Exception as e:
+        logger.error(f"Error retrieving executive order timeline: {str(e)}")
+        return server_error(f"An error occurred while retrieving the executive order timeline: {str(e)}")
+
+@bp.route('/executive-orders/batch', methods=['GET'])
+@cached_view(params=('ids', 'fields'))
+def get_executive_orders_batch():
+    """Get many executive orders by ID in one request (comma-separated or repeated `ids`)."""
+    try:
+        ids = [eo_id for value in request.args.getlist('ids') for eo_id in value.split(',')]
+        return _batch_response(ids)
+    
+    except Exception as e:
+        logger.error(f"Error retrieving executive orders batch: {str(e)}")
+        return server_error(f"An error occurred while retrieving executive orders: {str(e)}")
+
+@bp.route('/executive-orders/batch', methods=['POST'])
+def post_executive_orders_batch():
+    """Get many executive orders by ID, with the IDs in a JSON body: {"ids": [...]}."""
+    try:
+        payload = request.get_json(silent=True)
+        ids = payload.get('ids') if isinstance(payload, dict) else None
+        
+        if not isinstance(ids, list) or not all(isinstance(eo_id, str) for eo_id in ids):
+            return bad_request("Invalid body. Expected a JSON object with an 'ids' list of strings")
+        
+        return _batch_response(ids)
+    
+    except Exception as e:
+        logger.error(f"Error retrieving executive orders batch: {str(e)}")
+        return server_error(f"An error occurred while retrieving executive orders: {str(e)}")
+
+@bp.route('/executive-orders/export', methods=['GET'])
+def export_executive_orders_route():
+    """Stream the filtered archive as NDJSON, CSV or Parquet."""
+    try:
+        export_format = request.args.get('format', 'ndjson').lower()
+        president = request.args.get('president')
+        year = request.args.get('year', type=int)
+        
+        if export_format not in available_formats():
+            return bad_request(f"Invalid format. Valid options are: {', '.join(available_formats())}")
+        
+        if year and not 1 <= year < 9999:
+            return bad_request("Invalid year. Must be between 1 and 9998")
+        
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        query = _apply_filters(ExecutiveOrder.query, president, year) \
+            .order_by(ExecutiveOrder.issuance_date, ExecutiveOrder.id)
+        
+        mimetype, extension = EXPORT_FORMATS[export_format]
+        response = Response(
+            stream_with_context(export_executive_orders(query, export_format, fields)),
+            mimetype=mimetype
+        )
+        response.headers['Content-Disposition'] = f'attachment; filename="executive-orders.{extension}"'
+        return response
+    
+    except Exception as e:
+        logger.error(f"Error exporting executive orders: {str(e)}")
+        return server_error(f"An error occurred while exporting executive orders: {str(e)}")
+
+@bp.route('/executive-orders/changes', methods=['GET'])
+def get_executive_order_changes():
+    """Get orders written or deleted since a watermark, for mirrors to sync incrementally."""
+    try:
+        since = request.args.get('since') or None
+        limit = request.args.get('limit', 100, type=int)
+        
+        if limit < 1 or limit > 1000:
+            limit = 100
+        
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        try:
+            changes = get_changes(since, limit, fields)
+        except ValueError as e:
+            return bad_request(f"Invalid since token: {str(e)}")
+        
+        return success_response(data=changes)
+    
+    except Exception as e:
+        logger.error(f"Error retrieving executive order changes: {str(e)}")
+        return server_error(f"An error occurred while retrieving executive order changes: {str(e)}")
+
 @bp.route('/executive-orders/<string:eo_id>', methods=['GET'])
+@cached_view(params=('fields',))
 def get_executive_order(eo_id):
     """Get a single executive order by ID."""
     try:
-        executive_order = ExecutiveOrder.query.get(eo_id)
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        executive_order = ExecutiveOrder.query \
+            .with_entities(*ExecutiveOrder.serialized_columns(fields)) \
+            .filter(ExecutiveOrder.id == eo_id) \
+            .first()
         
         if not executive_order:
             return not_found(f"Executive order with ID '{eo_id}' not found")
         
-        return success_response(data=executive_order.to_dict())
+        return success_response(data=ExecutiveOrder.row_to_dict(executive_order))
     
     except Exception as e:
         logger.error(f"Error retrieving executive order {eo_id}: {str(e)}")
         return server_error(f"An error occurred while retrieving the executive order: {str(e)}")
 
+@bp.route('/executive-orders/<string:eo_id>/related', methods=['GET'])
+@cached_view(params=('limit', 'fields'))
+def get_related_executive_orders(eo_id):
+    """Get the executive orders most related to one, from the precomputed neighbor table."""
+    try:
+        limit = request.args.get('limit', 10, type=int)
+        
+        if limit < 1 or limit > 100:
+            limit = 10
+        
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
+        # One read of the (eo_id, rank) primary key, joined to the neighbors' rows
+        rows = db.session.query(ExecutiveOrderNeighbor) \
+            .join(ExecutiveOrder, ExecutiveOrder.id == ExecutiveOrderNeighbor.neighbor_id) \
+            .filter(ExecutiveOrderNeighbor.eo_id == eo_id) \
+            .order_by(ExecutiveOrderNeighbor.rank) \
+            .with_entities(*ExecutiveOrder.serialized_columns(fields), ExecutiveOrderNeighbor.score) \
+            .limit(limit) \
+            .all()
+        
+        if not rows and not db.session.query(ExecutiveOrder.query.filter(ExecutiveOrder.id == eo_id).exists()).scalar():
+            return not_found(f"Executive order with ID '{eo_id}' not found")
+        
+        results = [ExecutiveOrder.row_to_dict(row, fields and fields + ['score']) for row in rows]
+        
+        return success_response(data=results)
+    
+    except Exception as e:
+        logger.error(f"Error retrieving orders related to {eo_id}: {str(e)}")
+        return server_error(f"An error occurred while retrieving related executive orders: {str(e)}")
+
 @bp.route('/latest-executive-orders', methods=['GET'])
+@cached_view(params=('limit', 'fields'))
 def get_latest_executive_orders():
     """Get the latest executive orders."""
     try:
@@ -85,12 +462,18 @@ def get_latest_executive_orders():
         if limit < 1 or limit > 100:
             limit = 10
         
+        try:
+            fields = _parse_fields(request.args.get('fields'))
+        except ValueError as e:
+            return bad_request(str(e))
+        
         latest_orders = ExecutiveOrder.query \
+            .with_entities(*ExecutiveOrder.serialized_columns(fields)) \
             .order_by(desc(ExecutiveOrder.issuance_date)) \
             .limit(limit) \
             .all()
         
-        results = [eo.to_dict() for eo in latest_orders]
+        results = [ExecutiveOrder.row_to_dict(row) for row in latest_orders]
         
         return success_response(data=results)
     
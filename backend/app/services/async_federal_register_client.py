@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import random
+
+import aiohttp
+
+from app.services.federal_register_client import (
+    FederalRegisterAPIError,
+    FederalRegisterClient,
+    build_executive_orders_params,
+    build_executive_order_number_params,
+    build_search_params,
+    first_result,
+    format_error_message,
+)
+from app.services.rate_limiter import get_default_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+class AsyncFederalRegisterClient:
+    """
+    Asyncio client for the Federal Register API.
+
+    Mirrors FederalRegisterClient, but requests share a pooled aiohttp session and
+    backoff sleeps yield to the event loop, so many lookups can run concurrently
+    from one process. Use as an async context manager, or call close() when done.
+    """
+
+    BASE_URL = FederalRegisterClient.BASE_URL
+
+    def __init__(self, base_url=None, max_connections=100, max_connections_per_host=10, timeout=30, rate_limiter=None):
+        """
+        Args:
+            base_url (str, optional): API base URL. Defaults to the public Federal Register API.
+            max_connections (int): Size of the connection pool
+            max_connections_per_host (int): Maximum concurrent connections to one host
+            timeout (int): Total timeout per request in seconds
+            rate_limiter (TokenBucket, optional): Limiter consulted before every request.
+                Defaults to the shared limiter configured by FEDERAL_REGISTER_RATE_LIMIT.
+        """
+        self.base_url = base_url or self.BASE_URL
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @property
+    def session(self):
+        """The pooled aiohttp session, created on first use inside the running loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'Accept': 'application/json',
+                    'User-Agent': 'ExecutiveOrdersArchive/1.0'
+                }
+            )
+        return self._session
+
+    async def close(self):
+        """Close the session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _wait_for_rate_limit(self):
+        """Reserve a request from the limiter and sleep without blocking the loop."""
+        if self.rate_limiter:
+            # The Redis backend does network I/O, so reserve off the event loop
+            wait = await asyncio.to_thread(self.rate_limiter.reserve)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _make_request(self, endpoint, method='GET', params=None, data=None, retry_count=3, retry_delay=1):
+        """Make a request to the Federal Register API with non-blocking retry logic."""
+        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+        for attempt in range(retry_count + 1):
+            try:
+                await self._wait_for_rate_limit()
+                logger.info(f"Making {method} request to {url} (attempt {attempt + 1})")
+
+                delay = None
+                async with self.session.request(method, url, params=params, json=data) as response:
+                    logger.info(f"Received response: {response.status}")
+                    body = await response.read()
+
+                    # Check for rate limiting
+                    if response.status == 429:
+                        delay = int(response.headers.get('Retry-After', 60))
+                        logger.warning(f"Rate limited. Retrying after {delay} seconds")
+
+                    # Check for other retryable errors
+                    elif response.status >= 500 and attempt < retry_count:
+                        delay = retry_delay * (2 ** attempt) + random.uniform(0, 1)
+                        logger.warning(f"Server error {response.status}. Retrying after {delay:.2f} seconds")
+
+                    # Check for successful response
+                    elif response.status in (200, 201, 204):
+                        if body:
+                            return await response.json(content_type=None)
+                        return None
+
+                    else:
+                        # Handle client errors (4xx)
+                        try:
+                            error_message = format_error_message(response.status, error_data=await response.json(content_type=None))
+                        except ValueError:
+                            error_message = format_error_message(response.status, text=body.decode('utf-8', errors='replace'))
+
+                        raise FederalRegisterAPIError(
+                            message=error_message,
+                            status_code=response.status,
+                            response=response
+                        )
+
+                # Back off only after the response is released, so its pooled
+                # connection can serve other requests in the meantime
+                await asyncio.sleep(delay)
+                continue
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < retry_count:
+                    backoff = retry_delay * (2 ** attempt) + random.uniform(0, 1)
+                    logger.warning(f"Request failed: {str(e)}. Retrying after {backoff:.2f} seconds")
+                    await asyncio.sleep(backoff)
+                    continue
+                raise FederalRegisterAPIError(f"Request failed after {retry_count} retries: {str(e)}")
+
+        # This should not be reached, but just in case
+        raise FederalRegisterAPIError(f"Max retries exceeded for {url}")
+
+    async def get_executive_orders(self, page=1, per_page=20, president=None, year=None, start_date=None, end_date=None):
+        """
+        Fetch executive orders from the Federal Register API.
+
+        Args:
+            page (int): Page number for pagination
+            per_page (int): Number of results per page
+            president (str): Filter by president name
+            year (int): Filter by year of issuance
+            start_date (str): Filter by start date (YYYY-MM-DD)
+            end_date (str): Filter by end date (YYYY-MM-DD)
+
+        Returns:
+            dict: API response containing executive orders
+        """
+        params = build_executive_orders_params(page, per_page, president, year, start_date, end_date)
+
+        return await self._make_request('documents', params=params)
+
+    async def get_executive_order_by_number(self, executive_order_number):
+        """
+        Fetch a specific executive order by its number.
+
+        Args:
+            executive_order_number (str): Executive order number (e.g., '13985')
+
+        Returns:
+            dict: API response containing the executive order details, or None if not found
+        """
+        params = build_executive_order_number_params(executive_order_number)
+
+        response = await self._make_request('documents', params=params)
+
+        return first_result(response)
+
+    async def get_executive_orders_by_numbers(self, executive_order_numbers):
+        """
+        Fetch many executive orders by number concurrently.
+
+        Concurrency is bounded by the connection pool's per-host limit.
+
+        Args:
+            executive_order_numbers (list): Executive order numbers
+
+        Returns:
+            dict: Mapping of number to document (None if not found). Numbers whose
+                lookup failed map to the FederalRegisterAPIError raised for them.
+        """
+        results = await asyncio.gather(
+            *(self.get_executive_order_by_number(number) for number in executive_order_numbers),
+            return_exceptions=True
+        )
+        return dict(zip(executive_order_numbers, results))
+
+    async def search_executive_orders(self, query, page=1, per_page=20):
+        """
+        Search for executive orders containing the specified query.
+
+        Args:
+            query (str): Search query
+            page (int): Page number for pagination
+            per_page (int): Number of results per page
+
+        Returns:
+            dict: API response containing matching executive orders
+        """
+        params = build_search_params(query, page, per_page)
+
+        return await self._make_request('documents', params=params)
@@ -0,0 +1,235 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from flask import current_app, has_app_context
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database import db
+from app.models.dataset_version import DatasetVersion
+
+logger = logging.getLogger(__name__)
+
+# The dataset version lives in a single row of the dataset_version table
+DATASET_VERSION_ROW_ID = 1
+
+# Seconds each process reuses the version it last read, so cache hits and 304s
+# skip the database; bumps from other processes are seen within this long
+DATASET_VERSION_TTL = float(os.environ.get('DATASET_VERSION_TTL', 1))
+
+class MemoryCache:
+    """
+    Thread-safe in-process LRU cache with per-entry expiry.
+
+    Counters created by incr() are kept apart from the LRU entries, so they
+    never expire and are never evicted.
+    """
+
+    def __init__(self, max_entries=1024, default_timeout=300):
+        self.max_entries = max_entries
+        self.default_timeout = default_timeout
+        self._entries = OrderedDict()
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key in self._counters:
+                return self._counters[key]
+
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout=None):
+        timeout = self.default_timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+
+        with self._lock:
+            self._counters.pop(key, None)
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._counters.pop(key, None)
+
+    def incr(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            value = self._counters.get(key, entry[0] if entry else 0) + 1
+            self._counters[key] = value
+            return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+class RedisCache:
+    """Redis-backed cache shared by every web and Celery worker process."""
+
+    def __init__(self, url, default_timeout=300, key_prefix='eo-archive:'):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.default_timeout = default_timeout
+        self.key_prefix = key_prefix
+
+    def _key(self, key):
+        return f"{self.key_prefix}{key}"
+
+    def get(self, key):
+        try:
+            raw = self.client.get(self._key(key))
+        except Exception as e:
+            # A cache outage should degrade to a miss, never fail the request
+            logger.warning(f"Cache get failed for {key}: {str(e)}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key, value, timeout=None):
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            if timeout:
+                self.client.setex(self._key(key), int(timeout), json.dumps(value))
+            else:
+                self.client.set(self._key(key), json.dumps(value))
+        except Exception as e:
+            logger.warning(f"Cache set failed for {key}: {str(e)}")
+
+    def delete(self, key):
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache delete failed for {key}: {str(e)}")
+
+    def incr(self, key):
+        try:
+            return self.client.incr(self._key(key))
+        except Exception as e:
+            logger.warning(f"Cache incr failed for {key}: {str(e)}")
+            return None
+
+    def clear(self):
+        try:
+            keys = list(self.client.scan_iter(f"{self.key_prefix}*"))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Cache clear failed: {str(e)}")
+
+def create_cache(backend='memory', redis_url=None, default_timeout=300, max_entries=1024):
+    """
+    Create a cache backend.
+
+    Args:
+        backend (str): 'memory' for a per-process LRU or 'redis' for a shared cache
+        redis_url (str, optional): Redis URL, used when backend is 'redis'
+        default_timeout (int): Default entry lifetime in seconds
+        max_entries (int): Maximum number of entries kept by the memory backend
+
+    Returns:
+        MemoryCache or RedisCache: Configured cache backend
+    """
+    if backend == 'redis':
+        return RedisCache(redis_url, default_timeout=default_timeout)
+    return MemoryCache(max_entries=max_entries, default_timeout=default_timeout)
+
+def init_cache(app):
+    """Initialize the cache backend for the Flask app."""
+    app.extensions['eo_cache'] = create_cache(
+        backend=app.config.get('CACHE_BACKEND', 'memory'),
+        redis_url=app.config.get('CACHE_REDIS_URL'),
+        default_timeout=app.config.get('CACHE_DEFAULT_TIMEOUT', 300),
+        max_entries=app.config.get('CACHE_MAX_ENTRIES', 1024)
+    )
+
+_default_cache = None
+
+def get_cache():
+    """
+    Get the active cache backend.
+
+    Inside an app context this is the app's cache. Outside one (e.g. a bare Celery
+    worker) a process-wide cache is built from the environment, mirroring celery_app.
+    """
+    global _default_cache
+
+    if has_app_context() and 'eo_cache' in current_app.extensions:
+        return current_app.extensions['eo_cache']
+
+    if _default_cache is None:
+        _default_cache = create_cache(
+            backend=os.environ.get('CACHE_BACKEND', 'memory'),
+            redis_url=os.environ.get('CACHE_REDIS_URL', os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0'))
+        )
+    return _default_cache
+
+def _remember_dataset_version(version):
+    current_app.extensions['eo_dataset_version'] = (version, time.monotonic())
+    return version
+
+def get_dataset_version():
+    """
+    Return the current dataset version used to namespace cached query results.
+
+    The version is read from the database, so a bump committed by a Celery
+    worker or scripts/fetch_data.py reaches every web process whichever cache
+    backend is configured. Each process reuses the last value it read for
+    DATASET_VERSION_TTL seconds, so most requests do not query it at all.
+    """
+    remembered = current_app.extensions.get('eo_dataset_version')
+    if remembered and time.monotonic() - remembered[1] < DATASET_VERSION_TTL:
+        return remembered[0]
+
+    version = db.session.execute(
+        select(DatasetVersion.version).where(DatasetVersion.id == DATASET_VERSION_ROW_ID)
+    ).scalar()
+    return _remember_dataset_version(version or 0)
+
+def bump_dataset_version():
+    """
+    Invalidate every cached query result by moving to a new dataset version.
+
+    The increment is a single UPDATE, so concurrent bumps from several
+    processes never hand out the same version. Commits the session.
+    """
+    now = datetime.utcnow()
+    increment = update(DatasetVersion) \
+        .where(DatasetVersion.id == DATASET_VERSION_ROW_ID) \
+        .values(version=DatasetVersion.version + 1, updated_at=now)
+
+    if db.session.execute(increment).rowcount == 0:
+        # Databases created with create_all() start without the row; the migration seeds it
+        try:
+            db.session.execute(insert(DatasetVersion).values(id=DATASET_VERSION_ROW_ID, version=1, updated_at=now))
+        except IntegrityError:
+            # Another process created it first
+            db.session.rollback()
+            db.session.execute(increment)
+    db.session.commit()
+
+    # This process sees its own bump at once
+    version = db.session.execute(
+        select(DatasetVersion.version).where(DatasetVersion.id == DATASET_VERSION_ROW_ID)
+    ).scalar()
+    _remember_dataset_version(version)
+    logger.info(f"Dataset version bumped to {version}")
+    return version
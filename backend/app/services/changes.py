@@ -0,0 +1,88 @@
+import logging
+import os
+from datetime import datetime, timedelta
+
+from app.models.executive_order import ExecutiveOrder
+from app.models.executive_order_tombstone import ExecutiveOrderTombstone
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_filter
+
+logger = logging.getLogger(__name__)
+
+# Changes younger than this are held back, so a write stamped earlier but committed
+# later (e.g. a long ingest page) cannot land behind a watermark already handed out
+CHANGES_SETTLE_SECONDS = int(os.environ.get('CHANGES_SETTLE_SECONDS', 30))
+
+def encode_since(changed_at, eo_id):
+    """Encode the position after a change as an opaque `since` token."""
+    return encode_cursor('updated_at', 'asc', changed_at, eo_id)
+
+def decode_since(token):
+    """
+    Decode a `since` token.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    return decode_cursor(token, 'updated_at', 'asc')
+
+def get_changes(since=None, limit=100, fields=None, now=None):
+    """
+    Return executive orders written or deleted after a watermark, oldest first.
+
+    Updates come from the (updated_at, id) index on executive_orders and
+    deletions from executive_order_tombstones; both are read by keyset from
+    the watermark and merged on (changed_at, id).
+
+    Args:
+        since (str, optional): Token from a previous call's next_since; None starts from the beginning
+        limit (int): Maximum number of changes to return
+        fields (list, optional): Fields to include in each order's data
+        now (datetime, optional): Current UTC time, for tests
+
+    Returns:
+        dict: 'items' (changes with op 'upsert' and the order's data, or op 'delete'),
+            'next_since' (token to pass next time) and 'has_more'
+
+    Raises:
+        ValueError: If since is malformed
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(seconds=CHANGES_SETTLE_SECONDS)
+    position = decode_since(since) if since else None
+
+    selected_fields = fields and fields + [field for field in ('id', 'updated_at') if field not in fields]
+    updates = ExecutiveOrder.query \
+        .with_entities(*ExecutiveOrder.serialized_columns(selected_fields)) \
+        .filter(ExecutiveOrder.updated_at < cutoff)
+    deletes = ExecutiveOrderTombstone.query \
+        .with_entities(ExecutiveOrderTombstone.id, ExecutiveOrderTombstone.deleted_at) \
+        .filter(ExecutiveOrderTombstone.deleted_at < cutoff)
+
+    if position:
+        value, last_id = position
+        updates = updates.filter(keyset_filter(ExecutiveOrder.updated_at, ExecutiveOrder.id, value, last_id, 'asc'))
+        deletes = deletes.filter(keyset_filter(ExecutiveOrderTombstone.deleted_at, ExecutiveOrderTombstone.id, value, last_id, 'asc'))
+
+    # Each source contributes at most limit + 1 rows, enough to fill the page and detect more
+    changes = [
+        (row.updated_at, row.id, 'upsert', row)
+        for row in updates.order_by(ExecutiveOrder.updated_at, ExecutiveOrder.id).limit(limit + 1)
+    ] + [
+        (row.deleted_at, row.id, 'delete', row)
+        for row in deletes.order_by(ExecutiveOrderTombstone.deleted_at, ExecutiveOrderTombstone.id).limit(limit + 1)
+    ]
+    changes.sort(key=lambda change: (change[0], change[1], change[2]))
+
+    page = changes[:limit]
+    items = []
+    for changed_at, eo_id, op, row in page:
+        item = {'op': op, 'id': eo_id, 'changed_at': changed_at}
+        if op == 'upsert':
+            item['data'] = ExecutiveOrder.row_to_dict(row, fields)
+        items.append(item)
+
+    if page:
+        next_since = encode_since(page[-1][0], page[-1][1])
+    else:
+        next_since = since
+
+    return {'items': items, 'next_since': next_since, 'has_more': len(changes) > limit}
@@ -0,0 +1,79 @@
+import json
+import logging
+
+from app.database import db
+from app.services.cache import get_cache, get_dataset_version
+
+logger = logging.getLogger(__name__)
+
+COUNT_MODES = ('exact', 'estimate', 'none')
+
+def _count_key(kind, filters):
+    """Build a cache key from the dataset version and the normalized filter set."""
+    normalized = json.dumps({k: v for k, v in sorted(filters.items()) if v is not None}, separators=(',', ':'))
+    return f"count:{get_dataset_version()}:{kind}:{normalized}"
+
+def estimate_query_count(query):
+    """
+    Ask the query planner how many rows a query will return.
+
+    Only PostgreSQL exposes a usable estimate; other databases return None.
+    """
+    bind = db.session.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return None
+
+    compiled = query.statement.compile(dialect=bind.dialect)
+    # Savepoint so a failed EXPLAIN doesn't abort the request's transaction
+    with db.session.begin_nested():
+        result = db.session.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+def count_executive_orders(query, filters, mode='exact'):
+    """
+    Count the rows matched by a filtered list query, served from cache when possible.
+
+    Counts are keyed by the normalized filters and the dataset version, so they stay
+    valid until the next ingest commit bumps the version.
+
+    Args:
+        query: Filtered (unpaginated, unsorted) ExecutiveOrder query
+        filters (dict): Filter values the query was built from, e.g. president and year
+        mode (str): 'exact', 'estimate' or 'none'
+
+    Returns:
+        int or None: Row count, or None when mode is 'none'
+    """
+    if mode == 'none':
+        return None
+
+    cache = get_cache()
+    exact_key = _count_key('exact', filters)
+
+    # An exact count already paid for is always preferable to an estimate
+    total = cache.get(exact_key)
+    if total is not None:
+        return total
+
+    if mode == 'estimate':
+        estimate_key = _count_key('estimate', filters)
+        total = cache.get(estimate_key)
+        if total is not None:
+            return total
+
+        try:
+            total = estimate_query_count(query)
+        except Exception as e:
+            logger.warning(f"Count estimate failed, falling back to exact count: {str(e)}")
+            total = None
+
+        if total is not None:
+            cache.set(estimate_key, total)
+            return total
+
+    total = query.count()
+    cache.set(exact_key, total)
+    return total
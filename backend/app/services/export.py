@@ -0,0 +1,143 @@
+import csv
+import io
+import logging
+import os
+
+from flask import current_app
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - installs without pyarrow fall back to ndjson and csv
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round trip from the server-side cursor, and written per chunk (or Parquet row group)
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 1000))
+
+EXPORT_FORMATS = {
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'csv': ('text/csv', 'csv'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+def available_formats():
+    """Export formats this process can produce (Parquet needs pyarrow)."""
+    return [name for name in EXPORT_FORMATS if name != 'parquet' or pyarrow is not None]
+
+def _batches(query, batch_size):
+    """
+    Yield lists of rows from a server-side cursor.
+
+    yield_per turns on stream_results, so PostgreSQL does not buffer the whole
+    result in the client, and fetches batch_size rows at a time.
+    """
+    result = db.session.execute(query.statement.execution_options(yield_per=batch_size))
+    yield from result.partitions()
+
+def _ndjson(query, fields, batch_size):
+    dumps = current_app.json.dumps
+    for batch in _batches(query, batch_size):
+        yield ''.join(dumps(ExecutiveOrder.row_to_dict(row, fields)) + '\n' for row in batch).encode('utf-8')
+
+def _csv(query, fields, batch_size):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    yield buffer.getvalue().encode('utf-8')
+
+    for batch in _batches(query, batch_size):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in batch:
+            values = row._asdict()
+            writer.writerow([
+                value.isoformat() if hasattr(value, 'isoformat') else value
+                for value in (values[field] for field in fields)
+            ])
+        yield buffer.getvalue().encode('utf-8')
+
+class _DrainBuffer(io.RawIOBase):
+    """Write-only sink whose contents are taken after each Parquet row group."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def _parquet_schema(fields):
+    column_types = {
+        'id': pyarrow.string(),
+        'title': pyarrow.string(),
+        'issuance_date': pyarrow.date32(),
+        'president': pyarrow.string(),
+        'federal_register_citation': pyarrow.string(),
+        'url': pyarrow.string(),
+        'plain_language_summary': pyarrow.string(),
+        'created_at': pyarrow.timestamp('us'),
+        'updated_at': pyarrow.timestamp('us'),
+    }
+    return pyarrow.schema([(field, column_types[field]) for field in fields])
+
+def _parquet(query, fields, batch_size):
+    schema = _parquet_schema(fields)
+    sink = _DrainBuffer()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema, compression='zstd')
+    try:
+        # One row group per batch, sent as soon as it is written
+        for batch in _batches(query, batch_size):
+            columns = {field: [getattr(row, field) for row in batch] for field in fields}
+            writer.write_table(pyarrow.Table.from_pydict(columns, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+_WRITERS = {
+    'ndjson': _ndjson,
+    'csv': _csv,
+    'parquet': _parquet,
+}
+
+def export_executive_orders(query, export_format, fields=None, batch_size=None):
+    """
+    Stream an ExecutiveOrder query as NDJSON, CSV or Parquet.
+
+    Rows are read from a server-side cursor and encoded a batch at a time, so
+    memory use does not grow with the archive and the first chunk is sent as
+    soon as the first batch is read.
+
+    Args:
+        query: Filtered ExecutiveOrder query (ordering is the caller's choice)
+        export_format (str): One of available_formats()
+        fields (list, optional): Columns to export. Defaults to every serialized field.
+        batch_size (int, optional): Rows per batch. Defaults to EXPORT_BATCH_SIZE.
+
+    Returns:
+        generator: Chunks of encoded bytes
+    """
+    if export_format not in available_formats():
+        raise ValueError(f"Invalid format. Valid options are: {', '.join(available_formats())}")
+
+    fields = list(fields or ExecutiveOrder.SERIALIZED_FIELDS)
+    query = query.with_entities(*ExecutiveOrder.serialized_columns(fields))
+    return _WRITERS[export_format](query, fields, batch_size or EXPORT_BATCH_SIZE)
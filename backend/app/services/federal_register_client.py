@@ -5,6 +5,10 @@ import random
 import re
 from datetime import datetime
 
+from app.services.rate_limiter import get_default_rate_limiter
+from app.services.response_cache import get_default_response_cache
+from app.services.streamed_response import StreamedPage, TeeReader
+
 logger = logging.getLogger(__name__)
 
 class APIError(Exception):
@@ -19,25 +23,174 @@ class FederalRegisterAPIError(APIError):
         self.response = response
         super().__init__(self.message)
 
+class NotModifiedResponse(dict):
+    """
+    Listing response the API reported unchanged since it was last fetched.
+    
+    Holds only the pagination fields (count, total_pages). It has no results, so
+    ingest code skips parsing and transforming a page it has already stored.
+    """
+    not_modified = True
+
+def build_executive_orders_params(page=1, per_page=20, president=None, year=None, start_date=None, end_date=None):
+    """Build query parameters for listing executive orders."""
+    params = {
+        'page': page,
+        'per_page': per_page,
+        'order': 'newest',
+        'conditions[presidential_document_type][]': 'executive_order'
+    }
+    
+    # Add optional filters
+    if president:
+        params['conditions[president][]'] = president
+    
+    if year:
+        params['conditions[publication_date][year]'] = year
+    
+    if start_date:
+        params['conditions[publication_date][gte]'] = start_date
+    
+    if end_date:
+        params['conditions[publication_date][lte]'] = end_date
+    
+    return params
+
+def build_executive_order_number_params(executive_order_number):
+    """Build query parameters for looking up an executive order by number."""
+    return {
+        'conditions[presidential_document_type][]': 'executive_order',
+        'conditions[executive_order_number]': executive_order_number,
+    }
+
+def build_search_params(query, page=1, per_page=20):
+    """Build query parameters for a full-text executive order search."""
+    return {
+        'page': page,
+        'per_page': per_page,
+        'order': 'relevance',
+        'conditions[presidential_document_type][]': 'executive_order',
+        'conditions[term]': query
+    }
+
+def first_result(response):
+    """Return the first document of a response, or None if it has no results."""
+    if response and response.get('count', 0) > 0 and 'results' in response:
+        return response['results'][0]
+    return None
+
+def format_error_message(status_code, error_data=None, text=None):
+    """Format an error message from a failed API response."""
+    error_message = f"API Error {status_code}"
+    if isinstance(error_data, dict) and 'errors' in error_data:
+        return f"{error_message}: {error_data['errors']}"
+    if text is not None:
+        return f"{error_message}: {text}"
+    return error_message
+
 class FederalRegisterClient:
     """Client for interacting with the Federal Register API."""
     
     BASE_URL = "https://www.federalregister.gov/api/v1/"
     
-    def __init__(self, base_url=None):
+    def __init__(self, base_url=None, rate_limiter=None, response_cache=None):
+        """
+        Args:
+            base_url (str, optional): API base URL. Defaults to the public Federal Register API.
+            rate_limiter (TokenBucket, optional): Limiter consulted before every request.
+                Defaults to the shared limiter configured by FEDERAL_REGISTER_RATE_LIMIT.
+            response_cache (DiskResponseCache, optional): Cache for GET responses.
+                Defaults to the cache configured by FEDERAL_REGISTER_CACHE_DIR, if any.
+        """
         self.base_url = base_url or self.BASE_URL
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.response_cache = response_cache or get_default_response_cache()
         self.session = requests.Session()
         self.session.headers.update({
             'Accept': 'application/json',
             'User-Agent': 'ExecutiveOrdersArchive/1.0'
         })
     
-    def _make_request(self, endpoint, method='GET', params=None, data=None, retry_count=3, retry_delay=1):
-        """Make a request to the Federal Register API with retry logic."""
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+    def _url(self, endpoint):
+        return f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+    
+    def _from_cache(self, cached, if_changed, stream=False):
+        """Return a cached response, or just its summary if the caller already stored it."""
+        if if_changed and cached.confirmed:
+            return NotModifiedResponse(cached.summary)
+        if stream:
+            body = cached.open()
+            return StreamedPage(body, on_close=body.close)
+        return cached.json()
+    
+    def _stream_response(self, response, cache_key):
+        """Wrap a streamed 200 response, copying the body into the response cache as it is read."""
+        response.raw.decode_content = True
+        
+        if not cache_key:
+            return StreamedPage(response.raw, on_close=response.close)
+        
+        tee = TeeReader(response.raw, directory=self.response_cache.directory)
+        
+        def store(fields):
+            summary = {key: fields[key] for key in ('count', 'total_pages') if key in fields}
+            self.response_cache.store_file(cache_key, tee.finish(), response.headers, summary)
+        
+        def close():
+            tee.discard()
+            response.close()
+        
+        return StreamedPage(tee, on_complete=store, on_close=close)
+    
+    def _store_response(self, cache_key, response, result):
+        """Store a successful GET response in the response cache."""
+        summary = {}
+        if isinstance(result, dict):
+            summary = {key: result[key] for key in ('count', 'total_pages') if key in result}
+        self.response_cache.set(cache_key, response.content, response.headers, summary)
+    
+    def confirm(self, endpoint, params=None):
+        """
+        Mark a cached response as stored by the caller.
+        
+        Only confirmed responses are reported as NotModifiedResponse, so a page
+        whose ingest failed or never ran is parsed again on the next fetch.
+        """
+        if self.response_cache is not None:
+            self.response_cache.confirm(self.response_cache.make_key(self._url(endpoint), params))
+    
+    def _make_request(self, endpoint, method='GET', params=None, data=None, retry_count=3, retry_delay=1, if_changed=False, stream=False):
+        """
+        Make a request to the Federal Register API with retry logic.
+        
+        GET responses go through the response cache when one is configured: fresh
+        entries are returned without a request, and stale ones are revalidated with
+        If-None-Match/If-Modified-Since. With if_changed=True, a cached or 304
+        response that the caller confirmed is returned as a NotModifiedResponse
+        instead of being parsed.
+        
+        With stream=True, a successful response is returned as a StreamedPage
+        whose results are parsed one document at a time.
+        """
+        url = self._url(endpoint)
+        
+        cache_key = None
+        cached = None
+        if self.response_cache is not None and method == 'GET':
+            cache_key = self.response_cache.make_key(url, params)
+            cached = self.response_cache.get(cache_key)
+            if cached and cached.is_fresh():
+                logger.info(f"Using cached response for {url}")
+                return self._from_cache(cached, if_changed, stream)
+        
+        headers = cached.conditional_headers() if cached else None
         
         for attempt in range(retry_count + 1):
             try:
+                # Wait for our share of the request budget instead of tripping a 429
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                
                 logger.info(f"Making {method} request to {url} (attempt {attempt + 1})")
                 
                 response = self.session.request(
@@ -45,6 +198,8 @@ class FederalRegisterClient:
                     url=url,
                     params=params,
                     json=data,
+                    headers=headers,
+                    stream=stream,
                     timeout=30  # 30 seconds timeout
                 )
                 
@@ -55,6 +210,7 @@ class FederalRegisterClient:
                 if response.status_code == 429:
                     retry_after = int(response.headers.get('Retry-After', 60))
                     logger.warning(f"Rate limited. Retrying after {retry_after} seconds")
+                    response.close()
                     time.sleep(retry_after)
                     continue
                 
@@ -64,23 +220,34 @@ class FederalRegisterClient:
                         # Calculate exponential backoff with jitter
                         backoff = retry_delay * (2 ** attempt) + random.uniform(0, 1)
                         logger.warning(f"Server error {response.status_code}. Retrying after {backoff:.2f} seconds")
+                        response.close()
                         time.sleep(backoff)
                         continue
                 
+                # Cached copy is still current
+                if response.status_code == 304 and cached:
+                    self.response_cache.refresh(cached, response.headers)
+                    response.close()
+                    return self._from_cache(cached, if_changed, stream)
+                
+                # Parse large listings incrementally
+                if stream and response.status_code == 200:
+                    return self._stream_response(response, cache_key)
+                
                 # Check for successful response
                 if response.status_code in (200, 201, 204):
                     if response.content:
-                        return response.json()
+                        result = response.json()
+                        if cache_key and response.status_code == 200:
+                            self._store_response(cache_key, response, result)
+                        return result
                     return None
                 
                 # Handle client errors (4xx)
-                error_message = f"API Error {response.status_code}"
                 try:
-                    error_data = response.json()
-                    if isinstance(error_data, dict) and 'errors' in error_data:
-                        error_message = f"{error_message}: {error_data['errors']}"
-                except:
-                    error_message = f"{error_message}: {response.text}"
+                    error_message = format_error_message(response.status_code, error_data=response.json())
+                except ValueError:
+                    error_message = format_error_message(response.status_code, text=response.text)
                 
                 raise FederalRegisterAPIError(
                     message=error_message,
@@ -99,7 +266,7 @@ class FederalRegisterClient:
         # This should not be reached, but just in case
         raise FederalRegisterAPIError(f"Max retries exceeded for {url}")
     
-    def get_executive_orders(self, page=1, per_page=20, president=None, year=None, start_date=None, end_date=None):
+    def get_executive_orders(self, page=1, per_page=20, president=None, year=None, start_date=None, end_date=None, if_changed=False, stream=False):
         """
         Fetch executive orders from the Federal Register API.
         
@@ -110,31 +277,22 @@ class FederalRegisterClient:
             year (int): Filter by year of issuance
             start_date (str): Filter by start date (YYYY-MM-DD)
             end_date (str): Filter by end date (YYYY-MM-DD)
+            if_changed (bool): Return a NotModifiedResponse if the page is unchanged
+                since it was last fetched and confirmed with confirm_executive_orders
+            stream (bool): Return a StreamedPage that parses results incrementally
             
         Returns:
             dict: API response containing executive orders
         """
-        params = {
-            'page': page,
-            'per_page': per_page,
-            'order': 'newest',
-            'conditions[presidential_document_type][]': 'executive_order'
-        }
+        params = build_executive_orders_params(page, per_page, president, year, start_date, end_date)
         
-        # Add optional filters
-        if president:
-            params['conditions[president][]'] = president
-        
-        if year:
-            params['conditions[publication_date][year]'] = year
-        
-        if start_date:
-            params['conditions[publication_date][gte]'] = start_date
-        
-        if end_date:
-            params['conditions[publication_date][lte]'] = end_date
+        return self._make_request('documents', params=params, if_changed=if_changed, stream=stream)
+    
+    def confirm_executive_orders(self, page=1, per_page=20, president=None, year=None, start_date=None, end_date=None):
+        """Mark the cached response for a get_executive_orders call as stored."""
+        params = build_executive_orders_params(page, per_page, president, year, start_date, end_date)
         
-        return self._make_request('documents', params=params)
+        self.confirm('documents', params)
     
     def get_executive_order_by_number(self, executive_order_number):
         """
@@ -146,17 +304,11 @@ class FederalRegisterClient:
         Returns:
             dict: API response containing the executive order details, or None if not found
         """
-        params = {
-            'conditions[presidential_document_type][]': 'executive_order',
-            'conditions[executive_order_number]': executive_order_number,
-        }
+        params = build_executive_order_number_params(executive_order_number)
         
         response = self._make_request('documents', params=params)
         
-        if response and response.get('count', 0) > 0 and 'results' in response:
-            return response['results'][0]
-        
-        return None
+        return first_result(response)
     
     def search_executive_orders(self, query, page=1, per_page=20):
         """
@@ -170,12 +322,6 @@ class FederalRegisterClient:
         Returns:
             dict: API response containing matching executive orders
         """
-        params = {
-            'page': page,
-            'per_page': per_page,
-            'order': 'relevance',
-            'conditions[presidential_document_type][]': 'executive_order',
-            'conditions[term]': query
-        }
+        params = build_search_params(query, page, per_page)
         
         return self._make_request('documents', params=params)
\ No newline at end of file
@@ -0,0 +1,102 @@
+import logging
+import os
+from datetime import date, datetime, timedelta
+
+from app.database import db
+from app.models.ingest_watermark import IngestWatermark
+
+logger = logging.getLogger(__name__)
+
+# Source name for executive orders listed by the Federal Register documents API
+FEDERAL_REGISTER_SOURCE = 'federal_register'
+
+# Days before the watermark re-fetched on each run, to pick up late corrections
+# and documents published on the watermark's date after the last run
+INGEST_OVERLAP_DAYS = int(os.environ.get('INGEST_OVERLAP_DAYS', 3))
+
+def observe_document(latest, document):
+    """
+    Fold a Federal Register document into the newest (publication_date, document_number) seen.
+
+    Args:
+        latest (tuple or None): Newest position so far
+        document (dict): Federal Register document
+
+    Returns:
+        tuple or None: The newer of latest and the document's position
+    """
+    try:
+        position = (
+            datetime.strptime(document['publication_date'], '%Y-%m-%d').date(),
+            document['document_number']
+        )
+    except (KeyError, TypeError, ValueError):
+        return latest
+    
+    if latest is None or position > latest:
+        return position
+    return latest
+
+def get_watermark(source=FEDERAL_REGISTER_SOURCE):
+    """Return a source's watermark, or None before its first complete run."""
+    return db.session.get(IngestWatermark, source)
+
+def incremental_start_date(source=FEDERAL_REGISTER_SOURCE, default_days_back=30, overlap_days=None):
+    """
+    Publication date the next incremental run of a source should start from.
+
+    Args:
+        source (str): Ingest source
+        default_days_back (int): Window for a source with no watermark yet
+        overlap_days (int, optional): Days re-fetched before the watermark. Defaults to INGEST_OVERLAP_DAYS.
+
+    Returns:
+        date: First publication date to fetch
+    """
+    if overlap_days is None:
+        overlap_days = INGEST_OVERLAP_DAYS
+    
+    watermark = get_watermark(source)
+    if watermark is None:
+        return datetime.utcnow().date() - timedelta(days=default_days_back)
+    return watermark.last_publication_date - timedelta(days=overlap_days)
+
+def advance_watermark(source, latest, window_start=None):
+    """
+    Move a source's watermark forward after every page of a run was stored.
+
+    The watermark never moves backwards, and is left alone when the run's
+    window started after it: the documents in between were never fetched.
+    The window start is stored with the watermark, as a record of what the
+    run that set it requested.
+
+    Args:
+        source (str): Ingest source
+        latest (tuple or None): Newest (publication_date, document_number) stored by the run
+        window_start (date or str, optional): First publication date the run fetched; None for no lower bound
+
+    Returns:
+        bool: Whether the watermark moved
+    """
+    if latest is None:
+        return False
+    
+    if isinstance(window_start, str):
+        window_start = date.fromisoformat(window_start)
+    
+    watermark = get_watermark(source)
+    if watermark is not None:
+        if window_start is not None and window_start > watermark.last_publication_date:
+            logger.warning(f"Not advancing {source} watermark: run started at {window_start}, after the watermark {watermark.last_publication_date}")
+            return False
+        if latest <= (watermark.last_publication_date, watermark.last_document_number):
+            return False
+    else:
+        watermark = IngestWatermark(source=source)
+        db.session.add(watermark)
+    
+    watermark.last_publication_date, watermark.last_document_number = latest
+    watermark.last_window_start = window_start
+    db.session.commit()
+    logger.info(f"Advanced {source} watermark to {latest[0]} ({latest[1]})")
+    return True
@@ -0,0 +1,372 @@
+import json
+import logging
+import math
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from datetime import date, datetime, timedelta
+
+from flask import current_app
+
+from app.models.executive_order import ExecutiveOrder
+from app.services.cache import get_dataset_version
+
+logger = logging.getLogger(__name__)
+
+SEARCH_BACKENDS = ('database', 'memory')
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A title word counts this many times towards its term frequency, so title matches outrank summary matches
+TITLE_WEIGHT = 2
+
+# Deleted documents are purged from the posting lists once they make up this share of the index
+COMPACT_RATIO = 0.25
+
+# Seconds before the index's watermark that a sync re-reads, so an order stamped
+# earlier but committed after a newer one is not skipped
+SEARCH_INDEX_SYNC_OVERLAP_SECONDS = int(os.environ.get('SEARCH_INDEX_SYNC_OVERLAP_SECONDS', 60))
+
+SNAPSHOT_MAGIC = b'EOINDEX1'
+
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+    'of', 'on', 'or', 'that', 'the', 'their', 'to', 'with',
+))
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+def tokenize(text):
+    """Split text into lowercase words, dropping stopwords."""
+    if not text:
+        return []
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+def _to_document(row):
+    """Serialize a row selected with ExecutiveOrder.serialized_columns(), with ISO 8601 dates."""
+    return {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in ExecutiveOrder.row_to_dict(row).items()
+    }
+
+class InvertedIndex:
+    """
+    In-memory BM25 index over executive order titles and summaries.
+
+    Each term maps to two parallel arrays, one of document numbers (ascending)
+    and one of term frequencies, so a posting costs five bytes instead of a
+    Python object per entry. Documents keep their serialized form, so search
+    results are served without touching the database.
+
+    Re-adding an order appends a new document and marks the old one deleted;
+    deleted documents are purged from the posting lists once they make up
+    COMPACT_RATIO of the index. Reads and writes are serialized by `lock`.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.clear()
+
+    def clear(self):
+        with self.lock:
+            self.documents = []         # document number -> serialized order, None once deleted
+            self.doc_lengths = array('I')
+            self.doc_numbers = {}       # order id -> live document number
+            self.postings = {}          # term -> (array('I') document numbers, array('B') frequencies)
+            self.total_length = 0
+            self.deleted = 0
+            # Newest updated_at indexed, and the dataset version the index was last synced to
+            self.watermark = None
+            self.dataset_version = None
+
+    def __len__(self):
+        return len(self.doc_numbers)
+
+    def add(self, document):
+        """Index a serialized order, replacing any earlier version of it."""
+        counts = {}
+        for token in tokenize(document.get('title')):
+            counts[token] = counts.get(token, 0) + TITLE_WEIGHT
+        for token in tokenize(document.get('plain_language_summary')):
+            counts[token] = counts.get(token, 0) + 1
+
+        with self.lock:
+            self._remove(document['id'])
+
+            doc_number = len(self.documents)
+            for term, frequency in counts.items():
+                postings = self.postings.get(term)
+                if postings is None:
+                    postings = self.postings[term] = (array('I'), array('B'))
+                postings[0].append(doc_number)
+                postings[1].append(min(frequency, 255))
+
+            length = sum(counts.values())
+            self.documents.append(document)
+            self.doc_lengths.append(length)
+            self.doc_numbers[document['id']] = doc_number
+            self.total_length += length
+
+            updated_at = document.get('updated_at')
+            if updated_at and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+            self._maybe_compact()
+
+    def remove(self, eo_id):
+        """Drop an order from the index, if present."""
+        with self.lock:
+            self._remove(eo_id)
+            self._maybe_compact()
+
+    def _remove(self, eo_id):
+        doc_number = self.doc_numbers.pop(eo_id, None)
+        if doc_number is None:
+            return
+        self.documents[doc_number] = None
+        self.total_length -= self.doc_lengths[doc_number]
+        self.deleted += 1
+
+    def _maybe_compact(self):
+        if self.deleted and self.deleted >= COMPACT_RATIO * len(self.documents):
+            self.compact()
+
+    def compact(self):
+        """Purge deleted documents and renumber the rest."""
+        with self.lock:
+            renumbered = {}
+            documents = []
+            doc_lengths = array('I')
+            for doc_number, document in enumerate(self.documents):
+                if document is not None:
+                    renumbered[doc_number] = len(documents)
+                    documents.append(document)
+                    doc_lengths.append(self.doc_lengths[doc_number])
+
+            postings = {}
+            for term, (doc_numbers, frequencies) in self.postings.items():
+                kept_numbers, kept_frequencies = array('I'), array('B')
+                for doc_number, frequency in zip(doc_numbers, frequencies):
+                    new_number = renumbered.get(doc_number)
+                    if new_number is not None:
+                        kept_numbers.append(new_number)
+                        kept_frequencies.append(frequency)
+                if kept_numbers:
+                    postings[term] = (kept_numbers, kept_frequencies)
+
+            self.documents = documents
+            self.doc_lengths = doc_lengths
+            self.doc_numbers = {document['id']: doc_number for doc_number, document in enumerate(documents)}
+            self.postings = postings
+            self.deleted = 0
+
+    def search(self, text, president=None, year=None, limit=20, offset=0):
+        """
+        Find orders containing every word of `text`, best BM25 score first.
+
+        Ties are ordered by newest issuance date, then id, as in the database search.
+
+        Returns:
+            tuple: (total number of matches, serialized orders for the requested slice)
+        """
+        terms = list(dict.fromkeys(tokenize(text)))
+        if not terms:
+            return 0, []
+
+        with self.lock:
+            term_postings = [self.postings.get(term) for term in terms]
+            if any(postings is None for postings in term_postings) or not self.doc_numbers:
+                return 0, []
+
+            count = len(self.doc_numbers)
+            average_length = self.total_length / count or 1
+            doc_lengths = self.doc_lengths
+
+            # Rarest term first, so later terms only score documents still in the running
+            scores = None
+            for doc_numbers, frequencies in sorted(term_postings, key=lambda postings: len(postings[0])):
+                # Deleted documents still counted in df until compaction; close enough for ranking
+                df = len(doc_numbers)
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                term_scores = {}
+                for doc_number, frequency in zip(doc_numbers, frequencies):
+                    if scores is not None and doc_number not in scores:
+                        continue
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[doc_number] / average_length)
+                    score = idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+                    term_scores[doc_number] = score + (scores[doc_number] if scores is not None else 0)
+                scores = term_scores
+
+            year_prefix = f"{year:04d}-" if year else None
+            hits = []
+            for doc_number, score in scores.items():
+                document = self.documents[doc_number]
+                if document is None:
+                    continue
+                if president and document['president'] != president:
+                    continue
+                if year_prefix and not document['issuance_date'].startswith(year_prefix):
+                    continue
+                hits.append((score, document))
+
+        # Stable sorts, least significant key first
+        hits.sort(key=lambda hit: hit[1]['id'])
+        hits.sort(key=lambda hit: hit[1]['issuance_date'], reverse=True)
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+
+        return len(hits), [document for _, document in hits[offset:offset + limit]]
+
+    def save(self, path):
+        """
+        Write a snapshot that load() can read without a database.
+
+        The file holds a JSON header (documents, terms and posting list lengths)
+        followed by the raw posting arrays.
+        """
+        with self.lock:
+            self.compact()
+            terms = sorted(self.postings)
+            header = json.dumps({
+                'byteorder': sys.byteorder,
+                'watermark': self.watermark,
+                'documents': self.documents,
+                'terms': [[term, len(self.postings[term][0])] for term in terms],
+            }, separators=(',', ':')).encode('utf-8')
+
+            directory = os.path.dirname(os.path.abspath(path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(SNAPSHOT_MAGIC)
+                    f.write(struct.pack('<Q', len(header)))
+                    f.write(header)
+                    f.write(self.doc_lengths.tobytes())
+                    for term in terms:
+                        f.write(self.postings[term][0].tobytes())
+                    for term in terms:
+                        f.write(self.postings[term][1].tobytes())
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read a snapshot written by save().
+
+        Raises:
+            ValueError: If the file is not an index snapshot
+        """
+        with open(path, 'rb') as f:
+            data = memoryview(f.read())
+
+        if bytes(data[:len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a search index snapshot")
+        position = len(SNAPSHOT_MAGIC)
+        (header_length,) = struct.unpack_from('<Q', data, position)
+        position += 8
+        header = json.loads(bytes(data[position:position + header_length]))
+        position += header_length
+        swap = header['byteorder'] != sys.byteorder
+
+        def read_array(typecode, length):
+            nonlocal position
+            values = array(typecode)
+            size = length * values.itemsize
+            values.frombytes(data[position:position + size])
+            position += size
+            if swap:
+                values.byteswap()
+            return values
+
+        index = cls()
+        index.documents = header['documents']
+        index.doc_lengths = read_array('I', len(index.documents))
+        index.doc_numbers = {document['id']: doc_number for doc_number, document in enumerate(index.documents)}
+        index.total_length = sum(index.doc_lengths)
+        index.watermark = header['watermark']
+
+        doc_numbers = [(term, read_array('I', length)) for term, length in header['terms']]
+        index.postings = {
+            term: (numbers, read_array('B', len(numbers)))
+            for term, numbers in doc_numbers
+        }
+        return index
+
+def sync_search_index(index):
+    """
+    Bring an index up to date with the database after ingest commits.
+
+    Nothing is queried until the dataset version moves, and the version itself
+    is only re-read every DATASET_VERSION_TTL seconds. Then orders updated since
+    SEARCH_INDEX_SYNC_OVERLAP_SECONDS before the index's watermark are
+    re-indexed; if the order count still differs (orders were deleted), the
+    index is rebuilt from scratch. An empty index is built in full on first use.
+    """
+    version = get_dataset_version()
+    if index.dataset_version == version:
+        return index
+
+    with index.lock:
+        if index.dataset_version == version:
+            return index
+
+        query = ExecutiveOrder.query.with_entities(*ExecutiveOrder.serialized_columns())
+        changed = query
+        if index.watermark is not None:
+            # Commits can land out of updated_at order; re-indexing a few recent orders twice is harmless
+            since = datetime.fromisoformat(index.watermark) - timedelta(seconds=SEARCH_INDEX_SYNC_OVERLAP_SECONDS)
+            changed = changed.filter(ExecutiveOrder.updated_at >= since)
+
+        updated = 0
+        for row in changed.yield_per(1000):
+            index.add(_to_document(row))
+            updated += 1
+
+        total = ExecutiveOrder.query.count()
+        if len(index) != total:
+            logger.info(f"Search index has {len(index)} orders but the database has {total}; rebuilding")
+            index.clear()
+            for row in query.yield_per(1000):
+                index.add(_to_document(row))
+            updated = total
+
+        index.dataset_version = version
+        logger.info(f"Search index synced to dataset version {version} ({updated} orders indexed)")
+    return index
+
+def init_search_index(app):
+    """
+    Set up the in-memory search index when SEARCH_BACKEND is 'memory'.
+
+    The index is loaded from SEARCH_INDEX_SNAPSHOT when the file exists, and
+    otherwise built from the database on first use.
+    """
+    backend = app.config.get('SEARCH_BACKEND', 'database')
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown SEARCH_BACKEND '{backend}'. Valid options are: {', '.join(SEARCH_BACKENDS)}")
+    if backend != 'memory':
+        return
+
+    index = None
+    snapshot = app.config.get('SEARCH_INDEX_SNAPSHOT')
+    if snapshot and os.path.exists(snapshot):
+        try:
+            index = InvertedIndex.load(snapshot)
+            app.logger.info(f"Loaded search index snapshot with {len(index)} orders from {snapshot}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Could not load search index snapshot {snapshot}, building from the database: {str(e)}")
+
+    app.extensions['eo_search_index'] = index or InvertedIndex()
+
+def get_search_index():
+    """Return the app's in-memory search index, synced to the current dataset version."""
+    return sync_search_index(current_app.extensions['eo_search_index'])
@@ -0,0 +1,157 @@
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.federal_register_client import FederalRegisterClient
+
+logger = logging.getLogger(__name__)
+
+# Concurrent Federal Register requests per ingest run; keep low to respect upstream limits
+FEDERAL_REGISTER_MAX_CONCURRENCY = int(os.environ.get('FEDERAL_REGISTER_MAX_CONCURRENCY', 2))
+
+# Pages fetched ahead of the one being processed (bounds memory held by the pipeline)
+FEDERAL_REGISTER_PREFETCH_PAGES = int(os.environ.get('FEDERAL_REGISTER_PREFETCH_PAGES', 4))
+
+class PageFetchError(Exception):
+    """Exception raised when a page could not be fetched."""
+    def __init__(self, page, cause):
+        self.page = page
+        self.cause = cause
+        super().__init__(str(cause))
+
+def _close_response(response):
+    """Release the connection or temporary file held by a streamed page; other responses hold none."""
+    close = getattr(response, 'close', None)
+    if close:
+        close()
+
+def _yield_page(page, response):
+    """Yield one page, closing it if the consumer abandons iteration before asking for the next."""
+    try:
+        yield page, response
+    except GeneratorExit:
+        # The consumer stopped partway through this page
+        _close_response(response)
+        raise
+
+def iter_pages(fetch_page, start_page=1, last_page=None, max_workers=None, max_prefetch=None):
+    """
+    Yield result pages in order while fetching upcoming pages in the background.
+
+    The first page is fetched synchronously to learn total_pages. After that up to
+    max_prefetch later pages are in flight or buffered at once, fetched by at most
+    max_workers threads, so network time overlaps with the caller's processing.
+    If iteration stops early, because the consumer stopped or a page failed,
+    pages fetched but not yet yielded are closed, and so is the page the
+    consumer was reading.
+
+    Args:
+        fetch_page (callable): Function taking a page number and returning the API response
+        start_page (int): First page to fetch
+        last_page (int, optional): Last page to fetch, even if more are available
+        max_workers (int, optional): Fetch threads. Defaults to FEDERAL_REGISTER_MAX_CONCURRENCY.
+        max_prefetch (int, optional): Pages fetched ahead. Defaults to FEDERAL_REGISTER_PREFETCH_PAGES.
+
+    Yields:
+        tuple: (page number, API response)
+
+    Raises:
+        PageFetchError: When a page fails; pages after it are not yielded
+    """
+    max_workers = max(1, max_workers or FEDERAL_REGISTER_MAX_CONCURRENCY)
+    max_prefetch = max(1, max_prefetch or FEDERAL_REGISTER_PREFETCH_PAGES)
+
+    try:
+        response = fetch_page(start_page)
+    except Exception as e:
+        raise PageFetchError(start_page, e) from e
+
+    total_pages = (response or {}).get('total_pages', start_page)
+    if last_page:
+        total_pages = min(total_pages, last_page)
+
+    yield from _yield_page(start_page, response)
+
+    if total_pages <= start_page:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='page-prefetch')
+    pending = deque()
+    next_page = start_page + 1
+
+    def fill_window():
+        nonlocal next_page
+        while next_page <= total_pages and len(pending) < max_prefetch:
+            pending.append((next_page, executor.submit(fetch_page, next_page)))
+            next_page += 1
+
+    try:
+        fill_window()
+        while pending:
+            page, future = pending.popleft()
+            # Refill the freed slot so the window stays full while this page is consumed
+            fill_window()
+
+            try:
+                response = future.result()
+            except Exception as e:
+                raise PageFetchError(page, e) from e
+
+            yield from _yield_page(page, response)
+    finally:
+        # Also runs when the consumer stops early: drop queued fetches, finish in-flight ones
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Fetched pages nobody will read still hold a connection or temporary file
+        for _, future in pending:
+            if not future.cancelled() and future.exception() is None:
+                _close_response(future.result())
+
+def make_page_fetcher(client_factory=FederalRegisterClient, per_page=50, if_changed=False, stream=False, **filters):
+    """
+    Build a fetch_page function for iter_pages over FederalRegisterClient.get_executive_orders.
+
+    Each fetch thread gets its own client, since a requests.Session is not guaranteed
+    to be thread-safe.
+
+    With if_changed=True, pages the API reports unchanged since they were last
+    stored come back as a NotModifiedResponse. Call fetch_page.confirm(page) once
+    a page has been committed so later runs can skip it.
+
+    With stream=True, pages come back as StreamedPage objects whose results are
+    parsed as they are iterated. A prefetched page holds its connection open
+    until it is consumed.
+
+    Args:
+        client_factory (callable): Returns a new client
+        per_page (int): Number of results per page
+        if_changed (bool): Skip pages already stored and unchanged upstream
+        stream (bool): Parse results incrementally
+        **filters: Additional get_executive_orders arguments (year, start_date, ...)
+
+    Returns:
+        callable: Function taking a page number and returning the API response
+    """
+    local = threading.local()
+    options = {}
+    if if_changed:
+        options['if_changed'] = True
+    if stream:
+        options['stream'] = True
+
+    def get_client():
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = client_factory()
+        return client
+
+    def fetch_page(page):
+        logger.info(f"Fetching page {page} of executive orders")
+        return get_client().get_executive_orders(page=page, per_page=per_page, **filters, **options)
+
+    def confirm(page):
+        get_client().confirm_executive_orders(page=page, per_page=per_page, **filters)
+
+    fetch_page.confirm = confirm
+    return fetch_page
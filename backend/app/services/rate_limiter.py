@@ -0,0 +1,143 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Requests per second allowed across every process sharing the bucket (0 disables limiting)
+FEDERAL_REGISTER_RATE_LIMIT = float(os.environ.get('FEDERAL_REGISTER_RATE_LIMIT', 5))
+
+# Requests that may be made back-to-back after an idle period
+FEDERAL_REGISTER_RATE_BURST = int(os.environ.get('FEDERAL_REGISTER_RATE_BURST', 10))
+
+# 'memory' limits each process on its own; 'redis' shares one budget through CELERY_BROKER_URL
+FEDERAL_REGISTER_RATE_LIMIT_BACKEND = os.environ.get('FEDERAL_REGISTER_RATE_LIMIT_BACKEND', 'memory')
+
+class TokenBucket:
+    """
+    Thread-safe in-process token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Callers
+    reserve tokens up front and are told how long to wait, so concurrent callers
+    queue fairly instead of polling.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, rate))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens from the bucket, going into debt if necessary.
+
+        Returns:
+            float: Seconds the caller must wait before using the tokens
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        """Block until the tokens may be used. Returns the time waited in seconds."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+class RedisTokenBucket:
+    """
+    Token bucket stored in Redis, shared by every worker and script process.
+
+    The refill-and-take step runs as one Lua script using the Redis server clock,
+    so processes on different hosts see a single consistent budget. If Redis is
+    unreachable the bucket falls back to an in-process limit rather than failing
+    the request.
+    """
+
+    SCRIPT = """
+    if redis.replicate_commands then redis.replicate_commands() end
+    local rate = tonumber(ARGV[1])
+    local capacity = tonumber(ARGV[2])
+    local requested = tonumber(ARGV[3])
+    local time = redis.call('TIME')
+    local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+    local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+    local tokens = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate) - requested
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 60)
+    if tokens >= 0 then return '0' end
+    return tostring(-tokens / rate)
+    """
+
+    def __init__(self, url, rate, capacity=None, key='eo-archive:rate-limit:federal-register', sleep=time.sleep):
+        import redis
+
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, rate))
+        self.key = key
+        self._sleep = sleep
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(self.SCRIPT)
+        self._fallback = TokenBucket(rate, capacity, sleep=sleep)
+
+    def reserve(self, tokens=1):
+        """Take tokens from the shared bucket. Returns seconds to wait."""
+        try:
+            return float(self._script(keys=[self.key], args=[self.rate, self.capacity, tokens]))
+        except Exception as e:
+            logger.warning(f"Shared rate limiter unavailable, limiting locally: {str(e)}")
+            return self._fallback.reserve(tokens)
+
+    def acquire(self, tokens=1):
+        """Block until the tokens may be used. Returns the time waited in seconds."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+def create_rate_limiter(rate, capacity=None, backend='memory', redis_url=None):
+    """
+    Create a rate limiter.
+
+    Args:
+        rate (float): Requests per second; 0 or less disables limiting
+        capacity (int, optional): Burst size. Defaults to one second of requests.
+        backend (str): 'memory' or 'redis'
+        redis_url (str, optional): Redis URL for the 'redis' backend
+
+    Returns:
+        TokenBucket, RedisTokenBucket or None: The limiter, or None when disabled
+    """
+    if rate <= 0:
+        return None
+    if backend == 'redis':
+        return RedisTokenBucket(redis_url, rate, capacity)
+    return TokenBucket(rate, capacity)
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+def get_default_rate_limiter():
+    """Return the process-wide Federal Register limiter configured from the environment."""
+    global _default_limiter
+
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = create_rate_limiter(
+                FEDERAL_REGISTER_RATE_LIMIT,
+                FEDERAL_REGISTER_RATE_BURST,
+                backend=FEDERAL_REGISTER_RATE_LIMIT_BACKEND,
+                redis_url=os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+            ) or False
+        return _default_limiter or None
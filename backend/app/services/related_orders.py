@@ -0,0 +1,277 @@
+import logging
+import os
+from datetime import datetime
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from app.models.executive_order_neighbor import ExecutiveOrderNeighbor
+from app.services.cache import bump_dataset_version
+from app.services.inverted_index import TITLE_WEIGHT, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Related orders stored per executive order
+RELATED_ORDERS_K = int(os.environ.get('RELATED_ORDERS_K', 10))
+
+# Blend of text similarity (TF-IDF cosine), same president and issuance date proximity
+TEXT_WEIGHT = 0.7
+PRESIDENT_WEIGHT = 0.15
+DATE_WEIGHT = 0.15
+
+# Date proximity decays by 1/e for every this many days apart
+DATE_SCALE_DAYS = 365
+
+# Terms in more than this share of orders ("executive", "federal") are dropped from the vectors
+# once the archive is large enough for document frequencies to mean something
+MAX_DOCUMENT_FREQUENCY = 0.2
+MIN_ORDERS_FOR_MAX_DOCUMENT_FREQUENCY = 50
+
+# Ids per IN (...) clause when reading and rewriting neighbor rows
+_CHUNK_SIZE = 500
+
+# Similarity cells (orders in a block × all orders) computed at once, about 32 MB of float64
+_SIMILARITY_BLOCK_CELLS = 4_000_000
+
+def _chunks(items, size=_CHUNK_SIZE):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _ranges(starts, ends):
+    """Concatenation of arange(start, end) for each pair, without a Python loop."""
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    return np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+
+class SimilarityModel:
+    """
+    TF-IDF matrix of every order, stored sparse in both row and column order.
+
+    Rows are L2-normalized, so the cosine similarities of a block of orders
+    with every other order are that block's rows of the sparse product X·Xᵀ,
+    gathered from the column (posting) lists of the block's own terms.
+    Orders are numbered in id order, so ties on score break by id.
+    """
+
+    def __init__(self, orders):
+        """
+        Args:
+            orders: (id, title, plain_language_summary, president, issuance_date) tuples
+        """
+        self.orders = {order[0]: order for order in orders}
+        self.ids = sorted(self.orders)
+        self.rows = {eo_id: row for row, eo_id in enumerate(self.ids)}
+
+        vocabulary = {}
+        entry_rows, entry_terms, entry_counts = [], [], []
+        for row, eo_id in enumerate(self.ids):
+            _, title, summary, _, _ = self.orders[eo_id]
+            terms = {}
+            for token in tokenize(title):
+                terms[token] = terms.get(token, 0) + TITLE_WEIGHT
+            for token in tokenize(summary):
+                terms[token] = terms.get(token, 0) + 1
+            for term, count in terms.items():
+                entry_rows.append(row)
+                entry_terms.append(vocabulary.setdefault(term, len(vocabulary)))
+                entry_counts.append(count)
+
+        total = len(self.ids)
+        rows = np.array(entry_rows, dtype=np.int64)
+        terms = np.array(entry_terms, dtype=np.int64)
+        counts = np.array(entry_counts, dtype=np.float64)
+
+        document_frequency = np.bincount(terms, minlength=len(vocabulary))
+        max_frequency = total
+        if total >= MIN_ORDERS_FOR_MAX_DOCUMENT_FREQUENCY:
+            max_frequency = MAX_DOCUMENT_FREQUENCY * total
+        kept = document_frequency[terms] <= max_frequency
+        rows, terms, counts = rows[kept], terms[kept], counts[kept]
+
+        weights = (1 + np.log(counts)) * (np.log((1 + total) / (1 + document_frequency[terms])) + 1)
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=total))
+        weights = weights / norms[rows]
+
+        # CSR: entries are already grouped by row
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(rows, minlength=total))))
+        self.indices = terms
+        self.data = weights
+
+        # CSC: the posting list of each term
+        by_term = np.argsort(terms, kind='stable')
+        self.col_indptr = np.concatenate(([0], np.cumsum(np.bincount(terms, minlength=len(vocabulary)))))
+        self.col_rows = rows[by_term]
+        self.col_data = weights[by_term]
+
+        presidents = {}
+        self.presidents = np.array(
+            [presidents.setdefault(self.orders[eo_id][3], len(presidents)) if self.orders[eo_id][3] else -1
+             for eo_id in self.ids],
+            dtype=np.int64
+        )
+        issued = [self.orders[eo_id][4] for eo_id in self.ids]
+        self.has_date = np.array([day is not None for day in issued], dtype=bool)
+        self.days = np.array([day.toordinal() if day else 0 for day in issued], dtype=np.float64)
+
+    def _term_entries(self, rows):
+        starts, ends = self.indptr[rows], self.indptr[rows + 1]
+        return _ranges(starts, ends), ends - starts
+
+    def sharing_terms(self, eo_id):
+        """Orders with at least one term in common with an order (including itself)."""
+        row = self.rows.get(eo_id)
+        if row is None:
+            return set()
+        entries, _ = self._term_entries(np.array([row]))
+        terms = self.indices[entries]
+        postings = _ranges(self.col_indptr[terms], self.col_indptr[terms + 1])
+        return {self.ids[other] for other in np.unique(self.col_rows[postings])}
+
+    def _similarities(self, rows):
+        """Rows of X·Xᵀ for the given order numbers, as a dense (len(rows), orders) array."""
+        total = len(self.ids)
+        entries, lengths = self._term_entries(rows)
+        block_rows = np.repeat(np.arange(len(rows)), lengths)
+        terms = self.indices[entries]
+
+        starts, ends = self.col_indptr[terms], self.col_indptr[terms + 1]
+        postings = _ranges(starts, ends)
+        lengths = ends - starts
+        products = np.repeat(self.data[entries], lengths) * self.col_data[postings]
+        cells = np.repeat(block_rows, lengths) * total + self.col_rows[postings]
+        return np.bincount(cells, weights=products, minlength=len(rows) * total).reshape(len(rows), total)
+
+    def _rank(self, row, similarities, k):
+        similarities[row] = 0.0
+        candidates = np.flatnonzero(similarities)
+        if not len(candidates):
+            return []
+
+        scores = TEXT_WEIGHT * similarities[candidates]
+        if self.presidents[row] >= 0:
+            scores += PRESIDENT_WEIGHT * (self.presidents[candidates] == self.presidents[row])
+        if self.has_date[row]:
+            proximity = np.exp(-np.abs(self.days[candidates] - self.days[row]) / DATE_SCALE_DAYS)
+            scores += DATE_WEIGHT * proximity * self.has_date[candidates]
+        scores = np.round(scores, 6)
+
+        if len(candidates) > k:
+            # Keep everything tied with the k-th best so the id tiebreak sees all of them
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            top = scores >= threshold
+            candidates, scores = candidates[top], scores[top]
+        best = np.lexsort((candidates, -scores))[:k]
+        return [(self.ids[candidates[i]], round(float(scores[i]), 6)) for i in best]
+
+    def neighbors_of(self, eo_ids, k=RELATED_ORDERS_K):
+        """
+        Yield (id, neighbors) for each order, computing similarities a block of orders at a time.
+
+        Only orders sharing a term are candidates; president and date proximity
+        re-rank them. Neighbors are (neighbor id, score) pairs, best first.
+        """
+        order_rows = np.array(sorted(self.rows[eo_id] for eo_id in eo_ids), dtype=np.int64)
+        block_size = max(1, _SIMILARITY_BLOCK_CELLS // max(1, len(self.ids)))
+        for start in range(0, len(order_rows), block_size):
+            rows = order_rows[start:start + block_size]
+            similarities = self._similarities(rows)
+            for row, row_similarities in zip(rows, similarities):
+                yield self.ids[row], self._rank(row, row_similarities, k)
+
+    def neighbors(self, eo_id, k=RELATED_ORDERS_K):
+        """The k most related orders, as (neighbor id, score) pairs, best first."""
+        return next(self.neighbors_of([eo_id], k))[1]
+
+def _existing_neighbors(eo_ids):
+    """Current neighbor lists for a set of orders."""
+    existing = {}
+    for chunk in _chunks(eo_ids):
+        rows = db.session.execute(
+            select(ExecutiveOrderNeighbor.eo_id, ExecutiveOrderNeighbor.neighbor_id, ExecutiveOrderNeighbor.score)
+            .where(ExecutiveOrderNeighbor.eo_id.in_(chunk))
+            .order_by(ExecutiveOrderNeighbor.eo_id, ExecutiveOrderNeighbor.rank)
+        )
+        for row in rows:
+            existing.setdefault(row.eo_id, []).append((row.neighbor_id, row.score))
+    return existing
+
+def refresh_related_orders(full=False, k=RELATED_ORDERS_K):
+    """
+    Bring the executive_order_neighbors table up to date.
+
+    Vectors are rebuilt in memory from every order, but neighbor lists are
+    only recomputed for orders that may have changed since the last refresh:
+    the orders updated since then, orders sharing a term with them, and orders
+    that listed them as neighbors. Only lists that actually changed are
+    rewritten. Pass full=True to recompute every list, e.g. after changing the
+    weights. IDF drift from new orders is only picked up by lists that are
+    recomputed.
+
+    Returns:
+        dict: Counts of orders 'considered' and neighbor lists 'rewritten'
+    """
+    started = datetime.utcnow()
+
+    rows = db.session.execute(select(
+        ExecutiveOrder.id,
+        ExecutiveOrder.title,
+        ExecutiveOrder.plain_language_summary,
+        ExecutiveOrder.president,
+        ExecutiveOrder.issuance_date,
+        ExecutiveOrder.updated_at
+    )).all()
+    model = SimilarityModel(row[:5] for row in rows)
+
+    # Lists of orders that no longer exist
+    db.session.execute(
+        delete(ExecutiveOrderNeighbor).where(~ExecutiveOrderNeighbor.eo_id.in_(select(ExecutiveOrder.id)))
+    )
+
+    last_refresh = db.session.execute(select(func.max(ExecutiveOrderNeighbor.computed_at))).scalar()
+    if full or last_refresh is None:
+        affected = set(model.orders)
+    else:
+        changed = {row.id for row in rows if row.updated_at is None or row.updated_at >= last_refresh}
+        affected = set(changed)
+        for eo_id in changed:
+            affected |= model.sharing_terms(eo_id)
+        for chunk in _chunks(changed):
+            affected.update(db.session.execute(
+                select(ExecutiveOrderNeighbor.eo_id).where(ExecutiveOrderNeighbor.neighbor_id.in_(chunk))
+            ).scalars())
+        # Orders deleted since the last refresh leave no trace in the model
+        affected.update(db.session.execute(
+            select(ExecutiveOrderNeighbor.eo_id)
+            .where(~ExecutiveOrderNeighbor.neighbor_id.in_(select(ExecutiveOrder.id)))
+        ).scalars())
+        affected &= set(model.orders)
+
+    existing = _existing_neighbors(affected)
+    rewritten = []
+    new_rows = []
+    for eo_id, neighbors in model.neighbors_of(affected, k):
+        if neighbors == existing.get(eo_id, []):
+            continue
+        rewritten.append(eo_id)
+        new_rows.extend(
+            {'eo_id': eo_id, 'rank': rank, 'neighbor_id': neighbor_id, 'score': score, 'computed_at': started}
+            for rank, (neighbor_id, score) in enumerate(neighbors, start=1)
+        )
+
+    for chunk in _chunks(rewritten):
+        db.session.execute(delete(ExecutiveOrderNeighbor).where(ExecutiveOrderNeighbor.eo_id.in_(chunk)))
+    if new_rows:
+        db.session.execute(insert(ExecutiveOrderNeighbor), new_rows)
+    db.session.commit()
+
+    if rewritten:
+        bump_dataset_version()
+
+    summary = {'considered': len(affected), 'rewritten': len(rewritten)}
+    logger.info(f"Related orders refreshed: {summary}")
+    return summary
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+# Directory for cached Federal Register responses; empty disables the cache
+FEDERAL_REGISTER_CACHE_DIR = os.environ.get('FEDERAL_REGISTER_CACHE_DIR', '')
+
+# Seconds a response is served without contacting the API when it sends no max-age
+FEDERAL_REGISTER_CACHE_FRESHNESS = int(os.environ.get('FEDERAL_REGISTER_CACHE_FRESHNESS', 300))
+
+# Entries not used for this many seconds are evicted
+FEDERAL_REGISTER_CACHE_TTL = int(os.environ.get('FEDERAL_REGISTER_CACHE_TTL', 7 * 24 * 3600))
+
+# Total size of cached bodies before least recently used entries are evicted
+FEDERAL_REGISTER_CACHE_MAX_BYTES = int(os.environ.get('FEDERAL_REGISTER_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+
+# Temporary files untouched this long were left behind by a writer that died
+STALE_TEMP_FILE_SECONDS = 3600
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+def freshness_from_headers(headers, default):
+    """
+    Return how long a response may be reused without revalidation.
+
+    Returns:
+        int or None: Seconds of freshness, or None if the response must not be stored
+    """
+    cache_control = (headers.get('Cache-Control') or '').lower()
+    if 'no-store' in cache_control:
+        return None
+    if 'no-cache' in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    if match:
+        return int(match.group(1))
+    return default
+
+class CachedResponse:
+    """A stored response body with the validators needed to revalidate it."""
+
+    def __init__(self, key, meta, body_path):
+        self.key = key
+        self.etag = meta.get('etag')
+        self.last_modified = meta.get('last_modified')
+        self.fresh_until = meta.get('fresh_until', 0)
+        self.summary = meta.get('summary') or {}
+        self.confirmed = meta.get('confirmed', False)
+        self.body_path = body_path
+
+    def is_fresh(self, now=None):
+        return (now or time.time()) < self.fresh_until
+
+    def conditional_headers(self):
+        """Headers that turn a request for this URL into a conditional request."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def json(self):
+        """Parse the stored body."""
+        with open(self.body_path, 'rb') as f:
+            return json.loads(f.read())
+
+    def open(self):
+        """Open the stored body for streaming."""
+        return open(self.body_path, 'rb')
+
+class DiskResponseCache:
+    """
+    On-disk cache of API responses keyed by URL and query parameters.
+
+    Each entry is a body file plus a small JSON metadata file holding the ETag,
+    Last-Modified, freshness deadline, a summary of the response (count and
+    total_pages) and whether the caller confirmed it stored the body. Files are
+    replaced atomically, so several worker processes can share one directory.
+    Entries unused for `ttl` seconds are evicted, and the least recently used
+    entries are evicted once bodies exceed `max_bytes`.
+    """
+
+    def __init__(self, directory, ttl=FEDERAL_REGISTER_CACHE_TTL, max_bytes=FEDERAL_REGISTER_CACHE_MAX_BYTES,
+                 default_freshness=FEDERAL_REGISTER_CACHE_FRESHNESS):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.default_freshness = default_freshness
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(url, params=None):
+        """Build a cache key from the URL and query parameters in a stable order."""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        return os.path.join(self.directory, f"{key}.meta"), os.path.join(self.directory, f"{key}.body")
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key):
+        """Return the CachedResponse for a key, or None if it is missing or expired."""
+        meta_path, body_path = self._paths(key)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.ttl:
+                self.delete(key)
+                return None
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if not os.path.exists(body_path):
+                return None
+            # Mark as recently used for eviction
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(key, meta, body_path)
+
+    def set(self, key, body, headers, summary=None):
+        """
+        Store a response body and its validators.
+
+        Responses marked no-store, or with neither validators nor freshness, are not stored.
+
+        Returns:
+            bool: Whether the response was stored
+        """
+        return self._store(key, headers, summary, lambda body_path: self._write_atomic(body_path, body))
+
+    def store_file(self, key, path, headers, summary=None):
+        """
+        Like set(), but for a body already written to a file in the cache directory.
+
+        The file is moved into the cache, or deleted if the response is not stored.
+        """
+        stored = self._store(key, headers, summary, lambda body_path: os.replace(path, body_path))
+        if not stored and os.path.exists(path):
+            os.remove(path)
+        return stored
+
+    def _store(self, key, headers, summary, write_body):
+        freshness = freshness_from_headers(headers, self.default_freshness)
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if freshness is None or not (etag or last_modified or freshness):
+            return False
+
+        meta = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh_until': time.time() + freshness,
+            'summary': summary or {},
+            'confirmed': False
+        }
+        meta_path, body_path = self._paths(key)
+        try:
+            # Body first: a metadata file always points at a complete body
+            write_body(body_path)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not write response cache entry: {str(e)}")
+            return False
+
+        self.prune()
+        return True
+
+    def _update_meta(self, key, **changes):
+        meta_path, _ = self._paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            meta.update(changes)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not update response cache entry: {str(e)}")
+
+    def refresh(self, cached, headers):
+        """Extend an entry's freshness after the API answered 304 Not Modified."""
+        freshness = freshness_from_headers(headers, self.default_freshness)
+        self._update_meta(
+            cached.key,
+            etag=headers.get('ETag') or cached.etag,
+            last_modified=headers.get('Last-Modified') or cached.last_modified,
+            fresh_until=time.time() + (freshness or 0)
+        )
+
+    def confirm(self, key):
+        """Record that the caller stored this entry's body (see FederalRegisterClient.confirm)."""
+        if os.path.exists(self._paths(key)[0]):
+            self._update_meta(key, confirmed=True)
+
+    def delete(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            if name.endswith(('.meta', '.body')):
+                self.delete(name.rsplit('.', 1)[0])
+
+    def prune(self):
+        """
+        Evict expired entries, then least recently used ones until under max_bytes.
+
+        Temporary files not written for STALE_TEMP_FILE_SECONDS are deleted too;
+        newer ones may still be filling up in another process.
+        """
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                self._remove_if_stale(os.path.join(self.directory, name), now)
+                continue
+            if not name.endswith('.meta'):
+                continue
+            key = name[:-len('.meta')]
+            meta_path, body_path = self._paths(key)
+            try:
+                last_used = os.path.getmtime(meta_path)
+                size = os.path.getsize(body_path)
+            except OSError:
+                continue
+            if now - last_used > self.ttl:
+                self.delete(key)
+            else:
+                entries.append((last_used, size, key))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.delete(key)
+            total -= size
+
+    @staticmethod
+    def _remove_if_stale(path, now):
+        try:
+            if now - os.path.getmtime(path) > STALE_TEMP_FILE_SECONDS:
+                os.remove(path)
+        except OSError:
+            pass
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_default_response_cache():
+    """Return the process-wide response cache configured from the environment, or None if disabled."""
+    global _default_cache
+
+    if not FEDERAL_REGISTER_CACHE_DIR:
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DiskResponseCache(FEDERAL_REGISTER_CACHE_DIR)
+        return _default_cache
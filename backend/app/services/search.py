@@ -0,0 +1,102 @@
+import logging
+import re
+
+from sqlalchemy import and_, case, column, desc, func, literal_column, or_, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from app.models.search_index import FTS_TABLE, SEARCH_VECTOR_COLUMN
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration used by the generated tsvector column
+SEARCH_LANGUAGE = 'english'
+
+# Relative weight of title and summary matches in SQLite's bm25 ranking
+# (the first weight is the unindexed id column)
+FTS_COLUMN_WEIGHTS = (0.0, 2.0, 1.0)
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+def fts5_match_expression(text):
+    """
+    Turn free text into an FTS5 MATCH expression requiring every word.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input are
+    treated as plain text.
+
+    Returns:
+        str or None: The expression, or None if the text has no words
+    """
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"' for token in tokens)
+
+def _search_postgresql(query, text):
+    vector = literal_column(f"executive_orders.{SEARCH_VECTOR_COLUMN}", TSVECTOR)
+    # websearch_to_tsquery accepts arbitrary user input ("quoted phrases", or, -exclusions)
+    tsquery = func.websearch_to_tsquery(SEARCH_LANGUAGE, text)
+    rank = func.ts_rank_cd(vector, tsquery)
+    return query.filter(vector.op('@@')(tsquery)), desc(rank)
+
+def _search_sqlite(query, text):
+    expression = fts5_match_expression(text)
+    if expression is None:
+        return query.filter(db.false()), ExecutiveOrder.id
+
+    fts = table(FTS_TABLE, column('rowid'), column('id'))
+    # FTS5 addresses the whole table by name in MATCH and bm25()
+    fts_name = literal_column(FTS_TABLE)
+    # Rows are keyed by executive_orders' rowid; the id check guards against a
+    # VACUUM having renumbered rowids since the FTS table was filled
+    query = query \
+        .join(fts, and_(fts.c.rowid == literal_column('executive_orders.rowid'), fts.c.id == ExecutiveOrder.id)) \
+        .filter(fts_name.op('MATCH')(expression))
+    # bm25() is lower for better matches
+    return query, func.bm25(fts_name, *FTS_COLUMN_WEIGHTS)
+
+def _search_like(query, text):
+    # Unindexed substring match for databases without a full-text search setup
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return query.filter(db.false()), ExecutiveOrder.id
+
+    # Words are \w+, so _ is the only LIKE wildcard they can contain
+    patterns = ['%' + token.replace('_', '\\_') + '%' for token in tokens]
+    title_matches = [ExecutiveOrder.title.ilike(pattern, escape='\\') for pattern in patterns]
+    query = query.filter(*(
+        or_(title_match, ExecutiveOrder.plain_language_summary.ilike(pattern, escape='\\'))
+        for title_match, pattern in zip(title_matches, patterns)
+    ))
+    return query, case((and_(*title_matches), 0), else_=1)
+
+_SEARCH_BY_DIALECT = {
+    'postgresql': _search_postgresql,
+    'sqlite': _search_sqlite,
+}
+
+def search_executive_orders(query, text):
+    """
+    Restrict an ExecutiveOrder query to full-text matches.
+
+    PostgreSQL matches against the GIN-indexed search_vector column; SQLite
+    falls back to the executive_orders_fts table. Other databases get an
+    unindexed, case-insensitive substring match of every word, with orders
+    matching in the title first. Titles weigh more than summaries in all three.
+
+    Args:
+        query: ExecutiveOrder query, optionally already filtered
+        text (str): User's search text
+
+    Returns:
+        tuple: (filtered query, order_by columns ranking best matches first,
+            then newest issuance date, then id). The query is returned unsorted
+            so it can be counted cheaply.
+    """
+    dialect = db.session.get_bind().dialect.name
+    search = _SEARCH_BY_DIALECT.get(dialect, _search_like)
+    query, rank_order = search(query, text)
+
+    return query, [rank_order, desc(ExecutiveOrder.issuance_date), ExecutiveOrder.id]
@@ -0,0 +1,70 @@
+import logging
+
+from sqlalchemy import extract, func
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from app.services.cache import get_cache, get_dataset_version
+
+logger = logging.getLogger(__name__)
+
+def _stats_key():
+    return f"stats:{get_dataset_version()}"
+
+def compute_executive_order_stats():
+    """
+    Count executive orders by president, year and month with a single GROUP BY.
+
+    The per-president, per-year and per-month totals are rolled up from the
+    grouped rows in Python, so the table is scanned once.
+
+    Returns:
+        dict: total, by_president, by_year ("YYYY"), by_month ("YYYY-MM") and the
+            underlying groups (president, year, month, count), oldest first
+    """
+    year = extract('year', ExecutiveOrder.issuance_date)
+    month = extract('month', ExecutiveOrder.issuance_date)
+    rows = db.session.query(
+        ExecutiveOrder.president,
+        year.label('year'),
+        month.label('month'),
+        func.count().label('count')
+    ).group_by(ExecutiveOrder.president, year, month) \
+        .order_by(year, month, ExecutiveOrder.president) \
+        .all()
+
+    stats = {
+        'total': 0,
+        'by_president': {},
+        'by_year': {},
+        'by_month': {},
+        'groups': []
+    }
+    for row in rows:
+        row_year, row_month = int(row.year), int(row.month)
+        year_key = f"{row_year:04d}"
+        month_key = f"{row_year:04d}-{row_month:02d}"
+
+        stats['total'] += row.count
+        stats['by_president'][row.president] = stats['by_president'].get(row.president, 0) + row.count
+        stats['by_year'][year_key] = stats['by_year'].get(year_key, 0) + row.count
+        stats['by_month'][month_key] = stats['by_month'].get(month_key, 0) + row.count
+        stats['groups'].append({'president': row.president, 'year': row_year, 'month': row_month, 'count': row.count})
+
+    return stats
+
+def get_executive_order_stats():
+    """
+    Return executive order statistics, cached until the next ingest commit.
+
+    Entries are keyed by the dataset version, so the first request after an
+    ingest commit recomputes them.
+    """
+    cache = get_cache()
+    key = _stats_key()
+
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_executive_order_stats()
+        cache.set(key, stats)
+    return stats
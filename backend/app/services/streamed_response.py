@@ -0,0 +1,138 @@
+import logging
+import os
+import tempfile
+
+import ijson
+
+logger = logging.getLogger(__name__)
+
+class StreamedPageError(Exception):
+    """Exception raised when a streamed response could not be read or parsed."""
+    pass
+
+class TeeReader:
+    """File-like wrapper that copies everything read from a stream into a temporary file."""
+
+    def __init__(self, source, directory=None):
+        self.source = source
+        fd, self.path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        self._file = os.fdopen(fd, 'wb')
+
+    def read(self, size=-1):
+        data = self.source.read(size)
+        self._file.write(data)
+        return data
+
+    def finish(self):
+        """Close the copy and return its path; the caller takes ownership of the file."""
+        self._file.close()
+        return self.path
+
+    def discard(self):
+        """Close and delete the copy."""
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class StreamedPage:
+    """
+    Federal Register listing response whose results are parsed incrementally.
+
+    Top-level fields before the results array (count, total_pages, ...) are read
+    when the page is created; results are then built one document at a time as
+    they are iterated, so only a single document is held in memory. Supports
+    get(), `in` and [] for top-level fields; 'results' returns the iterator,
+    which can be consumed once.
+
+    Args:
+        stream: Binary file-like object with the JSON body
+        on_complete (callable, optional): Called with the top-level fields once
+            the whole body has been read
+        on_close (callable, optional): Called when the page is closed or fully read
+    """
+
+    def __init__(self, stream, on_complete=None, on_close=None):
+        self._events = ijson.parse(stream, use_float=True)
+        self._on_complete = on_complete
+        self._on_close = on_close
+        self._fields = {}
+        self._results = None
+        self._closed = False
+
+        try:
+            self._read_fields(stop_at_results=True)
+        except Exception:
+            self.close()
+            raise
+
+    def _read_fields(self, stop_at_results=False):
+        """Collect top-level scalar fields, stopping at the start of results if asked."""
+        for prefix, event, value in self._events:
+            if prefix == 'results' and event == 'start_array':
+                if stop_at_results:
+                    return True
+            elif prefix and '.' not in prefix and event in ('number', 'string', 'boolean', 'null'):
+                self._fields[prefix] = value
+        return False
+
+    def _iter_results(self):
+        builder = None
+        try:
+            for prefix, event, value in self._events:
+                if prefix == 'results' and event == 'end_array':
+                    break
+                if not prefix.startswith('results.item'):
+                    continue
+
+                if builder is None:
+                    if event in ('start_map', 'start_array'):
+                        builder = ijson.ObjectBuilder()
+                    else:
+                        # Scalar result item
+                        yield value
+                        continue
+
+                builder.event(event, value)
+                if prefix == 'results.item' and event in ('end_map', 'end_array'):
+                    yield builder.value
+                    builder = None
+
+            # Trailing fields after the results array
+            self._read_fields()
+        except GeneratorExit:
+            self.close()
+            raise
+        except Exception as e:
+            self.close()
+            raise StreamedPageError(f"Error reading streamed response: {str(e)}") from e
+
+        if self._on_complete:
+            self._on_complete(dict(self._fields))
+            self._on_complete = None
+        self.close()
+
+    @property
+    def results(self):
+        if self._results is None:
+            self._results = self._iter_results()
+        return self._results
+
+    def get(self, key, default=None):
+        if key == 'results':
+            return self.results
+        return self._fields.get(key, default)
+
+    def __getitem__(self, key):
+        if key == 'results':
+            return self.results
+        return self._fields[key]
+
+    def __contains__(self, key):
+        return key == 'results' or key in self._fields
+
+    def close(self):
+        """Release the underlying connection or file."""
+        if not self._closed:
+            self._closed = True
+            if self._on_close:
+                self._on_close()
@@ -1,174 +1,332 @@
+from celery import chord
 from app.services.celery_app import celery_app
-from app.services.federal_register_client import FederalRegisterClient
+from app.services.page_prefetcher import iter_pages, make_page_fetcher, PageFetchError
 from app.utils.data_transformers import transform_federal_register_document_to_model
-from app.models.executive_order import ExecutiveOrder
+from app.services.upsert import upsert_executive_orders_in_batches
 from app.database import db
+from app.services.cache import bump_dataset_version
+from app.services.related_orders import refresh_related_orders as refresh_related_orders_table
+from app.services.ingest_watermark import FEDERAL_REGISTER_SOURCE, advance_watermark, incremental_start_date, observe_document
+from app.services.response_cache import get_default_response_cache
 from datetime import datetime, timedelta
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of years a historical fetch works on at once
+HISTORICAL_FETCH_CONCURRENCY = int(os.environ.get('HISTORICAL_FETCH_CONCURRENCY', 4))
+
+# Documents requested per Federal Register page; pages are streamed, so this does not raise memory use
+FEDERAL_REGISTER_PAGE_SIZE = int(os.environ.get('FEDERAL_REGISTER_PAGE_SIZE', 200))
+
+def _transform_documents(documents, stats):
+    """
+    Transform Federal Register documents, skipping any that fail or lack an ID.
+    
+    Documents are transformed one at a time as the result is iterated, so a
+    streamed page is never materialized in full.
+    
+    Args:
+        documents (iterable): Federal Register documents
+        stats (dict): Its 'errors' count is incremented for each document that fails,
+            and 'latest' tracks the newest document transformed
+    
+    Yields:
+        dict: Transformed records
+    """
+    for document in documents:
+        try:
+            transformed = transform_federal_register_document_to_model(document)
+            
+            if not transformed or not transformed.get('id'):
+                logger.warning(f"Skipping document with missing ID: {document.get('document_number', 'Unknown')}")
+                continue
+            
+        except Exception as e:
+            stats['errors'] += 1
+            logger.error(f"Error processing document: {str(e)}")
+            continue
+        
+        stats['latest'] = observe_document(stats['latest'], document)
+        yield transformed
+
+def _ingest_pages(fetch_page, context=""):
+    """
+    Fetch every page of results and upsert each one, committing per page.
+    
+    Upcoming pages are fetched in the background while the current page is
+    transformed and written. Stops at the first page that fails.
+    
+    Args:
+        fetch_page (callable): Page fetcher, see make_page_fetcher
+        context (str): Suffix for log messages, e.g. " for year 2021"
+    
+    Returns:
+        dict: Counts of 'new', 'updated', 'unchanged' records, 'errors' and
+            'not_modified_pages' (pages skipped as already stored and unchanged),
+            'latest', the newest (publication_date, document_number) stored, and
+            'completed', whether every page was stored
+    """
+    totals = {'new': 0, 'updated': 0, 'unchanged': 0, 'errors': 0, 'not_modified_pages': 0, 'latest': None, 'completed': False}
+    page = None
+    confirm = getattr(fetch_page, 'confirm', None)
+    
+    try:
+        for page, response in iter_pages(fetch_page):
+            # Already stored and unchanged upstream: nothing to parse or write
+            if getattr(response, 'not_modified', False):
+                totals['not_modified_pages'] += 1
+                continue
+            
+            # Stream the page's documents into bulk upserts of UPSERT_BATCH_SIZE
+            records = _transform_documents((response or {}).get('results', []), totals)
+            counts = upsert_executive_orders_in_batches(records)
+            for key in ('new', 'updated', 'unchanged'):
+                totals[key] += counts[key]
+            
+            # Commit changes for this page; only real writes invalidate cached counts
+            db.session.commit()
+            if counts['new'] or counts['updated']:
+                bump_dataset_version()
+            
+            # Later runs may now skip this page while it stays unchanged upstream
+            if confirm:
+                confirm(page)
+        
+        totals['completed'] = True
+    
+    except Exception as e:
+        db.session.rollback()
+        failed_page = e.page if isinstance(e, PageFetchError) else page
+        logger.error(f"Error fetching page {failed_page}{context}: {str(e)}")
+        totals['errors'] += 1
+    
+    return totals
+
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=300)
-def update_executive_orders(self, days_back=30):
+def update_executive_orders(self, days_back=None):
     """
     Celery task to fetch and update executive orders from the Federal Register API.
     
+    By default only documents published since the stored watermark (less
+    INGEST_OVERLAP_DAYS) are fetched, and the watermark is moved up to the
+    newest document once every page has been stored. With the response cache
+    enabled, the start is rounded back to a Monday.
+    
     Args:
-        days_back (int, optional): Number of days back to look for updates. Defaults to 30.
+        days_back (int, optional): Re-scan a fixed number of days back instead of
+            starting from the watermark. The first run, with no watermark yet,
+            looks back 30 days.
     
     Returns:
         dict: Summary of the update operation
     """
     try:
-        logger.info(f"Starting executive orders update task (looking back {days_back} days)")
-        
-        # Calculate the date range
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=days_back)
+        if days_back is None:
+            start_date = incremental_start_date(FEDERAL_REGISTER_SOURCE, default_days_back=30)
+        else:
+            start_date = datetime.utcnow().date() - timedelta(days=days_back)
         
-        # Initialize the API client
-        client = FederalRegisterClient()
+        # With a response cache, the start is rounded back to a Monday and the window
+        # is left open-ended, so the request URLs stay the same all week and unchanged
+        # pages can be revalidated from the cache. Without one, the extra days would
+        # only be fetched again for nothing.
+        if get_default_response_cache() is not None:
+            start_date -= timedelta(days=start_date.weekday())
         
-        # Initialize counters
-        new_count = 0
-        updated_count = 0
-        error_count = 0
+        logger.info(f"Starting executive orders update task (publications since {start_date})")
         
-        # Fetch from the API
-        page = 1
-        per_page = 50
-        total_pages = 1  # Start with 1, will be updated after first request
+        # Fetch, transform and store every changed page, prefetching upcoming pages
+        totals = _ingest_pages(
+            make_page_fetcher(
+                per_page=FEDERAL_REGISTER_PAGE_SIZE,
+                if_changed=True,
+                stream=True,
+                start_date=start_date.isoformat()
+            )
+        )
         
-        while page <= total_pages:
-            try:
-                logger.info(f"Fetching page {page} of executive orders")
-                
-                # Make the API request
-                response = client.get_executive_orders(
-                    page=page,
-                    per_page=per_page,
-                    start_date=start_date.isoformat(),
-                    end_date=end_date.isoformat()
-                )
-                
-                # Update total pages if available
-                if response and 'total_pages' in response:
-                    total_pages = response['total_pages']
-                
-                # Process each result
-                for document in response.get('results', []):
-                    try:
-                        # Transform to our model format
-                        transformed = transform_federal_register_document_to_model(document)
-                        
-                        if not transformed or not transformed.get('id'):
-                            logger.warning(f"Skipping document with missing ID: {document.get('document_number', 'Unknown')}")
-                            continue
-                        
-                        # Check if this executive order already exists
-                        existing = ExecutiveOrder.query.get(transformed['id'])
-                        
-                        if existing:
-                            # Update existing record
-                            for key, value in transformed.items():
-                                if key != 'id' and hasattr(existing, key):
-                                    setattr(existing, key, value)
-                            updated_count += 1
-                        else:
-                            # Create new record
-                            new_eo = ExecutiveOrder(**transformed)
-                            db.session.add(new_eo)
-                            new_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error processing document: {str(e)}")
-                
-                # Commit changes for this page
-                db.session.commit()
-                
-                # Move to next page
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"Error fetching page {page}: {str(e)}")
-                error_count += 1
-                break
+        # A run that stopped early leaves the watermark where it was, so the next run covers the gap
+        watermark_advanced = totals['completed'] and advance_watermark(FEDERAL_REGISTER_SOURCE, totals['latest'], start_date)
         
         # Log summary
         summary = {
-            'new_records': new_count,
-            'updated_records': updated_count,
-            'errors': error_count,
+            'start_date': start_date.isoformat(),
+            'new_records': totals['new'],
+            'updated_records': totals['updated'],
+            'unchanged_records': totals['unchanged'],
+            'not_modified_pages': totals['not_modified_pages'],
+            'errors': totals['errors'],
+            'watermark_advanced': watermark_advanced,
             'completed_at': datetime.utcnow().isoformat()
         }
         
         logger.info(f"Executive orders update completed: {summary}")
+        
+        # Recompute related orders for what changed, without holding up the summary
+        if totals['new'] or totals['updated']:
+            refresh_related_orders.delay()
+        
         return summary
         
     except Exception as e:
         logger.error(f"Task failed: {str(e)}")
         self.retry(exc=e)
 
+def split_into_lanes(years, max_concurrency):
+    """
+    Split years into at most max_concurrency lanes, dealt out round-robin.
+    
+    Each lane runs its years one after another, so the number of lanes caps how many
+    years are fetched at once.
+    
+    Args:
+        years (list): Years to fetch
+        max_concurrency (int): Maximum number of lanes
+    
+    Returns:
+        list: Non-empty lists of years
+    """
+    lane_count = max(1, min(max_concurrency, len(years)))
+    lanes = [years[i::lane_count] for i in range(lane_count)]
+    return [lane for lane in lanes if lane]
+
 @celery_app.task(bind=True)
-def fetch_historical_executive_orders(self, start_year=1994, end_year=None):
+def fetch_historical_executive_orders(self, start_year=1994, end_year=None, max_concurrency=None):
     """
     Celery task to fetch historical executive orders from the Federal Register API.
     
+    Years are fanned out as a chord of lanes and the per-year summaries are
+    aggregated by summarize_historical_fetch, so this task returns as soon as the
+    work is dispatched instead of holding a worker while it waits. Related
+    orders are refreshed once the summary task succeeds.
+    
     Args:
         start_year (int, optional): Year to start fetching from. Defaults to 1994 (earliest in Federal Register API).
         end_year (int, optional): Year to end fetching at. Defaults to current year.
+        max_concurrency (int, optional): Maximum number of years fetched at once.
+            Defaults to HISTORICAL_FETCH_CONCURRENCY.
     
     Returns:
-        dict: Summary of the fetch operation
+        dict: Dispatch details, including the ID of the summarize_historical_fetch
+            task, whose result is the summary
     """
     try:
         # Use current year if end_year not specified
         if not end_year:
             end_year = datetime.utcnow().year
-            
-        logger.info(f"Starting historical executive orders fetch for years {start_year}-{end_year}")
         
-        # Initialize the API client
-        client = FederalRegisterClient()
+        if not max_concurrency:
+            max_concurrency = HISTORICAL_FETCH_CONCURRENCY
         
-        # Initialize counters
-        total_count = 0
-        error_years = []
+        years = list(range(start_year, end_year + 1))
+        lanes = split_into_lanes(years, max_concurrency)
         
-        # Process each year
-        for year in range(start_year, end_year + 1):
-            try:
-                logger.info(f"Fetching executive orders for year {year}")
-                
-                # Process this year in a separate task
-                result = fetch_executive_orders_by_year.delay(year)
-                
-                # Wait for the task to complete
-                year_result = result.get(timeout=3600)  # 1 hour timeout
-                
-                total_count += year_result.get('total_records', 0)
-                logger.info(f"Completed year {year}, fetched {year_result.get('total_records', 0)} records")
-                
-            except Exception as e:
-                logger.error(f"Error processing year {year}: {str(e)}")
-                error_years.append(year)
+        logger.info(f"Starting historical executive orders fetch for years {start_year}-{end_year} in {len(lanes)} lanes")
         
-        # Log summary
-        summary = {
-            'total_records': total_count,
-            'years_processed': (end_year - start_year + 1) - len(error_years),
-            'error_years': error_years,
-            'completed_at': datetime.utcnow().isoformat()
-        }
+        # Linked rather than chained, so the chord's result stays the summary
+        summary = summarize_historical_fetch.s(start_year, end_year)
+        summary.link(refresh_related_orders.si())
+        result = chord(fetch_executive_orders_for_years.si(lane) for lane in lanes)(summary)
         
-        logger.info(f"Historical executive orders fetch completed: {summary}")
-        return summary
+        return {
+            'chord_id': result.id,
+            'years': len(years),
+            'lanes': len(lanes),
+            'dispatched_at': datetime.utcnow().isoformat()
+        }
         
     except Exception as e:
         logger.error(f"Task failed: {str(e)}")
         self.retry(exc=e)
 
+@celery_app.task(bind=True)
+def fetch_executive_orders_for_years(self, years):
+    """
+    Celery task to fetch several years in sequence, as one lane of a historical fetch.
+    
+    Args:
+        years (list): Years to fetch, in order
+    
+    Returns:
+        list: Per-year summaries; a year that failed outright is reported with an 'error' key
+    """
+    summaries = []
+    
+    for year in years:
+        try:
+            summaries.append(_fetch_year(year))
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error processing year {year}: {str(e)}")
+            summaries.append({'year': year, 'error': str(e)})
+    
+    return summaries
+
+@celery_app.task(bind=True)
+def summarize_historical_fetch(self, lane_results, start_year, end_year):
+    """
+    Chord callback aggregating the per-year summaries of a historical fetch.
+    
+    Args:
+        lane_results (list): One list of per-year summaries per lane
+        start_year (int): First year of the fetch
+        end_year (int): Last year of the fetch
+    
+    Returns:
+        dict: Summary of the fetch operation
+    """
+    year_summaries = sorted(
+        (summary for lane in lane_results for summary in lane),
+        key=lambda summary: summary['year']
+    )
+    
+    error_years = [summary['year'] for summary in year_summaries if 'error' in summary]
+    completed = [summary for summary in year_summaries if 'error' not in summary]
+    
+    summary = {
+        'total_records': sum(s.get('total_records', 0) for s in completed),
+        'new_records': sum(s.get('new_records', 0) for s in completed),
+        'updated_records': sum(s.get('updated_records', 0) for s in completed),
+        'unchanged_records': sum(s.get('unchanged_records', 0) for s in completed),
+        'years_processed': (end_year - start_year + 1) - len(error_years),
+        'error_years': error_years,
+        'completed_at': datetime.utcnow().isoformat()
+    }
+    
+    logger.info(f"Historical executive orders fetch completed: {summary}")
+    return summary
+
+def _fetch_year(year):
+    """
+    Fetch and store executive orders for a specific year.
+    
+    Args:
+        year (int): Year to fetch executive orders for
+    
+    Returns:
+        dict: Summary of the fetch operation for this year
+    """
+    logger.info(f"Starting executive orders fetch for year {year}")
+    
+    # Fetch, transform and store every page, prefetching upcoming pages
+    totals = _ingest_pages(make_page_fetcher(per_page=FEDERAL_REGISTER_PAGE_SIZE, if_changed=True, stream=True, year=year), f" for year {year}")
+    
+    # Log summary
+    summary = {
+        'year': year,
+        'new_records': totals['new'],
+        'updated_records': totals['updated'],
+        'unchanged_records': totals['unchanged'],
+        'total_records': totals['new'] + totals['updated'] + totals['unchanged'],
+        'errors': totals['errors'],
+        'completed_at': datetime.utcnow().isoformat()
+    }
+    
+    logger.info(f"Executive orders fetch for year {year} completed: {summary}")
+    return summary
+
 @celery_app.task(bind=True)
 def fetch_executive_orders_by_year(self, year):
     """
@@ -181,89 +339,28 @@ def fetch_executive_orders_by_year(self, year):
         dict: Summary of the fetch operation for this year
     """
     try:
-        logger.info(f"Starting executive orders fetch for year {year}")
-        
-        # Initialize the API client
-        client = FederalRegisterClient()
-        
-        # Initialize counters
-        new_count = 0
-        updated_count = 0
-        error_count = 0
-        
-        # Fetch from the API
-        page = 1
-        per_page = 50
-        total_pages = 1  # Start with 1, will be updated after first request
-        
-        while page <= total_pages:
-            try:
-                logger.info(f"Fetching page {page} of executive orders for year {year}")
-                
-                # Make the API request
-                response = client.get_executive_orders(
-                    page=page,
-                    per_page=per_page,
-                    year=year
-                )
-                
-                # Update total pages if available
-                if response and 'total_pages' in response:
-                    total_pages = response['total_pages']
-                
-                # Process each result
-                for document in response.get('results', []):
-                    try:
-                        # Transform to our model format
-                        transformed = transform_federal_register_document_to_model(document)
-                        
-                        if not transformed or not transformed.get('id'):
-                            logger.warning(f"Skipping document with missing ID: {document.get('document_number', 'Unknown')}")
-                            continue
-                        
-                        # Check if this executive order already exists
-                        existing = ExecutiveOrder.query.get(transformed['id'])
-                        
-                        if existing:
-                            # Update existing record
-                            for key, value in transformed.items():
-                                if key != 'id' and hasattr(existing, key):
-                                    setattr(existing, key, value)
-                            updated_count += 1
-                        else:
-                            # Create new record
-                            new_eo = ExecutiveOrder(**transformed)
-                            db.session.add(new_eo)
-                            new_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error processing document: {str(e)}")
-                
-                # Commit changes for this page
-                db.session.commit()
-                
-                # Move to next page
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"Error fetching page {page} for year {year}: {str(e)}")
-                error_count += 1
-                break
-        
-        # Log summary
-        summary = {
-            'year': year,
-            'new_records': new_count,
-            'updated_records': updated_count,
-            'total_records': new_count + updated_count,
-            'errors': error_count,
-            'completed_at': datetime.utcnow().isoformat()
-        }
-        
-        logger.info(f"Executive orders fetch for year {year} completed: {summary}")
-        return summary
+        return _fetch_year(year)
         
     except Exception as e:
         logger.error(f"Task failed for year {year}: {str(e)}")
-        self.retry(exc=e)
\ No newline at end of file
+        self.retry(exc=e)
+
+@celery_app.task(bind=True)
+def refresh_related_orders(self, full=False):
+    """
+    Celery task to update the precomputed related-orders table after ingest.
+    
+    Args:
+        full (bool, optional): Recompute every order's neighbors instead of only
+            those affected by changes since the last refresh. Defaults to False.
+    
+    Returns:
+        dict: Counts of orders considered and neighbor lists rewritten
+    """
+    try:
+        return refresh_related_orders_table(full=full)
+    
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Related orders refresh failed: {str(e)}")
+        raise
\ No newline at end of file
@@ -0,0 +1,159 @@
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from flask import current_app
+
+from app.models.executive_order import ExecutiveOrder
+from app.services.cache import get_dataset_version
+
+logger = logging.getLogger(__name__)
+
+# Zoom levels, coarsest first
+TIMELINE_LEVELS = ('year', 'quarter', 'month', 'week', 'day')
+
+# Order ids returned per bucket, spread evenly across the bucket
+TIMELINE_REPRESENTATIVES = 3
+
+def bucket_start(level, day):
+    """First day of the level's calendar bucket containing `day` (weeks start on Monday)."""
+    if level == 'year':
+        return date(day.year, 1, 1)
+    if level == 'quarter':
+        return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+    if level == 'month':
+        return date(day.year, day.month, 1)
+    if level == 'week':
+        return day - timedelta(days=day.weekday())
+    if level == 'day':
+        return day
+    raise ValueError(f"Invalid level '{level}'. Valid options are: {', '.join(TIMELINE_LEVELS)}")
+
+def bucket_end(level, start):
+    """Last day of the bucket beginning on `start`."""
+    if level == 'year':
+        return date(start.year, 12, 31)
+    if level in ('quarter', 'month'):
+        months = 3 if level == 'quarter' else 1
+        year, month = divmod(start.month - 1 + months, 12)
+        return date(start.year + year, month + 1, 1) - timedelta(days=1)
+    if level == 'week':
+        return start + timedelta(days=6)
+    return start
+
+def bucket_span(level, start, end):
+    """Number of calendar buckets of a level that the inclusive range start..end touches."""
+    if level == 'year':
+        return end.year - start.year + 1
+    if level == 'quarter':
+        return (end.year * 4 + (end.month - 1) // 3) - (start.year * 4 + (start.month - 1) // 3) + 1
+    if level == 'month':
+        return (end.year * 12 + end.month) - (start.year * 12 + start.month) + 1
+    if level == 'week':
+        return (bucket_start('week', end) - bucket_start('week', start)).days // 7 + 1
+    return (end - start).days + 1
+
+def choose_level(start, end, max_buckets):
+    """The finest level that covers start..end in at most max_buckets buckets (else 'year')."""
+    for level in reversed(TIMELINE_LEVELS):
+        if bucket_span(level, start, end) <= max_buckets:
+            return level
+    return TIMELINE_LEVELS[0]
+
+def _representatives(ids, limit=TIMELINE_REPRESENTATIVES):
+    if len(ids) <= limit:
+        return list(ids)
+    if limit == 1:
+        return [ids[0]]
+    return [ids[round(position * (len(ids) - 1) / (limit - 1))] for position in range(limit)]
+
+class TimelineIndex:
+    """
+    Non-empty timeline buckets for every zoom level.
+
+    Built in one pass over (issuance_date, id) sorted by date. Each level keeps
+    its buckets sorted by start date alongside a list of the start dates, so a
+    date range is a binary search and a slice, independent of archive size.
+    """
+
+    def __init__(self, orders):
+        """
+        Args:
+            orders: (issuance_date, id) pairs sorted by issuance_date, then id
+        """
+        self.levels = {}
+        self.starts = {}
+        self.first_date = None
+        self.last_date = None
+
+        open_buckets = {level: None for level in TIMELINE_LEVELS}
+        members = {level: [] for level in TIMELINE_LEVELS}
+        buckets = {level: [] for level in TIMELINE_LEVELS}
+
+        def close(level):
+            bucket = open_buckets[level]
+            if bucket is not None:
+                bucket['count'] = len(members[level])
+                bucket['ids'] = _representatives(members[level])
+                buckets[level].append(bucket)
+
+        for issued, eo_id in orders:
+            if self.first_date is None:
+                self.first_date = issued
+            self.last_date = issued
+
+            for level in TIMELINE_LEVELS:
+                start = bucket_start(level, issued)
+                bucket = open_buckets[level]
+                if bucket is None or bucket['_start'] != start:
+                    close(level)
+                    bucket = open_buckets[level] = {
+                        '_start': start,
+                        'start': start.isoformat(),
+                        'end': bucket_end(level, start).isoformat(),
+                        'first_date': issued.isoformat(),
+                    }
+                    members[level] = []
+                bucket['last_date'] = issued.isoformat()
+                members[level].append(eo_id)
+
+        for level in TIMELINE_LEVELS:
+            close(level)
+            self.starts[level] = [bucket.pop('_start') for bucket in buckets[level]]
+            self.levels[level] = buckets[level]
+
+    def lookup(self, level, start, end):
+        """Non-empty buckets of a level that overlap the inclusive range start..end."""
+        starts = self.starts[level]
+        low = bisect_left(starts, bucket_start(level, start))
+        high = bisect_right(starts, end)
+        return self.levels[level][low:high]
+
+_build_lock = threading.Lock()
+
+def get_timeline_index():
+    """
+    Return the app's timeline index for the current dataset version.
+
+    The index is rebuilt in this process on the first request after an ingest
+    commit bumps the version.
+    """
+    version = get_dataset_version()
+    cached = current_app.extensions.get('eo_timeline')
+    if cached and cached[0] == version:
+        return cached[1]
+
+    with _build_lock:
+        cached = current_app.extensions.get('eo_timeline')
+        if cached and cached[0] == version:
+            return cached[1]
+
+        rows = ExecutiveOrder.query \
+            .with_entities(ExecutiveOrder.issuance_date, ExecutiveOrder.id) \
+            .order_by(ExecutiveOrder.issuance_date, ExecutiveOrder.id) \
+            .yield_per(1000)
+        index = TimelineIndex((row.issuance_date, row.id) for row in rows)
+        current_app.extensions['eo_timeline'] = (version, index)
+        logger.info(f"Built timeline buckets for dataset version {version}")
+        return index
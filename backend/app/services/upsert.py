@@ -0,0 +1,157 @@
+import logging
+import os
+from datetime import datetime
+from itertools import islice
+
+from sqlalchemy import select, insert, update, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from app.utils.data_transformers import compute_content_hash
+
+logger = logging.getLogger(__name__)
+
+# Records written per statement when upserting a stream of documents
+UPSERT_BATCH_SIZE = int(os.environ.get('UPSERT_BATCH_SIZE', 100))
+
+# Columns written from transformed Federal Register documents
+UPSERT_COLUMNS = (
+    'title',
+    'issuance_date',
+    'president',
+    'federal_register_citation',
+    'url',
+    'plain_language_summary',
+)
+
+def _dedupe(records):
+    """Key records by id, keeping the last occurrence of each id, and attach content hashes."""
+    rows = {}
+    for record in records:
+        if record and record.get('id'):
+            values = {column: record.get(column) for column in UPSERT_COLUMNS}
+            values['content_hash'] = compute_content_hash(values)
+            rows[record['id']] = values
+    return rows
+
+def _upsert_postgresql(session, rows):
+    """Upsert a batch with a single INSERT ... ON CONFLICT DO UPDATE statement."""
+    table = ExecutiveOrder.__table__
+    now = datetime.utcnow()
+
+    stmt = pg_insert(table).values([
+        {'id': eo_id, **values, 'created_at': now, 'updated_at': now}
+        for eo_id, values in rows.items()
+    ])
+    excluded = stmt.excluded
+
+    # Rows whose content hash matches are left untouched (and not returned)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={
+            **{column: excluded[column] for column in UPSERT_COLUMNS},
+            'content_hash': excluded.content_hash,
+            'updated_at': excluded.updated_at
+        },
+        where=table.c.content_hash.is_distinct_from(excluded.content_hash)
+    ).returning(table.c.id, literal_column('(xmax = 0)').label('inserted'))
+
+    written = session.execute(stmt).all()
+    new_count = sum(1 for row in written if row.inserted)
+
+    return {
+        'new': new_count,
+        'updated': len(written) - new_count,
+        'unchanged': len(rows) - len(written)
+    }
+
+def _upsert_generic(session, rows):
+    """Upsert a batch with one lookup, one bulk insert and one bulk update."""
+    table = ExecutiveOrder.__table__
+    now = datetime.utcnow()
+
+    existing = {
+        row.id: row.content_hash
+        for row in session.execute(
+            select(table.c.id, table.c.content_hash).where(table.c.id.in_(list(rows)))
+        )
+    }
+
+    new_rows = []
+    changed_rows = []
+    for eo_id, values in rows.items():
+        if eo_id not in existing:
+            new_rows.append({'id': eo_id, **values, 'created_at': now, 'updated_at': now})
+        elif existing[eo_id] != values['content_hash']:
+            changed_rows.append({'id': eo_id, **values, 'updated_at': now})
+
+    if new_rows:
+        session.execute(insert(table), new_rows)
+    if changed_rows:
+        # ORM bulk UPDATE by primary key: one executemany for the whole batch
+        session.execute(update(ExecutiveOrder), changed_rows)
+
+    return {
+        'new': len(new_rows),
+        'updated': len(changed_rows),
+        'unchanged': len(rows) - len(new_rows) - len(changed_rows)
+    }
+
+def upsert_executive_orders(records, session=None):
+    """
+    Insert or update a batch of transformed executive orders.
+
+    Uses INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and a lookup plus bulk
+    insert/update elsewhere (e.g. SQLite in tests). Rows whose content hash has
+    not changed are not written, so their updated_at is left alone. The caller
+    is responsible for committing.
+
+    Args:
+        records (iterable): Dictionaries from transform_federal_register_document_to_model
+        session (Session, optional): Session to use. Defaults to db.session.
+
+    Returns:
+        dict: Counts of 'new', 'updated' and 'unchanged' records
+    """
+    session = session or db.session
+    rows = _dedupe(records)
+
+    if not rows:
+        return {'new': 0, 'updated': 0, 'unchanged': 0}
+
+    if session.get_bind().dialect.name == 'postgresql':
+        counts = _upsert_postgresql(session, rows)
+    else:
+        counts = _upsert_generic(session, rows)
+
+    logger.info(f"Upserted {len(rows)} executive orders: {counts}")
+    return counts
+
+def upsert_executive_orders_in_batches(records, batch_size=None, session=None):
+    """
+    Upsert an iterable of transformed executive orders in fixed-size batches.
+
+    Records are pulled from the iterable lazily, so a generator over a streamed
+    API response is never held in memory in full. The caller is responsible for
+    committing.
+
+    Args:
+        records (iterable): Dictionaries from transform_federal_register_document_to_model
+        batch_size (int, optional): Records per upsert. Defaults to UPSERT_BATCH_SIZE.
+        session (Session, optional): Session to use. Defaults to db.session.
+
+    Returns:
+        dict: Counts of 'new', 'updated' and 'unchanged' records
+    """
+    batch_size = max(1, batch_size or UPSERT_BATCH_SIZE)
+    totals = {'new': 0, 'updated': 0, 'unchanged': 0}
+    records = iter(records)
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            return totals
+        counts = upsert_executive_orders(batch, session=session)
+        for key in totals:
+            totals[key] += counts[key]
@@ -0,0 +1,131 @@
+import base64
+import hashlib
+import json
+import logging
+from functools import wraps
+
+from flask import current_app, request
+
+from app.services.cache import get_cache, get_dataset_version
+from app.utils.compression import (
+    compress,
+    enabled_encodings,
+    etag_variants,
+    is_compressible,
+    negotiate_encoding,
+    set_encoded_body,
+)
+from app.utils.http import apply_cache_headers, not_modified
+
+logger = logging.getLogger(__name__)
+
+# Responses worth serving again until the next ingest; errors are always recomputed
+CACHEABLE_STATUS_CODES = (200, 404)
+
+def _view_digest(params):
+    """Hash the dataset version, endpoint, URL arguments and normalized query parameters."""
+    args = sorted(
+        (key, value) for key, value in request.args.items(multi=True)
+        if params is None or key in params
+    )
+    view_args = sorted((request.view_args or {}).items())
+    raw = json.dumps([get_dataset_version(), request.endpoint, view_args, args], separators=(',', ':'), default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def _with_validators(response, digest):
+    """Add the ETag and Cache-Control headers to successful responses."""
+    if response.status_code == 200:
+        apply_cache_headers(response, digest)
+    return response
+
+def _precompress(response):
+    """Compress a cacheable body once for every enabled encoding."""
+    if not is_compressible(response):
+        return {}
+    body = response.get_data()
+    return {encoding: compress(body, encoding) for encoding in enabled_encodings()}
+
+def _apply_encoding(response, encoded):
+    """Serve the precompressed variant the client accepts, if there is one."""
+    encoding = negotiate_encoding(list(encoded))
+    if encoding:
+        set_encoded_body(response, encoded[encoding], encoding)
+    return response
+
+def cached_view(params=None, timeout=None):
+    """
+    Serve a read-only view with validators and a response cache keyed on the dataset version.
+
+    The view's identity is a digest of the dataset version, endpoint, URL
+    arguments and query parameters (sorted, and limited to `params` when given
+    so unrelated parameters don't fragment the cache). The digest is used:
+
+    - as a strong ETag, so a matching If-None-Match gets a 304 before the view
+      runs, with no query or serialization;
+    - as the response cache key, so repeated requests skip the database.
+
+    Ingest commits bump the dataset version, which changes every digest at once.
+    The version is read from the database rather than the cache, so a flushed
+    cache cannot bring back a version (and with it ETags) already issued for
+    other data. Each process reuses the version it last read for
+    DATASET_VERSION_TTL seconds, so hits and 304s normally run no query at all.
+    Successful responses get the API_CACHE_CONTROL header, and responses carry
+    an X-Cache header of HIT or MISS while the response cache is enabled.
+
+    Bodies large enough to compress are compressed once per enabled encoding
+    when first cached, and hits are served from those variants without
+    recompressing.
+
+    Args:
+        params (iterable, optional): Query parameters the view reads
+        timeout (int, optional): Entry lifetime in seconds. Defaults to RESPONSE_CACHE_TIMEOUT.
+    """
+    params = frozenset(params) if params is not None else None
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            digest = _view_digest(params)
+
+            # Clients may hold the identity ETag or an encoding-specific one
+            for etag in etag_variants(digest):
+                if request.if_none_match.contains(etag):
+                    return not_modified(etag)
+
+            if not current_app.config.get('RESPONSE_CACHE_ENABLED', True):
+                response = current_app.make_response(view(*args, **kwargs))
+                return _with_validators(response, digest)
+
+            cache = get_cache()
+            key = f"view:{digest}"
+
+            entry = cache.get(key)
+            if entry:
+                response = current_app.response_class(entry['body'], status=entry['status'], mimetype=entry['mimetype'])
+                response.headers['X-Cache'] = 'HIT'
+                encoded = {
+                    encoding: base64.b64decode(body)
+                    for encoding, body in entry.get('encoded', {}).items()
+                }
+                return _apply_encoding(_with_validators(response, digest), encoded)
+
+            response = current_app.make_response(view(*args, **kwargs))
+            encoded = {}
+            if response.status_code in CACHEABLE_STATUS_CODES:
+                encoded = _precompress(response)
+                cache.set(key, {
+                    'body': response.get_data(as_text=True),
+                    'status': response.status_code,
+                    'mimetype': response.mimetype,
+                    # Base64 keeps entries JSON-serializable for the Redis backend
+                    'encoded': {
+                        encoding: base64.b64encode(body).decode('ascii')
+                        for encoding, body in encoded.items()
+                    }
+                }, timeout=timeout or current_app.config.get('RESPONSE_CACHE_TIMEOUT'))
+            response.headers['X-Cache'] = 'MISS'
+            return _apply_encoding(_with_validators(response, digest), encoded)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,102 @@
+import gzip
+import logging
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Encodings the server can produce, in order of preference when the client accepts several equally
+SUPPORTED_ENCODINGS = ('br', 'gzip')
+
+def enabled_encodings(app=None):
+    """Return the configured encodings this process can produce, in preference order."""
+    app = app or current_app
+    if not app.config.get('COMPRESSION_ENABLED', True):
+        return []
+
+    configured = [enc.strip() for enc in app.config.get('COMPRESSION_ALGORITHMS', 'br,gzip').split(',')]
+    return [enc for enc in configured if enc in SUPPORTED_ENCODINGS and (enc != 'br' or brotli is not None)]
+
+def negotiate_encoding(encodings=None):
+    """
+    Pick the encoding for the current request from Accept-Encoding.
+
+    Returns:
+        str or None: The client's highest-quality encoding we support, or None
+    """
+    encodings = enabled_encodings() if encodings is None else encodings
+    best, best_quality = None, 0
+    for encoding in encodings:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+def is_compressible(response):
+    """Whether a response's type and size make it worth compressing."""
+    return (
+        response.mimetype in current_app.config.get('COMPRESSION_MIMETYPES', ('application/json',))
+        and response.content_length is not None
+        and response.content_length >= current_app.config.get('COMPRESSION_MIN_SIZE', 1024)
+    )
+
+def compress(body, encoding, app=None):
+    """Compress a body with the configured level for the encoding."""
+    app = app or current_app
+    if encoding == 'br':
+        return brotli.compress(body, quality=app.config.get('COMPRESSION_BROTLI_QUALITY', 4))
+    if encoding == 'gzip':
+        # mtime=0 keeps the output, and therefore the ETag's meaning, deterministic
+        return gzip.compress(body, compresslevel=app.config.get('COMPRESSION_GZIP_LEVEL', 6), mtime=0)
+    raise ValueError(f"Unsupported encoding '{encoding}'")
+
+def etag_variants(etag):
+    """ETags a client may hold for a resource: identity plus one per content coding."""
+    return [etag] + [f"{etag}-{encoding}" for encoding in SUPPORTED_ENCODINGS]
+
+def set_encoded_body(response, body, encoding):
+    """
+    Replace a response body with an already-encoded one.
+
+    The strong ETag gets an encoding suffix, since the encoded bytes are a
+    different representation.
+    """
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{encoding}", weak)
+    return response
+
+def compress_response(response):
+    """after_request hook: compress eligible responses for clients that accept it."""
+    if (
+        response.status_code < 200
+        or response.status_code in (204, 206, 304)
+        or response.direct_passthrough
+        or response.is_streamed
+        or 'Content-Encoding' in response.headers
+        or not is_compressible(response)
+    ):
+        return response
+
+    # Caches must key on Accept-Encoding whether or not this client gets compression
+    response.vary.add('Accept-Encoding')
+
+    encoding = negotiate_encoding()
+    if encoding:
+        set_encoded_body(response, compress(response.get_data(), encoding), encoding)
+    return response
+
+def init_compression(app):
+    """Register response compression for the app."""
+    if app.config.get('COMPRESSION_ENABLED', True) and 'br' in app.config.get('COMPRESSION_ALGORITHMS', '') and brotli is None:
+        logger.warning("brotli is not installed; responses will be compressed with gzip only")
+    app.after_request(compress_response)
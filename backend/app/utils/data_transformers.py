@@ -1,4 +1,6 @@
 import re
+import json
+import hashlib
 from datetime import datetime, date
 import logging
 
@@ -66,6 +68,24 @@ def transform_federal_register_document_to_model(document):
     
     return result
 
+def compute_content_hash(record):
+    """
+    Compute a stable hash of a transformed document's content.
+    
+    Args:
+        record (dict): Output of transform_federal_register_document_to_model
+        
+    Returns:
+        str: Hex SHA-256 digest of every field except the ID
+    """
+    content = {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in record.items()
+        if key not in ('id', 'content_hash')
+    }
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
 def transform_federal_register_response(response):
     """
     Transform an entire Federal Register API response to a list of model-compatible dictionaries.
@@ -1,6 +1,8 @@
-from flask import jsonify
+from flask import jsonify, current_app
 import logging
 
+from app.utils.compression import enabled_encodings
+
 logger = logging.getLogger(__name__)
 
 def error_response(status_code, message=None, error_type=None):
@@ -28,24 +30,65 @@ def success_response(data=None, message=None, status_code=200):
     
     return jsonify(payload), status_code
 
-def paginated_response(items, page, per_page, total):
-    """Create a standardized paginated response."""
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 0
+def paginated_response(items, page, per_page, total, next_cursor=None):
+    """
+    Create a standardized paginated response.
+    
+    Pass page=None for keyset (cursor) pages, which have no absolute position,
+    and total=None when counting was skipped; has_next is then driven by
+    next_cursor alone.
+    """
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = (total + per_page - 1) // per_page if total > 0 else 0
+    
+    pagination = {
+        'page': page,
+        'per_page': per_page,
+        'total_items': total,
+        'total_pages': total_pages,
+        'next_cursor': next_cursor
+    }
+    
+    if page is None or total_pages is None:
+        pagination['has_next'] = next_cursor is not None
+    else:
+        pagination['has_next'] = page < total_pages
+    
+    if page is not None:
+        pagination['has_prev'] = page > 1
     
     payload = {
         'items': items,
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total_items': total,
-            'total_pages': total_pages,
-            'has_next': page < total_pages,
-            'has_prev': page > 1
-        }
+        'pagination': pagination
     }
     
     return jsonify(payload), 200
 
+def apply_cache_headers(response, etag=None, cache_control=None):
+    """
+    Add a strong ETag and a Cache-Control header to a response.
+    
+    cache_control defaults to the API_CACHE_CONTROL setting.
+    """
+    if etag:
+        response.set_etag(etag)
+    
+    cache_control = cache_control or current_app.config.get('API_CACHE_CONTROL')
+    if cache_control:
+        response.headers['Cache-Control'] = cache_control
+    
+    return response
+
+def not_modified(etag, cache_control=None):
+    """Return an empty 304 Not Modified response carrying the validators."""
+    response = current_app.response_class(status=304)
+    # A 304 must vary like the 200 it revalidates, or caches may reuse it across encodings
+    if enabled_encodings():
+        response.vary.add('Accept-Encoding')
+    return apply_cache_headers(response, etag, cache_control)
+
 def bad_request(message):
     """Return a 400 Bad Request error."""
     return error_response(400, message, "BadRequest")
@@ -0,0 +1,75 @@
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+import logging
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+def _iso_default(o):
+    """Serialize dates and datetimes as ISO 8601 strings, like ExecutiveOrder.to_dict()."""
+    if isinstance(o, date):
+        return o.isoformat()
+    return DefaultJSONProvider.default(o)
+
+class IsoJSONProvider(DefaultJSONProvider):
+    """
+    The stock JSON provider, but with ISO 8601 dates instead of HTTP dates.
+
+    Lets views return date columns as-is and still match to_dict() output.
+    """
+    default = staticmethod(_iso_default)
+
+class OrjsonProvider(IsoJSONProvider):
+    """
+    JSON provider backed by orjson.
+
+    orjson serializes dicts, lists, strings and dates in C, several times faster
+    than the standard library on large list responses. Dates and datetimes come
+    out in the same ISO 8601 form as to_dict(); other types fall back to the
+    stock provider's handling.
+    """
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get('indent') is not None)).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+JSON_PROVIDERS = {
+    'orjson': OrjsonProvider,
+    'default': IsoJSONProvider,
+}
+
+def init_json_provider(app):
+    """
+    Install the JSON provider named by the JSON_PROVIDER setting.
+
+    Falls back to the standard library provider when orjson is not installed.
+    """
+    name = app.config.get('JSON_PROVIDER', 'orjson')
+    if name not in JSON_PROVIDERS:
+        raise ValueError(f"Unknown JSON_PROVIDER '{name}'. Valid options are: {', '.join(JSON_PROVIDERS)}")
+
+    if name == 'orjson' and orjson is None:
+        logger.warning("orjson is not installed; using the standard library JSON provider")
+        name = 'default'
+
+    app.json = JSON_PROVIDERS[name](app)
@@ -0,0 +1,87 @@
+import base64
+import json
+from datetime import date, datetime
+
+from sqlalchemy import and_, or_
+
+# Columns whose cursor values must be round-tripped through ISO strings
+DATE_SORT_FIELDS = {'issuance_date'}
+DATETIME_SORT_FIELDS = {'updated_at'}
+
+def encode_cursor(sort_field, sort_order, value, last_id):
+    """
+    Encode the position after a row as an opaque keyset cursor.
+
+    Args:
+        sort_field (str): Field the listing is sorted by
+        sort_order (str): 'asc' or 'desc'
+        value: Value of the sort field on the last row returned
+        last_id (str): Primary key of the last row returned
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    if isinstance(value, date):
+        value = value.isoformat()
+
+    payload = {'s': sort_field, 'o': sort_order, 'v': value, 'id': last_id}
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, sort_field, sort_order):
+    """
+    Decode a keyset cursor produced by encode_cursor.
+
+    Args:
+        cursor (str): Cursor token from a previous response
+        sort_field (str): Sort field of the current request
+        sort_order (str): Sort order of the current request
+
+    Returns:
+        tuple: (value, last_id) to resume after
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different sort
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        value = payload['v']
+        last_id = payload['id']
+        cursor_sort = payload['s']
+        cursor_order = payload['o']
+    except (ValueError, TypeError, KeyError, UnicodeError) as e:
+        raise ValueError(f"Malformed cursor: {str(e)}")
+
+    if cursor_sort != sort_field or cursor_order != sort_order:
+        raise ValueError("Cursor was issued for a different sort field or order")
+
+    if not isinstance(last_id, str):
+        raise ValueError("Malformed cursor: invalid id")
+
+    if sort_field in DATE_SORT_FIELDS:
+        try:
+            value = date.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise ValueError("Malformed cursor: invalid date value")
+    elif sort_field in DATETIME_SORT_FIELDS:
+        try:
+            value = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
+            raise ValueError("Malformed cursor: invalid datetime value")
+
+    return value, last_id
+
+def keyset_filter(sort_column, id_column, value, last_id, sort_order):
+    """
+    Build the predicate selecting rows strictly after (value, last_id).
+
+    Written as an OR of range comparisons rather than a row-value comparison so that
+    it works on every supported database and can use a (sort_column, id) index.
+    """
+    if sort_column is id_column:
+        return id_column > last_id if sort_order == 'asc' else id_column < last_id
+
+    if sort_order == 'asc':
+        return or_(sort_column > value, and_(sort_column == value, id_column > last_id))
+    return or_(sort_column < value, and_(sort_column == value, id_column < last_id))
@@ -17,10 +17,44 @@ class Config:
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
     CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
     
+    # Ingest settings (HISTORICAL_FETCH_CONCURRENCY, FEDERAL_REGISTER_*, UPSERT_BATCH_SIZE) are
+    # read from the environment by the ingest modules themselves, because the Celery worker
+    # runs them without a Flask app; see .env.example
+    
+    # Cache settings ('memory' is per-process, 'redis' is shared; either way entries are keyed
+    # by the dataset version stored in the database, so ingest in any process retires them)
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'memory')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', CELERY_BROKER_URL)
+    CACHE_DEFAULT_TIMEOUT = int(os.environ.get('CACHE_DEFAULT_TIMEOUT', 3600))
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    
+    # Read endpoint response cache (entries are retired by every ingest commit, in any process)
+    RESPONSE_CACHE_ENABLED = os.environ.get('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true'
+    RESPONSE_CACHE_TIMEOUT = int(os.environ.get('RESPONSE_CACHE_TIMEOUT', 3600))
+    
+    # Cache-Control sent with successful read responses (clients and CDNs revalidate with the ETag)
+    API_CACHE_CONTROL = os.environ.get('API_CACHE_CONTROL', 'public, max-age=60')
+    
     # API settings
     API_TITLE = 'Executive Orders Archive API'
     API_VERSION = 'v1'
     
+    # Response compression (negotiated from Accept-Encoding; 'br' needs the brotli package)
+    COMPRESSION_ENABLED = os.environ.get('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    COMPRESSION_ALGORITHMS = os.environ.get('COMPRESSION_ALGORITHMS', 'br,gzip')
+    COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6))
+    COMPRESSION_BROTLI_QUALITY = int(os.environ.get('COMPRESSION_BROTLI_QUALITY', 4))
+    COMPRESSION_MIMETYPES = ('application/json',)
+    
+    # Search backend: 'database' (PostgreSQL tsvector or SQLite FTS5) or 'memory' (in-process
+    # inverted index, loaded from SEARCH_INDEX_SNAPSHOT if present, else built on first search)
+    SEARCH_BACKEND = os.environ.get('SEARCH_BACKEND', 'database')
+    SEARCH_INDEX_SNAPSHOT = os.environ.get('SEARCH_INDEX_SNAPSHOT', '')
+    
+    # JSON serializer for responses: 'orjson' (falls back to 'default' if not installed) or 'default'
+    JSON_PROVIDER = os.environ.get('JSON_PROVIDER', 'orjson')
+    
     # Logging configuration
     LOG_LEVEL = 'INFO'
 
@@ -42,6 +76,9 @@ class TestingConfig(Config):
     
     # Disable CSRF tokens in testing
     WTF_CSRF_ENABLED = False
+    
+    # Keep caches in-process so tests never need Redis
+    CACHE_BACKEND = 'memory'
 
 class ProductionConfig(Config):
     """Production configuration."""
@@ -0,0 +1,35 @@
+"""Create executive_orders table
+
+Revision ID: 3f1c2a7d9b10
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a7d9b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('executive_orders',
+    sa.Column('id', sa.String(length=20), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('issuance_date', sa.Date(), nullable=False),
+    sa.Column('president', sa.String(length=100), nullable=False),
+    sa.Column('federal_register_citation', sa.String(length=50), nullable=True),
+    sa.Column('url', sa.String(length=255), nullable=True),
+    sa.Column('plain_language_summary', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('executive_orders')
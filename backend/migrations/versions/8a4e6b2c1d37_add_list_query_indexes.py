@@ -0,0 +1,28 @@
+"""Add composite indexes for list queries
+
+Revision ID: 8a4e6b2c1d37
+Revises: 3f1c2a7d9b10
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a4e6b2c1d37'
+down_revision = '3f1c2a7d9b10'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('executive_orders', schema=None) as batch_op:
+        batch_op.create_index('ix_executive_orders_president_issuance_date_id', ['president', 'issuance_date', 'id'], unique=False)
+        batch_op.create_index('ix_executive_orders_issuance_date_id', ['issuance_date', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('executive_orders', schema=None) as batch_op:
+        batch_op.drop_index('ix_executive_orders_issuance_date_id')
+        batch_op.drop_index('ix_executive_orders_president_issuance_date_id')
@@ -0,0 +1,67 @@
+"""Add executive order tombstones and updated_at index for the change feed
+
+Revision ID: a1f6d8e2c4b9
+Revises: e4a9c3b7f2d8
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1f6d8e2c4b9'
+down_revision = 'e4a9c3b7f2d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('executive_order_tombstones',
+    sa.Column('id', sa.String(length=20), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_executive_order_tombstones_deleted_at_id', 'executive_order_tombstones', ['deleted_at', 'id'], unique=False)
+
+    # Rows from before updated_at had a default would otherwise never appear in the feed
+    op.execute("UPDATE executive_orders SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL")
+    # Plain CREATE INDEX: a batch table rebuild on SQLite would drop the search and tombstone triggers
+    op.create_index('ix_executive_orders_updated_at_id', 'executive_orders', ['updated_at', 'id'], unique=False)
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("""
+            CREATE OR REPLACE FUNCTION record_executive_order_tombstone() RETURNS trigger AS $$
+            BEGIN
+                INSERT INTO executive_order_tombstones (id, deleted_at)
+                VALUES (OLD.id, timezone('utc', clock_timestamp()))
+                ON CONFLICT (id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+                RETURN OLD;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute("""
+            CREATE TRIGGER executive_orders_tombstone AFTER DELETE ON executive_orders
+            FOR EACH ROW EXECUTE FUNCTION record_executive_order_tombstone()
+        """)
+    elif bind.dialect.name == 'sqlite':
+        op.execute("""
+            CREATE TRIGGER executive_orders_tombstone AFTER DELETE ON executive_orders BEGIN
+                INSERT OR REPLACE INTO executive_order_tombstones (id, deleted_at)
+                VALUES (old.id, strftime('%Y-%m-%d %H:%M:%f', 'now') || '000');
+            END
+        """)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP TRIGGER IF EXISTS executive_orders_tombstone ON executive_orders")
+        op.execute("DROP FUNCTION IF EXISTS record_executive_order_tombstone()")
+    elif bind.dialect.name == 'sqlite':
+        op.execute("DROP TRIGGER IF EXISTS executive_orders_tombstone")
+
+    op.drop_index('ix_executive_orders_updated_at_id', table_name='executive_orders')
+    op.drop_index('ix_executive_order_tombstones_deleted_at_id', table_name='executive_order_tombstones')
+    op.drop_table('executive_order_tombstones')
@@ -0,0 +1,37 @@
+"""Create dataset_version table
+
+Revision ID: b3d5f7a9c1e2
+Revises: f2c8a4d6e1b3
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+import time
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d5f7a9c1e2'
+down_revision = 'f2c8a4d6e1b3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dataset_version = op.create_table('dataset_version',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # Start above any version the cache-held counter handed out, so ETags and
+    # cache keys issued before the upgrade can never match again
+    op.bulk_insert(dataset_version, [
+        {'id': 1, 'version': int(time.time()), 'updated_at': datetime.utcnow()},
+    ])
+
+
+def downgrade():
+    op.drop_table('dataset_version')
@@ -0,0 +1,27 @@
+"""Add content_hash to executive_orders
+
+Revision ID: c52d7e91a4f6
+Revises: 8a4e6b2c1d37
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52d7e91a4f6'
+down_revision = '8a4e6b2c1d37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows start without a hash and are rewritten once on their next ingest
+    with op.batch_alter_table('executive_orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('executive_orders', schema=None) as batch_op:
+        batch_op.drop_column('content_hash')
@@ -0,0 +1,29 @@
+"""Add indexes for sorting by title and president
+
+Revision ID: c7e9a1b3d5f8
+Revises: b3d5f7a9c1e2
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e9a1b3d5f8'
+down_revision = 'b3d5f7a9c1e2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Keyset pages sorted by title or president order by (column, id); without these
+    # indexes every page scans the table and sorts it. Plain CREATE INDEX: a batch
+    # table rebuild on SQLite would drop the search and tombstone triggers.
+    op.create_index('ix_executive_orders_title_id', 'executive_orders', ['title', 'id'], unique=False)
+    op.create_index('ix_executive_orders_president_id', 'executive_orders', ['president', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_executive_orders_president_id', table_name='executive_orders')
+    op.drop_index('ix_executive_orders_title_id', table_name='executive_orders')
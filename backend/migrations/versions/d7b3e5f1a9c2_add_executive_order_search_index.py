@@ -0,0 +1,69 @@
+"""Add full-text search index on executive order titles and summaries
+
+Revision ID: d7b3e5f1a9c2
+Revises: c52d7e91a4f6
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b3e5f1a9c2'
+down_revision = 'c52d7e91a4f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        # Stored generated column: PostgreSQL keeps it current on every write
+        op.execute("""
+            ALTER TABLE executive_orders ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(plain_language_summary, '')), 'B')
+            ) STORED
+        """)
+        op.execute("CREATE INDEX ix_executive_orders_search_vector ON executive_orders USING gin (search_vector)")
+    elif bind.dialect.name == 'sqlite':
+        op.execute("""
+            CREATE VIRTUAL TABLE executive_orders_fts USING fts5(
+                id UNINDEXED, title, plain_language_summary, tokenize='porter unicode61'
+            )
+        """)
+        op.execute("""
+            CREATE TRIGGER executive_orders_fts_ai AFTER INSERT ON executive_orders BEGIN
+                INSERT INTO executive_orders_fts (id, title, plain_language_summary)
+                VALUES (new.id, new.title, new.plain_language_summary);
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER executive_orders_fts_ad AFTER DELETE ON executive_orders BEGIN
+                DELETE FROM executive_orders_fts WHERE id = old.id;
+            END
+        """)
+        op.execute("""
+            CREATE TRIGGER executive_orders_fts_au AFTER UPDATE OF id, title, plain_language_summary ON executive_orders BEGIN
+                DELETE FROM executive_orders_fts WHERE id = old.id;
+                INSERT INTO executive_orders_fts (id, title, plain_language_summary)
+                VALUES (new.id, new.title, new.plain_language_summary);
+            END
+        """)
+        op.execute("""
+            INSERT INTO executive_orders_fts (id, title, plain_language_summary)
+            SELECT id, title, plain_language_summary FROM executive_orders
+        """)
+
+
+def downgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS ix_executive_orders_search_vector")
+        op.execute("ALTER TABLE executive_orders DROP COLUMN IF EXISTS search_vector")
+    elif bind.dialect.name == 'sqlite':
+        for trigger in ('executive_orders_fts_au', 'executive_orders_fts_ad', 'executive_orders_fts_ai'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS executive_orders_fts")
@@ -0,0 +1,68 @@
+"""Key the SQLite full-text search table by executive_orders rowid
+
+Revision ID: d9f2b4c6e8a1
+Revises: c7e9a1b3d5f8
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9f2b4c6e8a1'
+down_revision = 'c7e9a1b3d5f8'
+branch_labels = None
+depends_on = None
+
+TRIGGERS = ('executive_orders_fts_au', 'executive_orders_fts_ad', 'executive_orders_fts_ai')
+
+
+def _recreate(key):
+    # key is 'rowid' (FTS rows share executive_orders' rowid) or 'id' (FTS rows are found by order id)
+    for trigger in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS executive_orders_fts")
+
+    op.execute("""
+        CREATE VIRTUAL TABLE executive_orders_fts USING fts5(
+            id UNINDEXED, title, plain_language_summary, tokenize='porter unicode61'
+        )
+    """)
+    if key == 'rowid':
+        columns, new_values, old_match = 'rowid, id', 'new.rowid, new.id', 'rowid = old.rowid'
+    else:
+        columns, new_values, old_match = 'id', 'new.id', 'id = old.id'
+    op.execute(f"""
+        CREATE TRIGGER executive_orders_fts_ai AFTER INSERT ON executive_orders BEGIN
+            INSERT INTO executive_orders_fts ({columns}, title, plain_language_summary)
+            VALUES ({new_values}, new.title, new.plain_language_summary);
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER executive_orders_fts_ad AFTER DELETE ON executive_orders BEGIN
+            DELETE FROM executive_orders_fts WHERE {old_match};
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER executive_orders_fts_au AFTER UPDATE OF id, title, plain_language_summary ON executive_orders BEGIN
+            DELETE FROM executive_orders_fts WHERE {old_match};
+            INSERT INTO executive_orders_fts ({columns}, title, plain_language_summary)
+            VALUES ({new_values}, new.title, new.plain_language_summary);
+        END
+    """)
+    op.execute(f"""
+        INSERT INTO executive_orders_fts ({columns}, title, plain_language_summary)
+        SELECT {columns}, title, plain_language_summary FROM executive_orders
+    """)
+
+
+def upgrade():
+    # PostgreSQL's search_vector column is unaffected
+    if op.get_bind().dialect.name == 'sqlite':
+        _recreate('rowid')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'sqlite':
+        _recreate('id')
@@ -0,0 +1,34 @@
+"""Create executive_order_neighbors table
+
+Revision ID: e4a9c3b7f2d8
+Revises: d7b3e5f1a9c2
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4a9c3b7f2d8'
+down_revision = 'd7b3e5f1a9c2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Filled by the refresh_related_orders task after the next ingest (or run it with full=True)
+    op.create_table('executive_order_neighbors',
+    sa.Column('eo_id', sa.String(length=20), nullable=False),
+    sa.Column('rank', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('neighbor_id', sa.String(length=20), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['eo_id'], ['executive_orders.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['neighbor_id'], ['executive_orders.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('eo_id', 'rank')
+    )
+
+
+def downgrade():
+    op.drop_table('executive_order_neighbors')
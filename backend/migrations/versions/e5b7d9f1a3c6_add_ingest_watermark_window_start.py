@@ -0,0 +1,26 @@
+"""Record the window start of the run that set each ingest watermark
+
+Revision ID: e5b7d9f1a3c6
+Revises: d9f2b4c6e8a1
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b7d9f1a3c6'
+down_revision = 'd9f2b4c6e8a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Unknown for watermarks set before this column existed
+    op.add_column('ingest_watermarks', sa.Column('last_window_start', sa.Date(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('ingest_watermarks') as batch_op:
+        batch_op.drop_column('last_window_start')
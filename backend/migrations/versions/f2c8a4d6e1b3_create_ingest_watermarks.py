@@ -0,0 +1,31 @@
+"""Create ingest_watermarks table
+
+Revision ID: f2c8a4d6e1b3
+Revises: a1f6d8e2c4b9
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8a4d6e1b3'
+down_revision = 'a1f6d8e2c4b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Empty until the first complete incremental run, which falls back to a fixed window
+    op.create_table('ingest_watermarks',
+    sa.Column('source', sa.String(length=50), nullable=False),
+    sa.Column('last_publication_date', sa.Date(), nullable=False),
+    sa.Column('last_document_number', sa.String(length=50), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('source')
+    )
+
+
+def downgrade():
+    op.drop_table('ingest_watermarks')
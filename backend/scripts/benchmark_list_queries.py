@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+import os
+import sys
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select, desc, extract, text
+from app.models.executive_order import ExecutiveOrder
+from app.utils.pagination import keyset_filter
+
+PRESIDENTS = [
+    'William J. Clinton',
+    'George W. Bush',
+    'Barack Obama',
+    'Donald J. Trump',
+    'Joseph R. Biden Jr.',
+]
+
+def build_table(engine, rows, seed=42):
+    """Create the executive_orders table without indexes and fill it with synthetic rows."""
+    table = ExecutiveOrder.__table__
+    table.drop(engine, checkfirst=True)
+    table.create(engine)
+    for index in table.indexes:
+        index.drop(engine)
+
+    rng = random.Random(seed)
+    start = date(1994, 1, 1)
+    span = (date(2025, 12, 31) - start).days
+    now = datetime.utcnow()
+
+    batch = []
+    with engine.begin() as conn:
+        for i in range(rows):
+            issued = start + timedelta(days=rng.randrange(span))
+            batch.append({
+                'id': f"EO-{100000 + i}",
+                'title': f"Synthetic Executive Order {i}",
+                'issuance_date': issued,
+                'president': PRESIDENTS[min((issued.year - 1994) // 8, len(PRESIDENTS) - 1)],
+                'federal_register_citation': f"{issued.year - 1935} FR {rng.randrange(1, 90000)}",
+                'url': f"https://www.federalregister.gov/documents/synthetic/{i}",
+                'plain_language_summary': None,
+                'created_at': now,
+                'updated_at': now,
+            })
+            if len(batch) >= 5000:
+                conn.execute(table.insert(), batch)
+                batch = []
+        if batch:
+            conn.execute(table.insert(), batch)
+
+        if engine.dialect.name == 'postgresql':
+            conn.execute(text('ANALYZE executive_orders'))
+
+def create_indexes(engine):
+    """Create the indexes declared on the ExecutiveOrder model."""
+    for index in ExecutiveOrder.__table__.indexes:
+        index.create(engine)
+    if engine.dialect.name == 'postgresql':
+        with engine.begin() as conn:
+            conn.execute(text('ANALYZE executive_orders'))
+    else:
+        with engine.begin() as conn:
+            conn.execute(text('ANALYZE'))
+
+def year_filter_extract(year):
+    return extract('year', ExecutiveOrder.issuance_date) == year
+
+def year_filter_range(year):
+    return (ExecutiveOrder.issuance_date >= date(year, 1, 1)) & (ExecutiveOrder.issuance_date < date(year + 1, 1, 1))
+
+def list_queries(year_filter, year, president):
+    """Build the list endpoint's query shapes with the given year predicate."""
+    order = [desc(ExecutiveOrder.issuance_date), desc(ExecutiveOrder.id)]
+    return {
+        'year': select(ExecutiveOrder).where(year_filter(year)).order_by(*order).limit(20),
+        'president+year': select(ExecutiveOrder)
+            .where(ExecutiveOrder.president == president, year_filter(year))
+            .order_by(*order).limit(20),
+        'president (sorted)': select(ExecutiveOrder)
+            .where(ExecutiveOrder.president == president)
+            .order_by(*order).limit(20),
+        'latest': select(ExecutiveOrder).order_by(*order).limit(10),
+        # Deep keyset pages of the title and president sorts
+        'title (keyset)': select(ExecutiveOrder)
+            .where(keyset_filter(ExecutiveOrder.title, ExecutiveOrder.id, 'Synthetic Executive Order 5000', 'EO-5000', 'asc'))
+            .order_by(ExecutiveOrder.title, ExecutiveOrder.id).limit(20),
+        'president (keyset)': select(ExecutiveOrder)
+            .where(keyset_filter(ExecutiveOrder.president, ExecutiveOrder.id, president, 'EO-5000', 'desc'))
+            .order_by(desc(ExecutiveOrder.president), desc(ExecutiveOrder.id)).limit(20),
+    }
+
+def explain(engine, statement):
+    """Return the database's plan for a statement as text."""
+    compiled = statement.compile(dialect=engine.dialect, compile_kwargs={'literal_binds': True})
+    prefix = 'EXPLAIN QUERY PLAN' if engine.dialect.name == 'sqlite' else 'EXPLAIN'
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"{prefix} {compiled}").fetchall()
+    return '\n'.join('    ' + ' | '.join(str(col) for col in row) for row in rows)
+
+def time_query(engine, statement, repeat):
+    """Return the median wall time of a statement in milliseconds."""
+    timings = []
+    with engine.connect() as conn:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            conn.execute(statement).fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def run_phase(engine, label, year_filter, year, president, repeat):
+    print(f"\n=== {label}")
+    results = {}
+    for name, statement in list_queries(year_filter, year, president).items():
+        results[name] = time_query(engine, statement, repeat)
+        print(f"\n[{name}] median {results[name]:.2f} ms")
+        print(explain(engine, statement))
+    return results
+
+def main():
+    """Benchmark list query plans and latency before and after the indexes."""
+    parser = argparse.ArgumentParser(description='Benchmark executive order list queries on a synthetic table')
+    parser.add_argument('--database-url', help='Database URL (default: temporary SQLite file). The executive_orders table is dropped and recreated.')
+    parser.add_argument('--rows', type=int, default=100000, help='Number of synthetic rows (default: 100000)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per query (default: 20)')
+    parser.add_argument('--year', type=int, default=2009, help='Year to filter on (default: 2009)')
+    parser.add_argument('--president', default='Barack Obama', help='President to filter on')
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'benchmark.db')}"
+
+    engine = create_engine(database_url)
+    print(f"Building {args.rows} synthetic rows in {engine.url.render_as_string(hide_password=True)}")
+    build_table(engine, args.rows)
+
+    before = run_phase(engine, 'Before: extract(year) filter, no indexes', year_filter_extract, args.year, args.president, args.repeat)
+
+    create_indexes(engine)
+    # extract() hides the column from the planner, so the year query still scans
+    run_phase(engine, 'Indexes only: extract(year) filter', year_filter_extract, args.year, args.president, args.repeat)
+    after = run_phase(engine, 'After: date-range filter, composite indexes', year_filter_range, args.year, args.president, args.repeat)
+
+    print("\n=== Summary (median ms)")
+    for name in before:
+        speedup = before[name] / after[name] if after[name] else float('inf')
+        print(f"{name:<20} {before[name]:>10.2f} {after[name]:>10.2f}   {speedup:.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+import os
+import sys
+import argparse
+import time
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.services.inverted_index import InvertedIndex, sync_search_index
+from app.utils.logging import get_data_fetch_logger
+
+# Set up logging
+logger = get_data_fetch_logger()
+
+def build_snapshot(path):
+    """Build the in-memory search index from the database and write it to a snapshot file."""
+    app = create_app()
+    with app.app_context():
+        started = time.perf_counter()
+        index = sync_search_index(InvertedIndex())
+        index.save(path)
+        logger.info(
+            f"Wrote search index snapshot of {len(index)} orders and {len(index.postings)} terms "
+            f"to {path} in {time.perf_counter() - started:.1f}s ({os.path.getsize(path)} bytes)"
+        )
+    return index
+
+def main():
+    """Main entry point for the snapshot build script."""
+    parser = argparse.ArgumentParser(description='Build a search index snapshot for SEARCH_BACKEND=memory')
+    parser.add_argument('output', help='Snapshot file to write (point SEARCH_INDEX_SNAPSHOT at it)')
+    args = parser.parse_args()
+    
+    build_snapshot(args.output)
+
+if __name__ == '__main__':
+    main()
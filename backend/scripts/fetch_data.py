@@ -11,8 +11,11 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app import create_app
 from app.database import db
-from app.models.executive_order import ExecutiveOrder
-from app.services.federal_register_client import FederalRegisterClient
+from app.services.page_prefetcher import iter_pages, make_page_fetcher, PageFetchError
+from app.services.cache import bump_dataset_version
+from app.services.upsert import upsert_executive_orders_in_batches
+from app.services.related_orders import refresh_related_orders
+from app.services.ingest_watermark import FEDERAL_REGISTER_SOURCE, advance_watermark, incremental_start_date, observe_document
 from app.utils.data_transformers import transform_federal_register_document_to_model
 from app.utils.logging import get_data_fetch_logger
 
@@ -41,18 +44,29 @@ def load_state():
     return None
 
 def fetch_executive_orders(start_date=None, end_date=None, page_size=20, max_pages=None, resume=False):
-    """Fetch executive orders from the Federal Register API."""
+    """
+    Fetch executive orders from the Federal Register API.
+    
+    Without a start_date, fetching starts from the stored ingest watermark (less
+    INGEST_OVERLAP_DAYS), or a year back if there is none yet. The watermark is
+    advanced when every page up to the present has been stored.
+    """
     # Initialize the Flask app
     app = create_app('development')
     
     # Create a request context
     with app.app_context():
-        # Initialize API client
-        client = FederalRegisterClient()
+        if not start_date:
+            start_date = incremental_start_date(FEDERAL_REGISTER_SOURCE, default_days_back=365).isoformat()
+        logger.info(f"Starting fetch for date range: {start_date} to {end_date or 'present'}")
+        
+        # Newest (publication_date, document_number) stored this run
+        latest = None
         
         # Initialize counters
         new_count = 0
         updated_count = 0
+        unchanged_count = 0
         error_count = 0
         total_count = 0
         
@@ -67,6 +81,7 @@ def fetch_executive_orders(start_date=None, end_date=None, page_size=20, max_pag
                 current_page = state.get('current_page', 1)
                 new_count = state.get('new_count', 0)
                 updated_count = state.get('updated_count', 0)
+                unchanged_count = state.get('unchanged_count', 0)
                 error_count = state.get('error_count', 0)
                 total_count = state.get('total_count', 0)
                 logger.info(f"Resuming from page {current_page}")
@@ -78,89 +93,96 @@ def fetch_executive_orders(start_date=None, end_date=None, page_size=20, max_pag
         if end_date:
             date_params['end_date'] = end_date
         
-        # Main fetch loop
+        # Main fetch loop; after an error, each pass resumes from the failed page
         while current_page <= total_pages:
             if max_pages and current_page > max_pages:
                 logger.info(f"Reached maximum pages limit ({max_pages})")
                 break
             
             try:
-                logger.info(f"Fetching page {current_page}")
-                
-                # Make API call
-                response = client.get_executive_orders(
-                    page=current_page,
-                    per_page=page_size,
-                    **date_params
+                # Upcoming pages are fetched in the background while this one is written
+                fetch_page = make_page_fetcher(per_page=page_size, if_changed=True, stream=True, **date_params)
+                pages = iter_pages(
+                    fetch_page,
+                    start_page=current_page,
+                    last_page=max_pages
                 )
                 
-                # Update total pages
-                if 'total_pages' in response:
-                    total_pages = response['total_pages']
-                    logger.info(f"Total pages: {total_pages}")
-                
-                # Process results
-                page_new = 0
-                page_updated = 0
-                page_error = 0
-                
-                for document in response.get('results', []):
-                    try:
-                        # Transform document to our model format
-                        transformed = transform_federal_register_document_to_model(document)
-                        
-                        if not transformed or not transformed.get('id'):
-                            logger.warning(f"Skipping document with missing ID: {document.get('document_number', 'Unknown')}")
-                            continue
-                        
-                        # Check if it already exists
-                        existing = ExecutiveOrder.query.get(transformed['id'])
-                        
-                        if existing:
-                            # Update existing record
-                            for key, value in transformed.items():
-                                if key != 'id' and hasattr(existing, key):
-                                    setattr(existing, key, value)
-                            page_updated += 1
-                        else:
-                            # Create new record
-                            new_eo = ExecutiveOrder(**transformed)
-                            db.session.add(new_eo)
-                            page_new += 1
+                for page, response in pages:
+                    current_page = page
+                    
+                    # Update total pages
+                    if 'total_pages' in response:
+                        total_pages = response['total_pages']
+                        logger.info(f"Total pages: {total_pages}")
+                    
+                    # Already stored and unchanged upstream: nothing to parse or write
+                    if getattr(response, 'not_modified', False):
+                        logger.info(f"Page {current_page} not modified, skipping")
+                        continue
+                    
+                    # Stream the page's documents into bulk upserts of UPSERT_BATCH_SIZE
+                    page_error = 0
+                    
+                    def transformed_records():
+                        nonlocal page_error, latest
+                        for document in response.get('results', []):
+                            try:
+                                # Transform document to our model format
+                                transformed = transform_federal_register_document_to_model(document)
+                                
+                                if not transformed or not transformed.get('id'):
+                                    logger.warning(f"Skipping document with missing ID: {document.get('document_number', 'Unknown')}")
+                                    continue
+                                
+                            except Exception as e:
+                                logger.error(f"Error processing document: {str(e)}")
+                                page_error += 1
+                                continue
                             
-                    except Exception as e:
-                        logger.error(f"Error processing document: {str(e)}")
-                        page_error += 1
-                
-                # Commit changes for this page
-                db.session.commit()
+                            latest = observe_document(latest, document)
+                            yield transformed
+                    
+                    counts = upsert_executive_orders_in_batches(transformed_records())
+                    page_new = counts['new']
+                    page_updated = counts['updated']
+                    page_unchanged = counts['unchanged']
+                    
+                    # Commit changes for this page; only real writes invalidate cached counts
+                    db.session.commit()
+                    if page_new or page_updated:
+                        bump_dataset_version()
+                    fetch_page.confirm(current_page)
+                    
+                    # Update counters
+                    new_count += page_new
+                    updated_count += page_updated
+                    unchanged_count += page_unchanged
+                    error_count += page_error
+                    total_count = new_count + updated_count + unchanged_count
+                    
+                    logger.info(f"Page {current_page} processed: {page_new} new, {page_updated} updated, {page_unchanged} unchanged, {page_error} errors")
+                    
+                    # Save state
+                    save_state({
+                        'current_page': current_page, 
+                        'total_pages': total_pages,
+                        'new_count': new_count, 
+                        'updated_count': updated_count, 
+                        'unchanged_count': unchanged_count,
+                        'error_count': error_count,
+                        'total_count': total_count,
+                        'last_updated': datetime.utcnow().isoformat()
+                    })
                 
-                # Update counters
-                new_count += page_new
-                updated_count += page_updated
-                error_count += page_error
-                total_count = new_count + updated_count
-                
-                logger.info(f"Page {current_page} processed: {page_new} new, {page_updated} updated, {page_error} errors")
-                
-                # Save state
-                save_state({
-                    'current_page': current_page, 
-                    'total_pages': total_pages,
-                    'new_count': new_count, 
-                    'updated_count': updated_count, 
-                    'error_count': error_count,
-                    'total_count': total_count,
-                    'last_updated': datetime.utcnow().isoformat()
-                })
-                
-                # Move to next page
+                # Move past the last page processed
                 current_page += 1
                 
-                # Small delay to avoid overwhelming the API
-                time.sleep(1)
-                
             except Exception as e:
+                db.session.rollback()
+                # Resume from the page that failed, whether it failed to fetch or to save
+                if isinstance(e, PageFetchError):
+                    current_page = e.page
                 logger.error(f"Error fetching page {current_page}: {str(e)}")
                 error_count += 1
                 
@@ -170,6 +192,7 @@ def fetch_executive_orders(start_date=None, end_date=None, page_size=20, max_pag
                     'total_pages': total_pages,
                     'new_count': new_count, 
                     'updated_count': updated_count, 
+                    'unchanged_count': unchanged_count,
                     'error_count': error_count,
                     'total_count': total_count,
                     'last_error': str(e),
@@ -180,7 +203,17 @@ def fetch_executive_orders(start_date=None, end_date=None, page_size=20, max_pag
                 time.sleep(5)
         
         # Completed
-        logger.info(f"Fetch completed: {new_count} new, {updated_count} updated, {error_count} errors")
+        logger.info(f"Fetch completed: {new_count} new, {updated_count} updated, {unchanged_count} unchanged, {error_count} errors")
+        
+        # Only a run that reached the last page and the present day covers everything after the watermark
+        reached_present = not end_date or end_date >= datetime.utcnow().strftime('%Y-%m-%d')
+        if current_page > total_pages and reached_present:
+            advance_watermark(FEDERAL_REGISTER_SOURCE, latest, start_date)
+        
+        # Recompute related orders for what changed
+        if new_count or updated_count:
+            refresh_related_orders()
+        
         return total_count
 
 def main():
@@ -188,8 +221,8 @@ def main():
     parser = argparse.ArgumentParser(description='Fetch executive orders from the Federal Register API')
     parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
     parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    parser.add_argument('--days-back', type=int, default=365, help='Number of days to look back (default: 365)')
-    parser.add_argument('--page-size', type=int, default=20, help='Results per page (default: 20)')
+    parser.add_argument('--days-back', type=int, help='Number of days to look back (default: from the last ingested document)')
+    parser.add_argument('--page-size', type=int, default=200, help='Results per page (default: 200)')
     parser.add_argument('--max-pages', type=int, help='Maximum number of pages to fetch')
     parser.add_argument('--resume', action='store_true', help='Resume from last saved state')
     args = parser.parse_args()
@@ -206,8 +239,6 @@ def main():
         # Use today as the end date
         end_date = datetime.utcnow().strftime('%Y-%m-%d')
     
-    logger.info(f"Starting fetch for date range: {start_date} to {end_date}")
-    
     # Perform the fetch
     total_count = fetch_executive_orders(
         start_date=start_date,
@@ -3,6 +3,7 @@ import os
 from app import create_app
 from app.database import db as _db
 from app.models.executive_order import ExecutiveOrder
+from app.services.cache import get_cache, bump_dataset_version
 from datetime import date
 
 @pytest.fixture(scope='session')
@@ -25,17 +26,22 @@ def db(app):
 @pytest.fixture(scope='function')
 def session(db):
     """Create a new database session for each test."""
-    connection = db.engine.connect()
-    transaction = connection.begin()
-    
     session = db.session
     
     yield session
     
-    # Roll back the transaction
-    transaction.rollback()
-    connection.close()
+    # Tests and the routes under test commit through the scoped session, so a
+    # wrapping transaction cannot undo their writes; clear every table instead
+    session.rollback()
+    for table in reversed(db.metadata.sorted_tables):
+        # The dataset version only moves forward, as in production, so versions
+        # cached by app-level indexes from earlier tests never match again
+        if table.name == 'dataset_version':
+            continue
+        session.execute(table.delete())
+    session.commit()
     session.remove()
+    get_cache().clear()
 
 @pytest.fixture
 def client(app):
@@ -98,4 +104,7 @@ def sample_executive_orders(session):
     
     session.commit()
     
+    # Mirror the ingest tasks, which invalidate cached results on commit
+    bump_dataset_version()
+    
     return eos
\ No newline at end of file
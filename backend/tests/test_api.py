@@ -147,4 +147,459 @@ def test_invalid_parameters(client, sample_executive_orders):
     data = json.loads(response.data)
     
     assert response.status_code == 200  # Should correct to default
-    assert data["pagination"]["per_page"] == 20
\ No newline at end of file
+    assert data["pagination"]["per_page"] == 20
+
+def test_get_executive_orders_with_cursor(client, sample_executive_orders):
+    """Test walking executive orders with keyset cursors."""
+    seen = []
+    cursor = ""
+    
+    while cursor is not None:
+        response = client.get(f"/api/v1/executive-orders?per_page=2&cursor={cursor}")
+        data = json.loads(response.data)
+        
+        assert response.status_code == 200
+        assert data["pagination"]["page"] is None
+        assert data["pagination"]["total_items"] == 5
+        seen.extend(item["id"] for item in data["items"])
+        
+        cursor = data["pagination"]["next_cursor"]
+        assert data["pagination"]["has_next"] == (cursor is not None)
+    
+    # Every order appears exactly once, newest first with id as tie-breaker
+    assert seen == ["EO-13990", "EO-13986", "EO-13985", "EO-13984", "EO-13983"]
+
+def test_get_executive_orders_cursor_matches_offset(client, sample_executive_orders):
+    """Test that cursor pages line up with offset pages for every sort field."""
+    for sort_field in ["issuance_date", "id", "title", "president"]:
+        for order in ["asc", "desc"]:
+            base = f"/api/v1/executive-orders?per_page=2&sort={sort_field}&order={order}"
+            
+            first = json.loads(client.get(f"{base}&page=1").data)
+            second = json.loads(client.get(f"{base}&page=2").data)
+            
+            # Offset pages also hand out a cursor so clients can switch modes
+            cursor = first["pagination"]["next_cursor"]
+            assert cursor is not None
+            
+            resumed = json.loads(client.get(f"{base}&cursor={cursor}").data)
+            assert [i["id"] for i in resumed["items"]] == [i["id"] for i in second["items"]]
+
+def test_get_executive_orders_invalid_cursor(client, sample_executive_orders):
+    """Test handling of malformed or mismatched cursors."""
+    response = client.get("/api/v1/executive-orders?cursor=not-a-cursor")
+    data = json.loads(response.data)
+    
+    assert response.status_code == 400
+    assert data["error"] == True
+    
+    # A cursor issued for one sort cannot be replayed against another
+    first = json.loads(client.get("/api/v1/executive-orders?per_page=2&cursor=").data)
+    cursor = first["pagination"]["next_cursor"]
+    response = client.get(f"/api/v1/executive-orders?per_page=2&sort=title&cursor={cursor}")
+    
+    assert response.status_code == 400
+
+def test_get_executive_orders_count_modes(client, sample_executive_orders):
+    """Test the exact, estimate and none count modes."""
+    for mode in ["exact", "estimate"]:
+        response = client.get(f"/api/v1/executive-orders?per_page=2&count={mode}")
+        data = json.loads(response.data)
+        
+        assert response.status_code == 200
+        assert data["pagination"]["total_items"] == 5
+        assert data["pagination"]["total_pages"] == 3
+    
+    # Skipping the count still reports whether another page follows
+    response = client.get("/api/v1/executive-orders?per_page=2&count=none")
+    data = json.loads(response.data)
+    
+    assert response.status_code == 200
+    assert data["pagination"]["total_items"] is None
+    assert data["pagination"]["total_pages"] is None
+    assert data["pagination"]["has_next"] == True
+    
+    response = client.get("/api/v1/executive-orders?per_page=2&page=3&count=none")
+    data = json.loads(response.data)
+    
+    assert len(data["items"]) == 1
+    assert data["pagination"]["has_next"] == False
+    
+    # Invalid count mode
+    response = client.get("/api/v1/executive-orders?count=sometimes")
+    
+    assert response.status_code == 400
+
+def test_get_executive_orders_count_cache_invalidation(client, session, sample_executive_orders):
+    """Test that cached counts survive until the dataset version is bumped."""
+    from app.models.executive_order import ExecutiveOrder
+    from app.services.cache import bump_dataset_version
+    
+    url = "/api/v1/executive-orders?president=Donald J. Trump"
+    assert json.loads(client.get(url).data)["pagination"]["total_items"] == 2
+    
+    session.add(ExecutiveOrder(
+        id="EO-13982",
+        title="Establishing the President's Advisory 1776 Commission",
+        issuance_date=date(2020, 11, 2),
+        president="Donald J. Trump"
+    ))
+    session.commit()
+    
+    # Still served from the cache until ingest signals a change
+    assert json.loads(client.get(url).data)["pagination"]["total_items"] == 2
+    
+    bump_dataset_version()
+    assert json.loads(client.get(url).data)["pagination"]["total_items"] == 3
+
+def test_get_executive_orders_year_boundaries(client, session):
+    """Test that the year filter includes both ends of the year and nothing else."""
+    from app.models.executive_order import ExecutiveOrder
+    
+    for eo_id, issued in [("EO-1", date(2020, 12, 31)), ("EO-2", date(2021, 1, 1)),
+                          ("EO-3", date(2021, 12, 31)), ("EO-4", date(2022, 1, 1))]:
+        session.add(ExecutiveOrder(id=eo_id, title=eo_id, issuance_date=issued, president="Test President"))
+    session.commit()
+    
+    response = client.get("/api/v1/executive-orders?year=2021&sort=id&order=asc")
+    data = json.loads(response.data)
+    
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == ["EO-2", "EO-3"]
+    
+    # Years outside the representable date range are rejected
+    response = client.get("/api/v1/executive-orders?year=99999")
+    
+    assert response.status_code == 400
+
+def test_read_endpoints_are_cached_until_ingest(client, session, sample_executive_orders):
+    """Test that read responses are served from cache until the dataset version changes."""
+    from app.models.executive_order import ExecutiveOrder
+    from app.services.cache import bump_dataset_version
+    
+    first = client.get("/api/v1/executive-orders?year=2021&per_page=5")
+    assert first.headers["X-Cache"] == "MISS"
+    
+    # Parameter order and parameters the view ignores do not change the key
+    second = client.get("/api/v1/executive-orders?per_page=5&year=2021&utm_source=test")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.data == first.data
+    
+    detail = client.get("/api/v1/executive-orders/EO-13985")
+    assert client.get("/api/v1/executive-orders/EO-13985").headers["X-Cache"] == "HIT"
+    assert client.get("/api/v1/executive-orders/EO-13986").headers["X-Cache"] == "MISS"
+    assert client.get("/api/v1/latest-executive-orders?limit=2").headers["X-Cache"] == "MISS"
+    assert client.get("/api/v1/latest-executive-orders?limit=2").headers["X-Cache"] == "HIT"
+    
+    executive_order = session.get(ExecutiveOrder, "EO-13985")
+    executive_order.title = "Amended Title"
+    session.commit()
+    assert client.get("/api/v1/executive-orders/EO-13985").data == detail.data
+    
+    bump_dataset_version()
+    refreshed = client.get("/api/v1/executive-orders/EO-13985")
+    assert refreshed.headers["X-Cache"] == "MISS"
+    assert json.loads(refreshed.data)["data"]["title"] == "Amended Title"
+
+def test_response_cache_sees_ingest_from_other_processes(client, session, sample_executive_orders, monkeypatch):
+    """Test that a per-process memory cache is retired by a version bump committed elsewhere."""
+    from app.services import cache as cache_service
+    from sqlalchemy import text
+    
+    # Another process's bump is seen once this process's remembered version expires
+    monkeypatch.setattr(cache_service, "DATASET_VERSION_TTL", 0)
+    
+    url = "/api/v1/executive-orders/EO-13985"
+    client.get(url)
+    assert client.get(url).headers["X-Cache"] == "HIT"
+    
+    # A Celery worker or fetch_data.py never touches this process's cache, only the database
+    session.execute(text("UPDATE executive_orders SET title = 'Amended Title' WHERE id = 'EO-13985'"))
+    session.execute(text("UPDATE dataset_version SET version = version + 1"))
+    session.commit()
+    
+    response = client.get(url)
+    assert response.headers["X-Cache"] == "MISS"
+    assert json.loads(response.data)["data"]["title"] == "Amended Title"
+
+def test_error_responses_are_not_cached(client, sample_executive_orders):
+    """Test that 400 responses are recomputed while 404s are cached."""
+    assert client.get("/api/v1/executive-orders?sort=invalid").headers["X-Cache"] == "MISS"
+    assert client.get("/api/v1/executive-orders?sort=invalid").headers["X-Cache"] == "MISS"
+    
+    assert client.get("/api/v1/executive-orders/EO-99999").status_code == 404
+    missing = client.get("/api/v1/executive-orders/EO-99999")
+    assert missing.status_code == 404
+    assert missing.headers["X-Cache"] == "HIT"
+
+def test_response_cache_can_be_disabled(app, client, sample_executive_orders):
+    """Test that RESPONSE_CACHE_ENABLED=False bypasses the cache."""
+    app.config["RESPONSE_CACHE_ENABLED"] = False
+    try:
+        client.get("/api/v1/executive-orders")
+        response = client.get("/api/v1/executive-orders")
+    finally:
+        app.config["RESPONSE_CACHE_ENABLED"] = True
+    
+    assert "X-Cache" not in response.headers
+
+def test_etag_revalidation(client, sample_executive_orders):
+    """Test strong ETags, 304 responses and that ingest changes the ETag."""
+    from app.services.cache import bump_dataset_version
+    
+    url = "/api/v1/executive-orders?year=2021"
+    response = client.get(url)
+    etag = response.headers["ETag"]
+    
+    assert response.status_code == 200
+    assert not etag.startswith("W/")
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    
+    revalidated = client.get(url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.data == b""
+    assert revalidated.headers["ETag"] == etag
+    
+    # A different query has a different ETag
+    assert client.get("/api/v1/executive-orders?year=2020").headers["ETag"] != etag
+    
+    bump_dataset_version()
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+def test_cache_hits_and_revalidation_skip_the_database(app, client, sample_executive_orders):
+    """Test that a cache hit and a 304 run no SQL while the remembered dataset version is fresh."""
+    from sqlalchemy import event
+    from app.database import db
+    
+    url = "/api/v1/executive-orders?year=2021"
+    etag = client.get(url).headers["ETag"]
+    
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        assert client.get(url).headers["X-Cache"] == "HIT"
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    
+    assert statements == []
+
+def test_etag_follows_the_database_version(client, session, sample_executive_orders, monkeypatch):
+    """Test that ETags change with ingest in other processes and are not reissued after a cache flush."""
+    from app.services import cache as cache_service
+    from sqlalchemy import text
+    from app.services.cache import get_cache
+    
+    # Another process's bump is seen once this process's remembered version expires
+    monkeypatch.setattr(cache_service, "DATASET_VERSION_TTL", 0)
+    
+    url = "/api/v1/executive-orders/EO-13985"
+    etag = client.get(url).headers["ETag"]
+    
+    # Ingest committed by another process, then the cache backend is flushed or restarted
+    session.execute(text("UPDATE dataset_version SET version = version + 1"))
+    session.commit()
+    get_cache().clear()
+    
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+def test_error_responses_have_no_etag(client, sample_executive_orders):
+    """Test that errors are not given validators or Cache-Control."""
+    response = client.get("/api/v1/executive-orders/EO-99999")
+    
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+    assert "Cache-Control" not in response.headers
+
+def test_sparse_fieldsets(client, sample_executive_orders):
+    """Test that fields= limits the keys returned by the list, detail and latest endpoints."""
+    timeline_fields = {"id", "title", "issuance_date", "president"}
+    
+    data = json.loads(client.get("/api/v1/executive-orders?fields=title,issuance_date,president,id").data)
+    assert data["items"]
+    assert all(set(item) == timeline_fields for item in data["items"])
+    
+    detail = json.loads(client.get("/api/v1/executive-orders/EO-13985?fields=title").data)
+    assert detail["data"] == {"title": "Advancing Racial Equity and Support for Underserved Communities Through the Federal Government"}
+    
+    latest = json.loads(client.get("/api/v1/latest-executive-orders?limit=2&fields=id, url").data)
+    assert [set(item) for item in latest["data"]] == [{"id", "url"}, {"id", "url"}]
+
+def test_sparse_fieldsets_with_cursor(client, sample_executive_orders):
+    """Test that cursors still work when the sort field is not among the requested fields."""
+    data = json.loads(client.get("/api/v1/executive-orders?per_page=2&cursor=&sort=title&fields=president").data)
+    
+    assert all(set(item) == {"president"} for item in data["items"])
+    
+    next_page = json.loads(client.get(
+        f"/api/v1/executive-orders?per_page=2&sort=title&fields=president&cursor={data['pagination']['next_cursor']}"
+    ).data)
+    full = json.loads(client.get("/api/v1/executive-orders?per_page=4&sort=title").data)
+    
+    assert [item["president"] for item in data["items"] + next_page["items"]] == [item["president"] for item in full["items"]]
+
+def test_sparse_fieldsets_invalid_field(client, sample_executive_orders):
+    """Test that unknown or internal fields are rejected."""
+    for url in ["/api/v1/executive-orders?fields=title,content_hash",
+                "/api/v1/executive-orders/EO-13985?fields=bogus",
+                "/api/v1/latest-executive-orders?fields=__table__"]:
+        response = client.get(url)
+        data = json.loads(response.data)
+        
+        assert response.status_code == 400
+        assert "Invalid fields" in data["message"]
+
+def test_search_executive_orders(client, sample_executive_orders):
+    """Test full-text search over titles, ranked and filterable like the list endpoint."""
+    response = client.get("/api/v1/executive-orders/search?q=ensuring")
+    data = json.loads(response.data)
+    
+    assert response.status_code == 200
+    assert {item["id"] for item in data["items"]} == {"EO-13986", "EO-13983"}
+    assert data["pagination"]["total_items"] == 2
+    
+    # Words are stemmed, and every word must match
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=protect+science").data)
+    assert [item["id"] for item in data["items"]] == ["EO-13990"]
+    
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=ensuring&president=Donald J. Trump&fields=id").data)
+    assert data["items"] == [{"id": "EO-13983"}]
+    
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=ensuring&year=2020").data)
+    assert data["items"] == []
+
+def test_search_executive_orders_invalid_parameters(client, sample_executive_orders):
+    """Test that search requires a query and tolerates search syntax in it."""
+    for url in ["/api/v1/executive-orders/search", "/api/v1/executive-orders/search?q=%20"]:
+        response = client.get(url)
+        assert response.status_code == 400
+        assert "Missing search query" in json.loads(response.data)["message"]
+    
+    response = client.get('/api/v1/executive-orders/search?q=climate" (crisis*')
+    assert response.status_code == 200
+    assert [item["id"] for item in json.loads(response.data)["items"]] == ["EO-13990"]
+
+def test_get_executive_order_stats(client, sample_executive_orders):
+    """Test counts by president, year and month."""
+    response = client.get("/api/v1/executive-orders/stats")
+    data = json.loads(response.data)["data"]
+    
+    assert response.status_code == 200
+    assert data["total"] == 5
+    assert data["by_president"] == {"Joseph R. Biden Jr.": 3, "Donald J. Trump": 2}
+    assert data["by_year"] == {"2021": 5}
+    assert data["by_month"] == {"2021-01": 5}
+    assert data["groups"] == [
+        {"president": "Donald J. Trump", "year": 2021, "month": 1, "count": 2},
+        {"president": "Joseph R. Biden Jr.", "year": 2021, "month": 1, "count": 3},
+    ]
+
+def test_get_executive_order_stats_refreshed_by_ingest(client, session, sample_executive_orders):
+    """Test that stats are cached and recomputed after an ingest commit."""
+    from app.models.executive_order import ExecutiveOrder
+    from app.services.cache import bump_dataset_version
+    
+    assert json.loads(client.get("/api/v1/executive-orders/stats").data)["data"]["total"] == 5
+    
+    session.add(ExecutiveOrder(id="EO-12900", title="Older Order", issuance_date=date(1994, 2, 11),
+                               president="William J. Clinton"))
+    session.commit()
+    assert json.loads(client.get("/api/v1/executive-orders/stats").data)["data"]["total"] == 5
+    
+    bump_dataset_version()
+    data = json.loads(client.get("/api/v1/executive-orders/stats").data)["data"]
+    assert data["total"] == 6
+    assert data["by_year"] == {"1994": 1, "2021": 5}
+    assert data["groups"][0] == {"president": "William J. Clinton", "year": 1994, "month": 2, "count": 1}
+
+def test_get_executive_order_timeline(client, sample_executive_orders):
+    """Test that the timeline picks a zoom level from the bucket budget and range."""
+    data = json.loads(client.get("/api/v1/executive-orders/timeline").data)["data"]
+    
+    assert data["level"] == "day"
+    assert (data["start"], data["end"]) == ("2021-01-18", "2021-01-20")
+    assert [(bucket["start"], bucket["count"]) for bucket in data["buckets"]] == [
+        ("2021-01-18", 1), ("2021-01-19", 1), ("2021-01-20", 3)
+    ]
+    assert data["buckets"][2]["ids"] == ["EO-13985", "EO-13986", "EO-13990"]
+    
+    data = json.loads(client.get("/api/v1/executive-orders/timeline?start=1994-01-01&end=2024-12-31&buckets=40").data)["data"]
+    assert data["level"] == "year"
+    assert data["buckets"] == [{"start": "2021-01-01", "end": "2021-12-31", "first_date": "2021-01-18",
+                                "last_date": "2021-01-20", "count": 5, "ids": ["EO-13983", "EO-13985", "EO-13990"]}]
+    
+    data = json.loads(client.get("/api/v1/executive-orders/timeline?start=2021-01-19&end=2021-01-19&level=week").data)["data"]
+    assert [(bucket["start"], bucket["count"]) for bucket in data["buckets"]] == [("2021-01-18", 5)]
+
+def test_get_executive_order_timeline_invalid_parameters(client, sample_executive_orders):
+    """Test timeline parameter validation."""
+    for url in ["/api/v1/executive-orders/timeline?start=2021-13-01",
+                "/api/v1/executive-orders/timeline?start=2021-02-01&end=2021-01-01",
+                "/api/v1/executive-orders/timeline?buckets=0",
+                "/api/v1/executive-orders/timeline?level=decade",
+                # An explicit level may not exceed the bucket limit (366 days)
+                "/api/v1/executive-orders/timeline?start=2020-01-01&end=2020-12-31&level=day&buckets=100"]:
+        assert client.get(url).status_code == 400
+
+def test_get_related_executive_orders(client, session, sample_executive_orders):
+    """Test that related orders come from the neighbor table in rank order."""
+    from app.services.related_orders import refresh_related_orders
+    
+    refresh_related_orders()
+    
+    response = client.get("/api/v1/executive-orders/EO-13986/related")
+    data = json.loads(response.data)
+    
+    assert response.status_code == 200
+    # Shares "ensuring" with EO-13983 only
+    assert [item["id"] for item in data["data"]] == ["EO-13983"]
+    assert data["data"][0]["title"] == "Ensuring Democratic Accountability in Agency Rulemaking"
+    assert 0 < data["data"][0]["score"] <= 1
+    
+    data = json.loads(client.get("/api/v1/executive-orders/EO-13986/related?fields=id").data)
+    assert set(data["data"][0]) == {"id", "score"}
+    
+    # Known order without related orders, and an unknown order
+    assert json.loads(client.get("/api/v1/executive-orders/EO-13990/related").data)["data"] == []
+    assert client.get("/api/v1/executive-orders/EO-00000/related").status_code == 404
+
+def test_get_executive_orders_batch(client, sample_executive_orders):
+    """Test that a batch lookup preserves input order and reports missing ids."""
+    response = client.get("/api/v1/executive-orders/batch?ids=EO-13990,EO-00000,EO-13983,EO-13990&ids=EO-13985")
+    data = json.loads(response.data)["data"]
+    
+    assert response.status_code == 200
+    assert [item["id"] for item in data["items"]] == ["EO-13990", "EO-13983", "EO-13985"]
+    assert data["items"][1]["title"] == "Ensuring Democratic Accountability in Agency Rulemaking"
+    assert data["missing"] == ["EO-00000"]
+    
+    data = json.loads(client.get("/api/v1/executive-orders/batch?ids=EO-13986,EO-13984&fields=title").data)["data"]
+    assert [set(item) for item in data["items"]] == [{"title"}, {"title"}]
+    assert data["items"][0]["title"].startswith("Ensuring a Lawful")
+
+def test_post_executive_orders_batch(client, sample_executive_orders):
+    """Test the POST form of the batch lookup."""
+    response = client.post("/api/v1/executive-orders/batch?fields=id", json={"ids": ["EO-13984", "EO-13985", "EO-1"]})
+    data = json.loads(response.data)["data"]
+    
+    assert response.status_code == 200
+    assert data == {"items": [{"id": "EO-13984"}, {"id": "EO-13985"}], "missing": ["EO-1"]}
+
+def test_executive_orders_batch_invalid_parameters(client, sample_executive_orders):
+    """Test batch lookup validation."""
+    assert client.get("/api/v1/executive-orders/batch").status_code == 400
+    assert client.get("/api/v1/executive-orders/batch?ids=,").status_code == 400
+    assert client.get("/api/v1/executive-orders/batch?ids=" + ",".join(f"EO-{n}" for n in range(101))).status_code == 400
+    assert client.get("/api/v1/executive-orders/batch?ids=EO-13985&fields=bogus").status_code == 400
+    
+    assert client.post("/api/v1/executive-orders/batch", data="ids=EO-13985").status_code == 400
+    assert client.post("/api/v1/executive-orders/batch", json={"ids": "EO-13985"}).status_code == 400
+    assert client.post("/api/v1/executive-orders/batch", json={"ids": [13985]}).status_code == 400
+    assert client.post("/api/v1/executive-orders/batch", json={"ids": []}).status_code == 400
@@ -0,0 +1,160 @@
+import asyncio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from app.services.async_federal_register_client import AsyncFederalRegisterClient
+from app.services.federal_register_client import FederalRegisterAPIError
+from app.services.rate_limiter import TokenBucket
+
+def make_stub_app(state):
+    """Build a stub Federal Register API that records requests and concurrency."""
+    async def documents(request):
+        state['requests'].append(dict(request.query))
+        state['in_flight'] += 1
+        state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        try:
+            await asyncio.sleep(state.get('delay', 0))
+            
+            if state['failures'] > 0:
+                state['failures'] -= 1
+                return web.json_response({'errors': 'temporarily unavailable'}, status=503)
+            
+            number = request.query.get('conditions[executive_order_number]')
+            if number == '429' and state.get('rate_limited', 0) > 0:
+                state['rate_limited'] -= 1
+                # Large enough that an unread body keeps the connection busy
+                return web.json_response({'errors': 'slow down', 'padding': 'x' * 4 * 1024 * 1024}, status=429, headers={'Retry-After': '1'})
+            if number == '404':
+                return web.json_response({'errors': ['not found']}, status=404)
+            if number:
+                return web.json_response({'count': 1, 'results': [{'executive_order_number': number}]})
+            
+            return web.json_response({
+                'count': 1,
+                'total_pages': 1,
+                'results': [{'executive_order_number': '13985', 'page': request.query.get('page')}]
+            })
+        finally:
+            state['in_flight'] -= 1
+    
+    app = web.Application()
+    app.router.add_get('/api/v1/documents', documents)
+    return app
+
+def run_against_stub(scenario, **state_overrides):
+    """Run an async scenario against a fresh stub server and return the stub's state."""
+    state = {'requests': [], 'in_flight': 0, 'max_in_flight': 0, 'failures': 0}
+    state.update(state_overrides)
+    
+    async def main():
+        server = TestServer(make_stub_app(state))
+        await server.start_server()
+        try:
+            base_url = str(server.make_url('/api/v1/'))
+            await scenario(base_url, state)
+        finally:
+            await server.close()
+    
+    asyncio.run(main())
+    return state
+
+def test_get_executive_orders():
+    """Test listing executive orders with filters."""
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url) as client:
+            response = await client.get_executive_orders(page=2, per_page=10, year=2021)
+        
+        assert response['results'][0]['page'] == '2'
+        assert state['requests'][0]['conditions[publication_date][year]'] == '2021'
+        assert state['requests'][0]['conditions[presidential_document_type][]'] == 'executive_order'
+    
+    run_against_stub(scenario)
+
+def test_get_executive_order_by_number_and_search():
+    """Test number lookups and search share the sync client's parameters."""
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url) as client:
+            document = await client.get_executive_order_by_number('13990')
+            await client.search_executive_orders('climate')
+        
+        assert document == {'executive_order_number': '13990'}
+        assert state['requests'][1]['conditions[term]'] == 'climate'
+        assert state['requests'][1]['order'] == 'relevance'
+    
+    run_against_stub(scenario)
+
+def test_retries_server_errors():
+    """Test that 5xx responses are retried with backoff."""
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url) as client:
+            response = await client._make_request('documents', retry_delay=0.01)
+        
+        assert response['count'] == 1
+        assert len(state['requests']) == 3
+    
+    run_against_stub(scenario, failures=2)
+
+def test_rate_limit_backoff_releases_the_connection():
+    """Test that a Retry-After wait does not hold the only pooled connection."""
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url, max_connections_per_host=1, rate_limiter=TokenBucket(1000, 100)) as client:
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            
+            async def other_lookup():
+                # Starts once the first request has been answered with 429
+                await asyncio.sleep(0.1)
+                await client.get_executive_order_by_number('13990')
+                return loop.time() - started
+            
+            rate_limited, elapsed = await asyncio.gather(
+                client.get_executive_order_by_number('429'),
+                other_lookup()
+            )
+        
+        assert rate_limited == {'executive_order_number': '429'}
+        assert elapsed < 0.5
+    
+    run_against_stub(scenario, rate_limited=1)
+
+def test_client_errors_raise():
+    """Test that 4xx responses raise FederalRegisterAPIError."""
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url) as client:
+            with pytest.raises(FederalRegisterAPIError) as excinfo:
+                await client._make_request('documents', params={'conditions[executive_order_number]': '404'})
+        
+        assert excinfo.value.status_code == 404
+        assert 'not found' in excinfo.value.message
+    
+    run_against_stub(scenario)
+
+def test_concurrent_lookups_respect_per_host_limit():
+    """Test that concurrent lookups run in parallel but within the per-host limit."""
+    numbers = [str(14000 + i) for i in range(20)]
+    
+    async def scenario(base_url, state):
+        async with AsyncFederalRegisterClient(base_url=base_url, max_connections_per_host=4, rate_limiter=TokenBucket(1000, 100)) as client:
+            results = await client.get_executive_orders_by_numbers(numbers)
+        
+        assert [results[n]['executive_order_number'] for n in numbers] == numbers
+        assert 1 < state['max_in_flight'] <= 4
+    
+    run_against_stub(scenario, delay=0.02)
+
+def test_requests_wait_for_rate_limiter():
+    """Test that requests are paced by the rate limiter."""
+    numbers = [str(14000 + i) for i in range(4)]
+    
+    async def scenario(base_url, state):
+        loop = asyncio.get_running_loop()
+        limiter = TokenBucket(rate=50, capacity=1)
+        async with AsyncFederalRegisterClient(base_url=base_url, rate_limiter=limiter) as client:
+            started = loop.time()
+            await client.get_executive_orders_by_numbers(numbers)
+            elapsed = loop.time() - started
+        
+        # One request from the burst, then three more at 20 ms intervals
+        assert elapsed >= 0.05
+    
+    run_against_stub(scenario)
@@ -0,0 +1,75 @@
+from sqlalchemy import text
+
+from app.services.cache import MemoryCache, bump_dataset_version, get_cache, get_dataset_version
+
+def test_memory_cache_get_set_delete():
+    """Test basic memory cache operations."""
+    cache = MemoryCache()
+    
+    assert cache.get("missing") is None
+    
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+    
+    cache.delete("key")
+    assert cache.get("key") is None
+
+def test_memory_cache_expiry():
+    """Test that expired entries are treated as misses."""
+    cache = MemoryCache()
+    
+    cache.set("short", 1, timeout=-1)
+    cache.set("forever", 2, timeout=0)
+    
+    assert cache.get("short") is None
+    assert cache.get("forever") == 2
+
+def test_memory_cache_lru_eviction():
+    """Test that the least recently used entry is evicted first."""
+    cache = MemoryCache(max_entries=2)
+    
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_memory_cache_incr():
+    """Test counter increments used for the dataset version."""
+    cache = MemoryCache()
+    
+    assert cache.incr("version") == 1
+    assert cache.incr("version") == 2
+    assert cache.get("version") == 2
+
+def test_memory_cache_never_evicts_counters():
+    """Test that LRU eviction and expiry leave counters alone."""
+    cache = MemoryCache(max_entries=2)
+    
+    cache.incr("version")
+    for key in ("a", "b", "c", "d"):
+        cache.set(key, key)
+    
+    assert cache.get("version") == 1
+    assert cache.incr("version") == 2
+
+def test_dataset_version_is_stored_in_the_database(session, monkeypatch):
+    """Test that bumps made by other processes are seen, and a cache reset does not roll the version back."""
+    from app.services import cache as cache_service
+    
+    # Another process's bump is seen once this process's remembered version expires
+    monkeypatch.setattr(cache_service, "DATASET_VERSION_TTL", 0)
+    
+    version = bump_dataset_version()
+    assert get_dataset_version() == version
+    
+    # Another process (a Celery worker or fetch_data.py) bumping the version
+    session.execute(text("UPDATE dataset_version SET version = version + 1"))
+    session.commit()
+    assert get_dataset_version() == version + 1
+    
+    get_cache().clear()
+    assert get_dataset_version() == version + 1
@@ -0,0 +1,82 @@
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.executive_order import ExecutiveOrder
+from app.services import changes as changes_service
+from app.services.changes import get_changes
+
+@pytest.fixture
+def no_settle(monkeypatch):
+    """Serve changes as soon as they are written."""
+    monkeypatch.setattr(changes_service, "CHANGES_SETTLE_SECONDS", 0)
+
+def _feed(client, since=None, limit=None):
+    params = []
+    if since:
+        params.append(f"since={since}")
+    if limit:
+        params.append(f"limit={limit}")
+    response = client.get("/api/v1/executive-orders/changes" + ("?" + "&".join(params) if params else ""))
+    assert response.status_code == 200
+    return json.loads(response.data)["data"]
+
+def test_changes_pages_through_every_order(client, sample_executive_orders, no_settle):
+    """Test following next_since visits every order once, oldest write first."""
+    seen = []
+    since = None
+    while True:
+        data = _feed(client, since, limit=2)
+        seen.extend(item["id"] for item in data["items"])
+        assert all(item["op"] == "upsert" for item in data["items"])
+        since = data["next_since"]
+        if not data["has_more"]:
+            break
+    
+    assert sorted(seen) == sorted(eo.id for eo in sample_executive_orders)
+    assert len(seen) == len(set(seen))
+    
+    # Caught up: the same token returns nothing and is handed back
+    data = _feed(client, since)
+    assert data == {"items": [], "next_since": since, "has_more": False}
+
+def test_changes_include_updates_and_deletes(client, session, sample_executive_orders, no_settle):
+    """Test that writes after the watermark reappear and deletions come through as tombstones."""
+    since = _feed(client)["next_since"]
+    
+    order = session.get(ExecutiveOrder, "EO-13985")
+    order.plain_language_summary = "Updated summary"
+    session.commit()
+    ExecutiveOrder.query.filter_by(id="EO-13990").delete()
+    session.commit()
+    
+    data = _feed(client, since)
+    
+    assert [(item["op"], item["id"]) for item in data["items"]] == [
+        ("upsert", "EO-13985"),
+        ("delete", "EO-13990"),
+    ]
+    assert data["items"][0]["data"]["plain_language_summary"] == "Updated summary"
+    assert "data" not in data["items"][1]
+
+def test_changes_settle_window(session, sample_executive_orders):
+    """Test that changes younger than the settle window are held back."""
+    assert get_changes()["items"] == []
+    
+    later = datetime.utcnow() + timedelta(seconds=changes_service.CHANGES_SETTLE_SECONDS + 1)
+    assert len(get_changes(now=later)["items"]) == len(sample_executive_orders)
+
+def test_changes_fields(client, sample_executive_orders, no_settle):
+    """Test that fields limits each order's data."""
+    response = client.get("/api/v1/executive-orders/changes?fields=id,title&limit=1")
+    
+    item = json.loads(response.data)["data"]["items"][0]
+    assert set(item["data"]) == {"id", "title"}
+
+def test_changes_invalid_since(client):
+    """Test that a malformed since token is rejected."""
+    response = client.get("/api/v1/executive-orders/changes?since=not-a-token")
+    
+    assert response.status_code == 400
+    assert "Invalid since token" in json.loads(response.data)["message"]
@@ -0,0 +1,85 @@
+import gzip
+import json
+import brotli
+import pytest
+from app.utils import compression
+
+LIST_URL = "/api/v1/executive-orders?per_page=100"
+
+@pytest.fixture
+def small_threshold(app):
+    """Compress everything, so the small sample data set qualifies."""
+    original = app.config["COMPRESSION_MIN_SIZE"]
+    app.config["COMPRESSION_MIN_SIZE"] = 1
+    yield
+    app.config["COMPRESSION_MIN_SIZE"] = original
+
+def test_gzip_negotiation(client, sample_executive_orders, small_threshold):
+    """Test that gzip responses decode to the identity body and carry encoding-specific ETags."""
+    identity = client.get(LIST_URL)
+    compressed = client.get(LIST_URL, headers={"Accept-Encoding": "gzip"})
+    
+    assert "Content-Encoding" not in identity.headers
+    assert "Accept-Encoding" in identity.headers["Vary"]
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert json.loads(gzip.decompress(compressed.data)) == json.loads(identity.data)
+    assert compressed.headers["ETag"] == identity.headers["ETag"][:-1] + '-gzip"'
+    
+    revalidated = client.get(LIST_URL, headers={"Accept-Encoding": "gzip", "If-None-Match": compressed.headers["ETag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == compressed.headers["ETag"]
+    assert "Accept-Encoding" in revalidated.headers["Vary"]
+
+def test_brotli_preferred_unless_client_prefers_gzip(client, sample_executive_orders, small_threshold):
+    """Test Accept-Encoding quality values drive the choice of encoding."""
+    both = client.get(LIST_URL, headers={"Accept-Encoding": "gzip, deflate, br"})
+    assert both.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(both.data))["items"]
+    
+    prefers_gzip = client.get(LIST_URL, headers={"Accept-Encoding": "gzip;q=1.0, br;q=0.5"})
+    assert prefers_gzip.headers["Content-Encoding"] == "gzip"
+    
+    refuses = client.get(LIST_URL, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in refuses.headers
+
+def test_small_responses_are_not_compressed(client, sample_executive_orders):
+    """Test that bodies under COMPRESSION_MIN_SIZE are sent as-is."""
+    response = client.get("/api/v1/executive-orders/EO-13985?fields=id", headers={"Accept-Encoding": "gzip"})
+    
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+
+def test_cached_responses_reuse_compressed_bodies(client, sample_executive_orders, small_threshold, monkeypatch):
+    """Test that cache hits are served from the variants compressed on the first request."""
+    calls = []
+    original = compression.compress
+    
+    def counting_compress(body, encoding, app=None):
+        calls.append(encoding)
+        return original(body, encoding, app)
+    
+    monkeypatch.setattr("app.services.view_cache.compress", counting_compress)
+    monkeypatch.setattr("app.utils.compression.compress", counting_compress)
+    
+    first = client.get(LIST_URL, headers={"Accept-Encoding": "gzip"})
+    assert first.headers["X-Cache"] == "MISS"
+    assert sorted(calls) == ["br", "gzip"]
+    
+    second = client.get(LIST_URL, headers={"Accept-Encoding": "br"})
+    third = client.get(LIST_URL, headers={"Accept-Encoding": "gzip"})
+    
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["Content-Encoding"] == "br"
+    assert third.data == first.data
+    assert sorted(calls) == ["br", "gzip"]
+
+def test_compression_can_be_disabled(app, client, sample_executive_orders, small_threshold):
+    """Test that COMPRESSION_ENABLED=False sends identity bodies."""
+    app.config["COMPRESSION_ENABLED"] = False
+    try:
+        response = client.get(LIST_URL, headers={"Accept-Encoding": "gzip, br"})
+    finally:
+        app.config["COMPRESSION_ENABLED"] = True
+    
+    assert "Content-Encoding" not in response.headers
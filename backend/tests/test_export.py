@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.models.executive_order import ExecutiveOrder
+from app.services.export import export_executive_orders
+
+def test_export_ndjson(client, sample_executive_orders):
+    """Test that NDJSON export matches the detail representation, oldest first."""
+    response = client.get("/api/v1/executive-orders/export")
+    
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.headers["Content-Disposition"] == 'attachment; filename="executive-orders.ndjson"'
+    
+    lines = [json.loads(line) for line in response.data.decode("utf-8").splitlines()]
+    assert [line["id"] for line in lines] == ["EO-13983", "EO-13984", "EO-13985", "EO-13986", "EO-13990"]
+    
+    detail = json.loads(client.get("/api/v1/executive-orders/EO-13983").data)["data"]
+    assert lines[0] == detail
+
+def test_export_csv_with_filters_and_fields(client, sample_executive_orders):
+    """Test CSV export with president/year filters and a field subset."""
+    response = client.get("/api/v1/executive-orders/export?format=csv&president=Donald J. Trump&year=2021&fields=id,issuance_date")
+    
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert list(csv.reader(io.StringIO(response.data.decode("utf-8")))) == [
+        ["id", "issuance_date"],
+        ["EO-13983", "2021-01-18"],
+        ["EO-13984", "2021-01-19"],
+    ]
+
+def test_export_parquet(client, sample_executive_orders):
+    """Test that Parquet export is readable and typed."""
+    parquet = pytest.importorskip("pyarrow.parquet")
+    
+    response = client.get("/api/v1/executive-orders/export?format=parquet&fields=id,title,issuance_date")
+    table = parquet.read_table(io.BytesIO(response.data))
+    
+    assert response.status_code == 200
+    assert table.column_names == ["id", "title", "issuance_date"]
+    assert table.num_rows == 5
+    assert str(table.schema.field("issuance_date").type) == "date32[day]"
+    assert table.column("id").to_pylist()[0] == "EO-13983"
+
+def test_export_streams_in_batches(session, sample_executive_orders):
+    """Test that rows are encoded one batch per chunk."""
+    query = ExecutiveOrder.query.order_by(ExecutiveOrder.id)
+    
+    chunks = list(export_executive_orders(query, "ndjson", fields=["id"], batch_size=2))
+    assert [chunk.decode("utf-8").count("\n") for chunk in chunks] == [2, 2, 1]
+    
+    # Header first, then a chunk per batch
+    chunks = list(export_executive_orders(query, "csv", fields=["id"], batch_size=2))
+    assert len(chunks) == 4
+
+def test_export_invalid_parameters(client, sample_executive_orders):
+    """Test export parameter validation."""
+    for url in ["/api/v1/executive-orders/export?format=xml",
+                "/api/v1/executive-orders/export?fields=bogus",
+                "/api/v1/executive-orders/export?year=10000"]:
+        assert client.get(url).status_code == 400
@@ -0,0 +1,89 @@
+from datetime import date, datetime, timedelta
+
+from app.services import ingest_watermark
+from app.services.ingest_watermark import advance_watermark, get_watermark, incremental_start_date, observe_document
+from app.services.response_cache import DiskResponseCache
+from app.services.tasks import eo_tasks
+
+def test_observe_document_keeps_newest():
+    """Test that the newest (publication_date, document_number) wins and bad documents are ignored."""
+    latest = None
+    for document in [
+        {'publication_date': '2021-01-25', 'document_number': '2021-01753'},
+        {'publication_date': '2021-01-29', 'document_number': '2021-02034'},
+        {'publication_date': '2021-01-29', 'document_number': '2021-02000'},
+        {'publication_date': None, 'document_number': '2021-09999'},
+        {'document_number': '2021-09999'},
+    ]:
+        latest = observe_document(latest, document)
+    
+    assert latest == (date(2021, 1, 29), '2021-02034')
+
+def test_incremental_start_date(session, monkeypatch):
+    """Test the default window before the first run and the overlap after it."""
+    monkeypatch.setattr(ingest_watermark, 'INGEST_OVERLAP_DAYS', 3)
+    
+    assert incremental_start_date('test', default_days_back=30) == datetime.utcnow().date() - timedelta(days=30)
+    
+    advance_watermark('test', (date(2021, 1, 29), '2021-02034'))
+    
+    assert incremental_start_date('test') == date(2021, 1, 26)
+    assert incremental_start_date('test', overlap_days=0) == date(2021, 1, 29)
+
+def test_advance_watermark_only_moves_forward(session):
+    """Test that older positions and runs that started after the watermark leave it alone."""
+    assert advance_watermark('test', None) is False
+    assert get_watermark('test') is None
+    
+    assert advance_watermark('test', (date(2021, 1, 29), '2021-02034')) is True
+    assert advance_watermark('test', (date(2021, 1, 25), '2021-01753'), '2021-01-01') is False
+    assert advance_watermark('test', (date(2021, 3, 1), '2021-04000'), '2021-02-15') is False
+    assert advance_watermark('test', (date(2021, 2, 5), '2021-02500'), '2021-01-26') is True
+    
+    watermark = get_watermark('test')
+    assert (watermark.last_publication_date, watermark.last_document_number) == (date(2021, 2, 5), '2021-02500')
+
+def _run_update(monkeypatch, response_cache=None):
+    """Run update_executive_orders against one fake page, returning the summary and requested parameters."""
+    requested = []
+    
+    def fake_make_page_fetcher(**params):
+        requested.append(params)
+        return lambda page: {'total_pages': 1, 'results': [
+            {'document_number': '2021-02500', 'publication_date': '2021-02-05'},
+        ]}
+    
+    def fake_upsert(records):
+        return {'new': 0, 'updated': 0, 'unchanged': len(list(records))}
+    
+    monkeypatch.setattr(eo_tasks, 'make_page_fetcher', fake_make_page_fetcher)
+    monkeypatch.setattr(eo_tasks, 'get_default_response_cache', lambda: response_cache)
+    monkeypatch.setattr(eo_tasks, 'transform_federal_register_document_to_model', lambda document: {'id': document['document_number']})
+    monkeypatch.setattr(eo_tasks, 'upsert_executive_orders_in_batches', fake_upsert)
+    
+    return eo_tasks.update_executive_orders(), requested[0]
+
+def test_update_executive_orders_resumes_from_watermark(session, monkeypatch):
+    """Test that the daily task starts from the watermark and advances it after a complete run."""
+    monkeypatch.setattr(ingest_watermark, 'INGEST_OVERLAP_DAYS', 3)
+    advance_watermark(ingest_watermark.FEDERAL_REGISTER_SOURCE, (date(2021, 1, 29), '2021-02034'))
+    
+    summary, requested = _run_update(monkeypatch)
+    
+    # The watermark less the overlap, with no response cache to keep URLs stable for
+    assert requested['start_date'] == '2021-01-26'
+    assert summary['watermark_advanced'] is True
+    watermark = get_watermark(ingest_watermark.FEDERAL_REGISTER_SOURCE)
+    assert watermark.last_document_number == '2021-02500'
+    assert watermark.last_window_start == date(2021, 1, 26)
+
+def test_update_executive_orders_rounds_start_for_response_cache(session, monkeypatch, tmp_path):
+    """Test that the start is rounded back to a Monday when the response cache is enabled."""
+    monkeypatch.setattr(ingest_watermark, 'INGEST_OVERLAP_DAYS', 3)
+    advance_watermark(ingest_watermark.FEDERAL_REGISTER_SOURCE, (date(2021, 1, 29), '2021-02034'))
+    
+    summary, requested = _run_update(monkeypatch, response_cache=DiskResponseCache(str(tmp_path)))
+    
+    # Tuesday 2021-01-26 rounded back to Monday, and recorded as requested
+    assert requested['start_date'] == summary['start_date'] == '2021-01-25'
+    assert get_watermark(ingest_watermark.FEDERAL_REGISTER_SOURCE).last_window_start == date(2021, 1, 25)
@@ -0,0 +1,160 @@
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from sqlalchemy import event, update
+
+from app.database import db
+from app.models.executive_order import ExecutiveOrder
+from app.services import inverted_index
+from app.services.cache import bump_dataset_version
+from app.services.inverted_index import InvertedIndex, tokenize
+
+def _document(eo_id, title, summary=None, president="Joseph R. Biden Jr.", issuance_date="2021-01-20", updated_at=None):
+    return {
+        "id": eo_id,
+        "title": title,
+        "plain_language_summary": summary,
+        "president": president,
+        "issuance_date": issuance_date,
+        "updated_at": updated_at,
+    }
+
+@pytest.fixture
+def index():
+    index = InvertedIndex()
+    index.add(_document("EO-1", "Strengthening the Nation's Cybersecurity", "Improves federal networks."))
+    index.add(_document("EO-2", "Improving Federal Networks", "Follows up on cybersecurity.", issuance_date="2021-06-01"))
+    index.add(_document("EO-3", "Protecting Public Health", "Climate and health.", president="Donald J. Trump",
+                        issuance_date="2020-03-01"))
+    return index
+
+@pytest.fixture
+def memory_search(app, monkeypatch):
+    """Serve the search endpoint from a fresh in-memory index."""
+    monkeypatch.setitem(app.config, "SEARCH_BACKEND", "memory")
+    monkeypatch.setitem(app.extensions, "eo_search_index", InvertedIndex())
+    return app.extensions["eo_search_index"]
+
+def _ids(result):
+    return [document["id"] for document in result[1]]
+
+def test_tokenize():
+    """Test that text is lowercased and stopwords dropped."""
+    assert tokenize("Protecting the Public's Health, and SCIENCE") == ["protecting", "public", "s", "health", "science"]
+    assert tokenize(None) == []
+
+def test_search_ranks_with_bm25(index):
+    """Test that title matches outrank summary matches and every word must match."""
+    assert _ids(index.search("cybersecurity")) == ["EO-1", "EO-2"]
+    assert _ids(index.search("networks")) == ["EO-2", "EO-1"]
+    assert sorted(_ids(index.search("federal cybersecurity"))) == ["EO-1", "EO-2"]
+    assert _ids(index.search("cybersecurity climate")) == []
+    assert _ids(index.search("the")) == []
+
+def test_search_filters_and_pagination(index):
+    """Test president/year filters and slicing."""
+    assert _ids(index.search("health", president="Donald J. Trump")) == ["EO-3"]
+    assert _ids(index.search("health", president="Joseph R. Biden Jr.")) == []
+    assert _ids(index.search("networks", year=2021)) == ["EO-2", "EO-1"]
+    assert _ids(index.search("networks", year=2020)) == []
+    
+    total, documents = index.search("networks", limit=1, offset=1)
+    assert total == 2
+    assert [document["id"] for document in documents] == ["EO-1"]
+
+def test_updates_and_compaction(index):
+    """Test that re-added and removed orders are reflected, and compaction keeps results intact."""
+    index.add(_document("EO-2", "Improving Federal Procurement"))
+    assert _ids(index.search("networks")) == ["EO-1"]
+    assert _ids(index.search("procurement")) == ["EO-2"]
+    
+    index.remove("EO-3")
+    assert _ids(index.search("health")) == []
+    assert len(index) == 2
+    
+    index.compact()
+    assert index.deleted == 0
+    assert len(index.documents) == 2
+    assert _ids(index.search("procurement")) == ["EO-2"]
+    assert _ids(index.search("cybersecurity")) == ["EO-1"]
+
+def test_snapshot_round_trip(index, tmp_path):
+    """Test that a loaded snapshot answers queries like the original."""
+    index.remove("EO-3")
+    path = tmp_path / "index.snapshot"
+    index.save(str(path))
+    
+    loaded = InvertedIndex.load(str(path))
+    assert len(loaded) == 2
+    for query in ("cybersecurity", "networks", "federal", "health"):
+        assert loaded.search(query) == index.search(query)
+    
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        InvertedIndex.load(str(path))
+
+def test_memory_search_endpoint(client, session, memory_search, sample_executive_orders):
+    """Test that the search endpoint is served from the index and follows ingest commits."""
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=ensuring&fields=id,title").data)
+    # The shorter title scores higher
+    assert data["items"] == [
+        {"id": "EO-13983", "title": "Ensuring Democratic Accountability in Agency Rulemaking"},
+        {"id": "EO-13986", "title": sample_executive_orders[1].title},
+    ]
+    assert data["pagination"]["total_items"] == 2
+    assert len(memory_search) == 5
+    
+    # Matches the database search's representation
+    detail = json.loads(client.get("/api/v1/executive-orders/EO-13983").data)["data"]
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=rulemaking").data)
+    assert data["items"] == [detail]
+    
+    eo = session.get(ExecutiveOrder, "EO-13983")
+    eo.title = "Ensuring Accountability in Agency Guidance"
+    session.add(ExecutiveOrder(id="EO-14000", title="Ensuring Fair Markets", issuance_date=date(2021, 7, 9),
+                               president="Joseph R. Biden Jr."))
+    session.commit()
+    bump_dataset_version()
+    
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=ensuring&fields=id").data)
+    assert data["items"] == [{"id": "EO-14000"}, {"id": "EO-13983"}, {"id": "EO-13986"}]
+    assert json.loads(client.get("/api/v1/executive-orders/search?q=rulemaking").data)["items"] == []
+    
+    # Deletions trigger a rebuild
+    session.delete(session.get(ExecutiveOrder, "EO-14000"))
+    session.commit()
+    bump_dataset_version()
+    
+    data = json.loads(client.get("/api/v1/executive-orders/search?q=ensuring&fields=id").data)
+    assert data["items"] == [{"id": "EO-13983"}, {"id": "EO-13986"}]
+
+def test_sync_skips_database_until_version_changes(session, memory_search, sample_executive_orders):
+    """Test that searches run no SQL at all while the dataset version is unchanged."""
+    inverted_index.get_search_index()
+    
+    statements = []
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+    
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        assert inverted_index.get_search_index() is memory_search
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+    
+    assert statements == []
+
+def test_sync_picks_up_orders_committed_out_of_order(session, memory_search, sample_executive_orders):
+    """Test that an order stamped just before the index's watermark is still re-indexed by the next sync."""
+    index = inverted_index.get_search_index()
+    watermark = datetime.fromisoformat(index.watermark)
+    
+    # Stamped before the watermark, as when a slower writer commits after a faster one
+    session.execute(update(ExecutiveOrder).where(ExecutiveOrder.id == "EO-13986")
+                    .values(title="Ensuring Fair Markets", updated_at=watermark - timedelta(seconds=5)))
+    session.commit()
+    bump_dataset_version()
+    
+    assert _ids(inverted_index.get_search_index().search("markets")) == ["EO-13986"]
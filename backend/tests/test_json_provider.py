@@ -0,0 +1,55 @@
+import json
+import pytest
+from datetime import date, datetime
+from flask import Flask
+from app.models.executive_order import ExecutiveOrder
+from app.utils import json_provider
+from app.utils.json_provider import IsoJSONProvider, OrjsonProvider, init_json_provider
+
+PAYLOAD = {
+    'b': [1, 2.5, None, True],
+    'a': {'issuance_date': date(2021, 1, 20), 'created_at': datetime(2021, 1, 25, 12, 30, 1, 250)},
+    'c': {2021: 'integer key'}
+}
+
+def make_app(provider):
+    app = Flask(__name__)
+    app.config['JSON_PROVIDER'] = provider
+    init_json_provider(app)
+    return app
+
+@pytest.mark.parametrize('provider', ['orjson', 'default'])
+def test_providers_write_iso_dates(provider):
+    """Test that both providers write dates like to_dict() and sort keys."""
+    app = make_app(provider)
+    
+    with app.app_context():
+        body = app.json.response(PAYLOAD).get_data(as_text=True)
+    
+    assert json.loads(body) == {
+        'a': {'created_at': '2021-01-25T12:30:01.000250', 'issuance_date': '2021-01-20'},
+        'b': [1, 2.5, None, True],
+        'c': {'2021': 'integer key'}
+    }
+    assert body.index('"a"') < body.index('"b"') < body.index('"c"')
+
+def test_orjson_provider_is_used_when_available():
+    """Test provider selection and the fallback when orjson is missing."""
+    assert isinstance(make_app('orjson').json, OrjsonProvider)
+    assert isinstance(make_app('default').json, IsoJSONProvider)
+    
+    with pytest.raises(ValueError):
+        make_app('simplejson')
+
+def test_orjson_fallback(monkeypatch):
+    """Test that a missing orjson falls back to the standard library provider."""
+    monkeypatch.setattr(json_provider, 'orjson', None)
+    
+    assert type(make_app('orjson').json) is IsoJSONProvider
+
+def test_row_serialization_matches_to_dict(app, session, sample_executive_orders):
+    """Test that the column-level path serializes exactly like to_dict()."""
+    instance = session.get(ExecutiveOrder, "EO-13985")
+    row = session.query(*ExecutiveOrder.serialized_columns()).filter(ExecutiveOrder.id == "EO-13985").one()
+    
+    assert json.loads(app.json.dumps(ExecutiveOrder.row_to_dict(row))) == instance.to_dict()
@@ -0,0 +1,177 @@
+import io
+import json
+import threading
+import time
+import pytest
+from app.services.federal_register_client import FederalRegisterClient
+from app.services.rate_limiter import TokenBucket
+from app.services.response_cache import DiskResponseCache
+from app.services.page_prefetcher import iter_pages, make_page_fetcher, PageFetchError
+
+def make_fetcher(total_pages=5, delay=0.01, fail_on=None):
+    """Build a fake page fetcher that records how many fetches overlap."""
+    state = {'in_flight': 0, 'max_in_flight': 0, 'fetched': []}
+    lock = threading.Lock()
+    
+    def fetch_page(page):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+            state['fetched'].append(page)
+        try:
+            time.sleep(delay)
+            if page == fail_on:
+                raise RuntimeError(f"page {page} failed")
+            return {'total_pages': total_pages, 'results': [{'page': page}]}
+        finally:
+            with lock:
+                state['in_flight'] -= 1
+    
+    return fetch_page, state
+
+def test_iter_pages_yields_in_order():
+    """Test that every page is yielded once, in order."""
+    fetch_page, state = make_fetcher(total_pages=6)
+    
+    pages = [page for page, response in iter_pages(fetch_page, max_workers=3, max_prefetch=3)]
+    
+    assert pages == [1, 2, 3, 4, 5, 6]
+    assert sorted(state['fetched']) == [1, 2, 3, 4, 5, 6]
+
+def test_iter_pages_bounds_concurrency():
+    """Test that no more than max_workers fetches run at once."""
+    fetch_page, state = make_fetcher(total_pages=10, delay=0.02)
+    
+    list(iter_pages(fetch_page, max_workers=2, max_prefetch=6))
+    
+    assert state['max_in_flight'] <= 2
+
+def test_iter_pages_prefetches_while_consumer_works():
+    """Test that upcoming pages are fetched while the current one is processed."""
+    fetch_page, state = make_fetcher(total_pages=4, delay=0.01)
+    pages = iter_pages(fetch_page, max_workers=2, max_prefetch=2)
+    
+    next(pages)
+    next(pages)
+    time.sleep(0.1)
+    
+    # Pages 3 and 4 were requested before the consumer asked for them
+    assert 3 in state['fetched'] and 4 in state['fetched']
+    pages.close()
+
+def test_iter_pages_start_and_last_page():
+    """Test resuming from a page and stopping at a page limit."""
+    fetch_page, _ = make_fetcher(total_pages=10)
+    
+    pages = [page for page, _ in iter_pages(fetch_page, start_page=3, last_page=5)]
+    
+    assert pages == [3, 4, 5]
+
+def test_iter_pages_single_page():
+    """Test a result set that fits on the first page."""
+    fetch_page, state = make_fetcher(total_pages=1)
+    
+    assert [page for page, _ in iter_pages(fetch_page)] == [1]
+    assert state['fetched'] == [1]
+
+def test_iter_pages_reports_failed_page():
+    """Test that a failed fetch stops iteration and names the page."""
+    fetch_page, _ = make_fetcher(total_pages=5, fail_on=3)
+    yielded = []
+    
+    with pytest.raises(PageFetchError) as excinfo:
+        for page, _ in iter_pages(fetch_page, max_workers=2, max_prefetch=2):
+            yielded.append(page)
+    
+    assert yielded == [1, 2]
+    assert excinfo.value.page == 3
+
+def test_make_page_fetcher_uses_one_client_per_thread():
+    """Test that fetch threads do not share a client."""
+    clients = []
+    
+    class FakeClient:
+        def __init__(self):
+            clients.append(self)
+        
+        def get_executive_orders(self, page=1, per_page=20, **filters):
+            return {'page': page, 'per_page': per_page, 'filters': filters}
+    
+    fetch_page = make_page_fetcher(client_factory=FakeClient, per_page=10, year=2021)
+    
+    assert fetch_page(1) == {'page': 1, 'per_page': 10, 'filters': {'year': 2021}}
+    fetch_page(2)
+    assert len(clients) == 1
+    
+    thread = threading.Thread(target=fetch_page, args=(3,))
+    thread.start()
+    thread.join()
+    assert len(clients) == 2
+
+def test_make_page_fetcher_confirms_pages():
+    """Test that the fetcher passes if_changed through and confirms pages with the same filters."""
+    calls = []
+    
+    class FakeClient:
+        def get_executive_orders(self, **kwargs):
+            calls.append(('get', kwargs))
+            return {'total_pages': 1, 'results': []}
+        
+        def confirm_executive_orders(self, **kwargs):
+            calls.append(('confirm', kwargs))
+    
+    fetch_page = make_page_fetcher(client_factory=FakeClient, per_page=25, if_changed=True, year=2021)
+    fetch_page(3)
+    fetch_page.confirm(3)
+    
+    assert calls == [
+        ('get', {'page': 3, 'per_page': 25, 'year': 2021, 'if_changed': True}),
+        ('confirm', {'page': 3, 'per_page': 25, 'year': 2021}),
+    ]
+
+def test_iter_pages_releases_unread_pages_when_stopped(tmp_path):
+    """Test that stopping mid-stream closes every fetched page and leaves no temporary files in the cache."""
+    responses = []
+    
+    class FakeStreamResponse:
+        status_code = 200
+        headers = {'ETag': '"v1"'}
+        
+        def __init__(self, page):
+            body = {'total_pages': 4, 'results': [{'document_number': f"{page}-{n}"} for n in range(3)]}
+            self.raw = io.BytesIO(json.dumps(body).encode('utf-8'))
+            self.closed = False
+        
+        def close(self):
+            self.closed = True
+    
+    def fake_request(**kwargs):
+        response = FakeStreamResponse(kwargs['params']['page'])
+        responses.append(response)
+        return response
+    
+    cache = DiskResponseCache(str(tmp_path))
+    
+    def make_client():
+        client = FederalRegisterClient(rate_limiter=TokenBucket(1000, 1000), response_cache=cache)
+        client.session.request = fake_request
+        return client
+    
+    fetch_page = make_page_fetcher(client_factory=make_client, stream=True)
+    
+    def consume():
+        for page, response in iter_pages(fetch_page, max_workers=2, max_prefetch=2):
+            results = iter(response['results'])
+            if page == 1:
+                list(results)
+                continue
+            # Fail partway through page 2, with pages 3 and 4 prefetched
+            next(results)
+            raise RuntimeError("store failed")
+    
+    with pytest.raises(RuntimeError):
+        consume()
+    
+    assert len(responses) >= 2
+    assert all(response.closed for response in responses)
+    assert list(tmp_path.glob('*.tmp')) == []
@@ -0,0 +1,102 @@
+import threading
+import pytest
+from app.services.federal_register_client import FederalRegisterClient
+from app.services.rate_limiter import TokenBucket, create_rate_limiter
+
+class FakeClock:
+    """Manually advanced clock; sleeping advances it."""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+    
+    def __call__(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+def test_burst_then_steady_rate():
+    """Test that the bucket allows a burst and then paces requests at the rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+    
+    waits = [bucket.acquire() for _ in range(5)]
+    
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([0.5, 0.5])
+    assert clock.now == pytest.approx(1.0)
+
+def test_refill_is_capped_at_capacity():
+    """Test that idle time does not accumulate more than capacity tokens."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock)
+    
+    clock.now = 100
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(1.0)]
+
+def test_reservations_queue_concurrent_callers():
+    """Test that concurrent callers are given increasing waits rather than the same slot."""
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, capacity=1, clock=clock)
+    waits = []
+    lock = threading.Lock()
+    
+    def worker():
+        wait = bucket.reserve()
+        with lock:
+            waits.append(wait)
+    
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert sorted(waits) == pytest.approx([0.0, 0.1, 0.2, 0.3, 0.4])
+
+def test_create_rate_limiter_disabled():
+    """Test that a non-positive rate disables limiting."""
+    assert create_rate_limiter(0) is None
+    assert isinstance(create_rate_limiter(5, 10), TokenBucket)
+
+def test_client_acquires_before_each_request(monkeypatch):
+    """Test that FederalRegisterClient consults the limiter before every attempt."""
+    calls = []
+    
+    class RecordingLimiter:
+        def acquire(self, tokens=1):
+            calls.append('acquire')
+            return 0
+    
+    class FakeResponse:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.content = b'{}'
+            self.headers = {}
+        
+        def json(self):
+            return {'count': 0}
+        
+        def close(self):
+            pass
+    
+    responses = [FakeResponse(503), FakeResponse(200)]
+    
+    def fake_request(**kwargs):
+        calls.append('request')
+        return responses.pop(0)
+    
+    client = FederalRegisterClient(rate_limiter=RecordingLimiter())
+    monkeypatch.setattr(client.session, 'request', fake_request)
+    monkeypatch.setattr('app.services.federal_register_client.time.sleep', lambda seconds: None)
+    
+    assert client._make_request('documents') == {'count': 0}
+    assert calls == ['acquire', 'request', 'acquire', 'request']
+
+def test_redis_bucket_falls_back_when_unreachable():
+    """Test that the shared bucket limits locally when Redis is unavailable."""
+    limiter = create_rate_limiter(1, 1, backend='redis', redis_url='redis://localhost:1/0')
+    
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() > 0
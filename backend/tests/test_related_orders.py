@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta
+
+from app.models.executive_order import ExecutiveOrder
+from app.models.executive_order_neighbor import ExecutiveOrderNeighbor
+from app.services import related_orders
+from app.services.related_orders import SimilarityModel, refresh_related_orders
+
+ORDERS = [
+    ("EO-1", "Improving the Nation's Cybersecurity", None, "Joseph R. Biden Jr.", date(2021, 5, 12)),
+    ("EO-2", "Strengthening Cybersecurity of Federal Networks", None, "Donald J. Trump", date(2017, 5, 11)),
+    ("EO-3", "Cybersecurity Workforce", "Grows the federal cybersecurity workforce.", "Joseph R. Biden Jr.", date(2021, 6, 1)),
+    ("EO-4", "Protecting Public Health", None, "Joseph R. Biden Jr.", date(2021, 1, 20)),
+]
+
+def _neighbors(session):
+    lists = {}
+    for row in session.query(ExecutiveOrderNeighbor).order_by(ExecutiveOrderNeighbor.eo_id, ExecutiveOrderNeighbor.rank):
+        lists.setdefault(row.eo_id, []).append(row.neighbor_id)
+    return lists
+
+def _add_orders(session, orders):
+    for eo_id, title, summary, president, issued in orders:
+        session.add(ExecutiveOrder(id=eo_id, title=title, plain_language_summary=summary,
+                                   president=president, issuance_date=issued))
+    session.commit()
+
+def test_similarity_model_ranks_text_president_and_date():
+    """Test that only orders sharing terms are related, re-ranked by president and date."""
+    model = SimilarityModel(ORDERS)
+    
+    assert [eo_id for eo_id, _ in model.neighbors("EO-1")] == ["EO-3", "EO-2"]
+    assert [eo_id for eo_id, _ in model.neighbors("EO-2")] == ["EO-3", "EO-1"]
+    assert model.neighbors("EO-4") == []
+    assert model.neighbors("EO-1", k=1) == model.neighbors("EO-1")[:1]
+    assert model.sharing_terms("EO-4") == {"EO-4"}
+
+def test_neighbors_of_matches_across_block_sizes(monkeypatch):
+    """Test that computing similarities in blocks of orders gives the same lists as one order at a time."""
+    model = SimilarityModel(ORDERS)
+    expected = {eo_id: model.neighbors(eo_id) for eo_id, *_ in ORDERS}
+    
+    assert dict(model.neighbors_of(expected)) == expected
+    # Three orders per block, so the last block is partial
+    monkeypatch.setattr(related_orders, "_SIMILARITY_BLOCK_CELLS", 3 * len(ORDERS))
+    assert dict(model.neighbors_of(expected)) == expected
+
+def test_refresh_related_orders_is_incremental(session):
+    """Test that a refresh only rewrites lists affected by changed orders."""
+    _add_orders(session, ORDERS)
+    
+    assert refresh_related_orders() == {"considered": 4, "rewritten": 3}
+    assert _neighbors(session) == {"EO-1": ["EO-3", "EO-2"], "EO-2": ["EO-3", "EO-1"], "EO-3": ["EO-1", "EO-2"]}
+    
+    # Nothing changed since the last refresh
+    assert refresh_related_orders()["considered"] == 0
+    
+    # A new order only affects the orders it shares terms with
+    session.query(ExecutiveOrder).update({"updated_at": datetime.utcnow() - timedelta(days=1)})
+    session.commit()
+    _add_orders(session, [("EO-5", "Public Health Workforce", None, "Joseph R. Biden Jr.", date(2021, 1, 21))])
+    summary = refresh_related_orders()
+    assert summary["considered"] == 3
+    assert _neighbors(session)["EO-5"] == ["EO-4", "EO-3"]
+    assert _neighbors(session)["EO-4"] == ["EO-5"]
+    
+    # Deleted orders drop out of every list
+    session.query(ExecutiveOrderNeighbor).filter(ExecutiveOrderNeighbor.eo_id == "EO-5").delete()
+    session.delete(session.get(ExecutiveOrder, "EO-5"))
+    session.commit()
+    refresh_related_orders()
+    assert "EO-5" not in _neighbors(session)
+    assert "EO-4" not in _neighbors(session)
+    assert all("EO-5" not in neighbors for neighbors in _neighbors(session).values())
+
+def test_refresh_related_orders_full(session):
+    """Test that a full refresh leaves unchanged lists alone."""
+    _add_orders(session, ORDERS)
+    refresh_related_orders()
+    
+    assert refresh_related_orders(full=True) == {"considered": 4, "rewritten": 0}
@@ -0,0 +1,140 @@
+import json
+import os
+import time
+from app.services.federal_register_client import FederalRegisterClient, NotModifiedResponse
+from app.services.rate_limiter import TokenBucket
+from app.services.response_cache import DiskResponseCache
+
+class FakeResponse:
+    def __init__(self, status_code, content=b'', headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+    
+    def json(self):
+        return json.loads(self.content)
+    
+    def close(self):
+        pass
+
+PAGE = b'{"count": 120, "total_pages": 3, "results": [{"executive_order_number": "13985"}]}'
+
+def make_client(tmp_path, responses, requests_made, **cache_options):
+    """Build a client whose session replays the given responses and records request headers."""
+    cache = DiskResponseCache(str(tmp_path), **cache_options)
+    client = FederalRegisterClient(rate_limiter=TokenBucket(1000, 1000), response_cache=cache)
+    
+    def fake_request(**kwargs):
+        requests_made.append(kwargs.get('headers') or {})
+        return responses.pop(0)
+    
+    client.session.request = fake_request
+    return client, cache
+
+def test_fresh_entries_skip_the_network(tmp_path):
+    """Test that a response within its max-age is served from disk."""
+    requests_made = []
+    responses = [FakeResponse(200, PAGE, {'Cache-Control': 'max-age=600', 'ETag': '"v1"'})]
+    client, _ = make_client(tmp_path, responses, requests_made)
+    
+    first = client.get_executive_orders(page=1, per_page=50)
+    second = client.get_executive_orders(page=1, per_page=50)
+    
+    assert first == second
+    assert second['results'][0]['executive_order_number'] == '13985'
+    assert len(requests_made) == 1
+
+def test_stale_entries_are_revalidated(tmp_path):
+    """Test conditional requests and that 304s skip parsing once a page is confirmed."""
+    requests_made = []
+    responses = [
+        FakeResponse(200, PAGE, {'ETag': '"v1"', 'Last-Modified': 'Mon, 20 Jan 2025 00:00:00 GMT'}),
+        FakeResponse(304),
+        FakeResponse(304),
+    ]
+    client, _ = make_client(tmp_path, responses, requests_made, default_freshness=0)
+    
+    client.get_executive_orders(page=2, per_page=50, if_changed=True)
+    
+    # Not yet confirmed as stored: the cached body is returned in full
+    unconfirmed = client.get_executive_orders(page=2, per_page=50, if_changed=True)
+    assert unconfirmed['results'][0]['executive_order_number'] == '13985'
+    assert requests_made[1] == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Mon, 20 Jan 2025 00:00:00 GMT'
+    }
+    
+    client.confirm_executive_orders(page=2, per_page=50)
+    confirmed = client.get_executive_orders(page=2, per_page=50, if_changed=True)
+    
+    assert isinstance(confirmed, NotModifiedResponse)
+    assert confirmed.not_modified
+    assert confirmed == {'count': 120, 'total_pages': 3}
+    assert 'results' not in confirmed
+    assert len(requests_made) == 3
+
+def test_no_store_responses_are_not_cached(tmp_path):
+    """Test that no-store responses are always refetched."""
+    requests_made = []
+    responses = [
+        FakeResponse(200, PAGE, {'Cache-Control': 'no-store', 'ETag': '"v1"'}),
+        FakeResponse(200, PAGE, {'Cache-Control': 'no-store', 'ETag': '"v1"'}),
+    ]
+    client, _ = make_client(tmp_path, responses, requests_made)
+    
+    client.get_executive_orders()
+    client.get_executive_orders()
+    
+    assert requests_made == [{}, {}]
+
+def test_ttl_eviction(tmp_path):
+    """Test that entries unused for longer than the TTL are dropped."""
+    cache = DiskResponseCache(str(tmp_path), ttl=60)
+    key = cache.make_key('https://example.test/documents', {'page': 1})
+    cache.set(key, PAGE, {'ETag': '"v1"'})
+    
+    assert cache.get(key) is not None
+    
+    # Age the entry past the TTL
+    old = time.time() - 120
+    os.utime(os.path.join(str(tmp_path), f"{key}.meta"), (old, old))
+    
+    assert cache.get(key) is None
+    assert not os.listdir(str(tmp_path))
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    """Test that the oldest entries are evicted once bodies exceed max_bytes."""
+    cache = DiskResponseCache(str(tmp_path), max_bytes=len(PAGE) * 2)
+    keys = [cache.make_key('https://example.test/documents', {'page': page}) for page in range(3)]
+    
+    for offset, key in enumerate(keys):
+        cache.set(key, PAGE, {'ETag': '"v1"'})
+        # Give each entry a distinct last-used time
+        used = time.time() - 100 + offset
+        os.utime(os.path.join(str(tmp_path), f"{key}.meta"), (used, used))
+    cache.prune()
+    
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
+
+def test_prune_removes_stale_temporary_files(tmp_path):
+    """Test that prune deletes abandoned temporary files but keeps ones still being written."""
+    cache = DiskResponseCache(str(tmp_path))
+    stale = tmp_path / 'abandoned.tmp'
+    fresh = tmp_path / 'writing.tmp'
+    stale.write_bytes(b'{')
+    fresh.write_bytes(b'{')
+    old = time.time() - 2 * 3600
+    os.utime(str(stale), (old, old))
+    
+    cache.prune()
+    
+    assert not stale.exists()
+    assert fresh.exists()
+
+def test_make_key_ignores_parameter_order():
+    """Test that parameter order does not change the cache key."""
+    url = 'https://example.test/documents'
+    assert DiskResponseCache.make_key(url, {'a': 1, 'b': 2}) == DiskResponseCache.make_key(url, {'b': 2, 'a': 1})
+    assert DiskResponseCache.make_key(url, {'a': 1}) != DiskResponseCache.make_key(url, {'a': 2})
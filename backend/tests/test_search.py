@@ -0,0 +1,79 @@
+from datetime import date
+
+from sqlalchemy import text
+
+from app.models.executive_order import ExecutiveOrder
+from app.services import search
+from app.services.search import fts5_match_expression, search_executive_orders
+
+def _search_ids(search_text):
+    query, rank_order = search_executive_orders(ExecutiveOrder.query, search_text)
+    return [eo.id for eo in query.order_by(*rank_order).all()]
+
+def test_fts5_match_expression():
+    """Test that user input is reduced to quoted words."""
+    assert fts5_match_expression('climate crisis') == '"climate" "crisis"'
+    assert fts5_match_expression('"climate" OR title:NEAR(*)') == '"climate" "OR" "title" "NEAR"'
+    assert fts5_match_expression(' -*" ') is None
+
+def test_search_ranks_title_matches_first(session):
+    """Test that a title match outranks a summary match."""
+    session.add_all([
+        ExecutiveOrder(id="EO-1", title="Strengthening Cybersecurity", issuance_date=date(2021, 5, 12),
+                       president="Joseph R. Biden Jr.", plain_language_summary="Improves federal networks."),
+        ExecutiveOrder(id="EO-2", title="Improving Federal Networks", issuance_date=date(2021, 6, 1),
+                       president="Joseph R. Biden Jr.", plain_language_summary="Follows up on cybersecurity."),
+    ])
+    session.commit()
+    
+    assert _search_ids("cybersecurity") == ["EO-1", "EO-2"]
+    assert _search_ids("networks") == ["EO-2", "EO-1"]
+
+def test_search_index_follows_writes(session):
+    """Test that updates and deletes are reflected in search results."""
+    eo = ExecutiveOrder(id="EO-1", title="Promoting Competition", issuance_date=date(2021, 7, 9),
+                        president="Joseph R. Biden Jr.")
+    session.add(eo)
+    session.commit()
+    assert _search_ids("competition") == ["EO-1"]
+    
+    eo.title = "Promoting Fair Markets"
+    session.commit()
+    assert _search_ids("competition") == []
+    assert _search_ids("markets") == ["EO-1"]
+    
+    session.delete(eo)
+    session.commit()
+    assert _search_ids("markets") == []
+
+def test_search_index_is_keyed_by_rowid(session):
+    """Test that FTS rows share their order's rowid, so triggers can replace them without a scan."""
+    eo = ExecutiveOrder(id="EO-1", title="Promoting Competition", issuance_date=date(2021, 7, 9),
+                        president="Joseph R. Biden Jr.")
+    session.add_all([eo, ExecutiveOrder(id="EO-2", title="Protecting Public Health", issuance_date=date(2021, 1, 20),
+                                        president="Joseph R. Biden Jr.")])
+    session.commit()
+    eo.title = "Promoting Fair Markets"
+    session.commit()
+    
+    orders = session.execute(text("SELECT rowid, id FROM executive_orders ORDER BY rowid")).all()
+    fts_rows = session.execute(text("SELECT rowid, id FROM executive_orders_fts ORDER BY rowid")).all()
+    assert fts_rows == orders
+
+def test_search_falls_back_to_substring_match(session, monkeypatch):
+    """Test that databases without full-text search match every word in the title or summary."""
+    monkeypatch.delitem(search._SEARCH_BY_DIALECT, "sqlite")
+    session.add_all([
+        ExecutiveOrder(id="EO-1", title="Strengthening Cybersecurity", issuance_date=date(2021, 5, 12),
+                       president="Joseph R. Biden Jr.", plain_language_summary="Improves federal networks."),
+        ExecutiveOrder(id="EO-2", title="Improving Federal Networks", issuance_date=date(2021, 6, 1),
+                       president="Joseph R. Biden Jr.", plain_language_summary="Follows up on cybersecurity."),
+    ])
+    session.commit()
+    
+    assert _search_ids("CYBERSECURITY") == ["EO-1", "EO-2"]
+    assert _search_ids("federal networks") == ["EO-2", "EO-1"]
+    assert _search_ids("cybersecurity follows") == ["EO-2"]
+    # _ is matched literally, not as a LIKE wildcard
+    assert _search_ids("cyber_ecurity") == []
+    assert _search_ids(" -*") == []
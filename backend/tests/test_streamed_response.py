@@ -0,0 +1,92 @@
+import io
+import json
+import pytest
+from app.services.federal_register_client import FederalRegisterClient
+from app.services.rate_limiter import TokenBucket
+from app.services.response_cache import DiskResponseCache
+from app.services.streamed_response import StreamedPage, StreamedPageError
+
+BODY = json.dumps({
+    'count': 2,
+    'total_pages': 1,
+    'results': [
+        {'document_number': '2021-01753', 'executive_order_number': 13985, 'topics': ['civil rights'], 'meta': {'score': 1.5}},
+        {'document_number': '2021-01754', 'executive_order_number': 13986, 'topics': [], 'meta': None}
+    ],
+    'next_page_url': None
+}).encode('utf-8')
+
+def test_fields_are_available_before_results():
+    """Test that the fields preceding results are read up front."""
+    page = StreamedPage(io.BytesIO(BODY))
+    
+    assert page['total_pages'] == 1
+    assert page.get('count') == 2
+    assert 'results' in page
+    assert page.get('missing', 'default') == 'default'
+
+def test_results_are_built_one_at_a_time():
+    """Test that documents, including nested values, are rebuilt exactly."""
+    completed = []
+    closed = []
+    page = StreamedPage(io.BytesIO(BODY), on_complete=completed.append, on_close=lambda: closed.append(True))
+    
+    results = page.get('results')
+    first = next(results)
+    
+    assert first == json.loads(BODY)['results'][0]
+    assert not completed
+    
+    rest = list(results)
+    
+    assert [doc['executive_order_number'] for doc in rest] == [13986]
+    # Trailing fields are read once the results are exhausted
+    assert completed == [{'count': 2, 'total_pages': 1, 'next_page_url': None}]
+    assert closed == [True]
+
+def test_truncated_body_raises():
+    """Test that a body cut off mid-document raises StreamedPageError."""
+    page = StreamedPage(io.BytesIO(BODY[:120]))
+    
+    with pytest.raises(StreamedPageError):
+        list(page.results)
+
+def test_client_streams_and_caches_body(tmp_path):
+    """Test that a streamed response is copied into the response cache once fully read."""
+    class FakeStreamResponse:
+        status_code = 200
+        headers = {'ETag': '"v1"', 'Cache-Control': 'max-age=600'}
+        
+        def __init__(self):
+            self.raw = io.BytesIO(BODY)
+            self.closed = False
+        
+        def close(self):
+            self.closed = True
+    
+    response = FakeStreamResponse()
+    requests_made = []
+    
+    def fake_request(**kwargs):
+        requests_made.append(kwargs)
+        return response
+    
+    cache = DiskResponseCache(str(tmp_path))
+    client = FederalRegisterClient(rate_limiter=TokenBucket(1000, 1000), response_cache=cache)
+    client.session.request = fake_request
+    
+    page = client.get_executive_orders(per_page=2, stream=True)
+    documents = list(page['results'])
+    
+    assert requests_made[0]['stream'] is True
+    assert len(documents) == 2
+    assert response.closed
+    
+    # Served from the cached copy without another request
+    cached_page = client.get_executive_orders(per_page=2, stream=True)
+    
+    assert cached_page['total_pages'] == 1
+    assert list(cached_page['results']) == documents
+    assert len(requests_made) == 1
+    # No temporary copies are left behind
+    assert sorted(path.suffix for path in tmp_path.iterdir()) == ['.body', '.meta']
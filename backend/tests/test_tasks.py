@@ -0,0 +1,123 @@
+from app.services.tasks import eo_tasks
+from app.services.tasks.eo_tasks import (
+    split_into_lanes, fetch_executive_orders_for_years, fetch_historical_executive_orders, summarize_historical_fetch,
+    refresh_related_orders
+)
+
+def test_split_into_lanes():
+    """Test that years are dealt round-robin into at most the requested lanes."""
+    years = list(range(1994, 2001))
+    
+    lanes = split_into_lanes(years, 3)
+    
+    assert lanes == [[1994, 1997, 2000], [1995, 1998], [1996, 1999]]
+    assert sorted(year for lane in lanes for year in lane) == years
+    
+    # More lanes than years gives one year per lane
+    assert split_into_lanes([2020, 2021], 8) == [[2020], [2021]]
+    
+    # A cap below one still makes progress
+    assert split_into_lanes([2020, 2021], 0) == [[2020, 2021]]
+
+def test_fetch_executive_orders_for_years_reports_failures(app, monkeypatch):
+    """Test that one failing year does not stop the rest of its lane."""
+    def fake_fetch_year(year):
+        if year == 2001:
+            raise RuntimeError("upstream unavailable")
+        return {'year': year, 'total_records': 10}
+    
+    monkeypatch.setattr(eo_tasks, '_fetch_year', fake_fetch_year)
+    
+    summaries = fetch_executive_orders_for_years.run([2000, 2001, 2002])
+    
+    assert [s['year'] for s in summaries] == [2000, 2001, 2002]
+    assert summaries[1]['error'] == "upstream unavailable"
+    assert summaries[2]['total_records'] == 10
+
+def test_fetch_historical_returns_the_summary_task_id(app, monkeypatch):
+    """Test that the returned ID is the summary task's, with the related-orders refresh linked to it."""
+    dispatched = {}
+    
+    def fake_chord(header):
+        def apply(body):
+            dispatched['header'] = list(header)
+            dispatched['body'] = body
+            return body.freeze()
+        return apply
+    
+    monkeypatch.setattr(eo_tasks, 'chord', fake_chord)
+    
+    result = fetch_historical_executive_orders.run(start_year=2000, end_year=2003, max_concurrency=2)
+    
+    body = dispatched['body']
+    assert len(dispatched['header']) == 2
+    assert body.task == summarize_historical_fetch.name
+    assert result['chord_id'] == body.id
+    assert [link.task for link in body.options['link']] == [refresh_related_orders.name]
+
+def test_summarize_historical_fetch():
+    """Test aggregation of per-lane year summaries."""
+    lane_results = [
+        [{'year': 1995, 'total_records': 5, 'new_records': 5, 'updated_records': 0, 'unchanged_records': 0}],
+        [{'year': 1994, 'total_records': 7, 'new_records': 3, 'updated_records': 2, 'unchanged_records': 2},
+         {'year': 1996, 'error': 'boom'}]
+    ]
+    
+    summary = summarize_historical_fetch.run(lane_results, 1994, 1996)
+    
+    assert summary['total_records'] == 12
+    assert summary['new_records'] == 8
+    assert summary['updated_records'] == 2
+    assert summary['unchanged_records'] == 2
+    assert summary['years_processed'] == 2
+    assert summary['error_years'] == [1996]
+
+def test_ingest_pages_skips_not_modified_pages(session, monkeypatch):
+    """Test that unchanged pages are skipped and stored pages are confirmed."""
+    from app.services.federal_register_client import NotModifiedResponse
+    
+    stored = []
+    confirmed = []
+    responses = {
+        1: {'total_pages': 2, 'results': [{'document_number': 'a'}]},
+        2: NotModifiedResponse({'total_pages': 2}),
+    }
+    
+    def fetch_page(page):
+        return responses[page]
+    fetch_page.confirm = confirmed.append
+    
+    def fake_upsert(records):
+        records = list(records)
+        stored.extend(records)
+        return {'new': len(records), 'updated': 0, 'unchanged': 0}
+    
+    monkeypatch.setattr(eo_tasks, 'transform_federal_register_document_to_model', lambda document: {'id': document['document_number']})
+    monkeypatch.setattr(eo_tasks, 'upsert_executive_orders_in_batches', fake_upsert)
+    
+    totals = eo_tasks._ingest_pages(fetch_page)
+    
+    assert stored == [{'id': 'a'}]
+    assert confirmed == [1]
+    assert totals['new'] == 1
+    assert totals['not_modified_pages'] == 1
+    assert totals['completed'] is True
+
+def test_ingest_pages_does_not_confirm_failed_pages(session, monkeypatch):
+    """Test that a page whose write fails is not confirmed, so it is parsed again next run."""
+    confirmed = []
+    
+    def fetch_page(page):
+        return {'total_pages': 1, 'results': [{'document_number': 'a'}]}
+    fetch_page.confirm = confirmed.append
+    
+    def failing_upsert(records):
+        raise RuntimeError("database unavailable")
+    
+    monkeypatch.setattr(eo_tasks, 'upsert_executive_orders_in_batches', failing_upsert)
+    
+    totals = eo_tasks._ingest_pages(fetch_page)
+    
+    assert confirmed == []
+    assert totals['errors'] == 1
+    assert totals['completed'] is False
@@ -0,0 +1,55 @@
+from datetime import date
+
+from app.services.timeline import TimelineIndex, bucket_end, bucket_span, choose_level
+
+ORDERS = [
+    (date(2020, 12, 31), "EO-1"),
+    (date(2021, 1, 18), "EO-2"),
+    (date(2021, 1, 19), "EO-3"),
+    (date(2021, 1, 20), "EO-4"),
+    (date(2021, 1, 20), "EO-5"),
+    (date(2021, 1, 20), "EO-6"),
+    (date(2021, 4, 2), "EO-7"),
+]
+
+def test_bucket_bounds():
+    """Test calendar bucket boundaries."""
+    assert bucket_end('year', date(2021, 1, 1)) == date(2021, 12, 31)
+    assert bucket_end('quarter', date(2021, 10, 1)) == date(2021, 12, 31)
+    assert bucket_end('month', date(2024, 2, 1)) == date(2024, 2, 29)
+    assert bucket_end('week', date(2021, 1, 18)) == date(2021, 1, 24)
+    
+    assert bucket_span('month', date(2020, 12, 31), date(2021, 1, 1)) == 2
+    assert bucket_span('week', date(2021, 1, 17), date(2021, 1, 18)) == 2
+    assert bucket_span('quarter', date(2021, 1, 1), date(2021, 12, 31)) == 4
+
+def test_choose_level():
+    """Test that the finest level fitting the bucket budget is chosen."""
+    assert choose_level(date(1994, 1, 1), date(2024, 12, 31), 200) == 'quarter'
+    assert choose_level(date(2021, 1, 1), date(2021, 12, 31), 100) == 'week'
+    assert choose_level(date(2021, 1, 1), date(2021, 1, 31), 100) == 'day'
+    assert choose_level(date(1994, 1, 1), date(2024, 12, 31), 5) == 'year'
+
+def test_timeline_buckets():
+    """Test bucket counts, bounds, representatives and range lookups."""
+    timeline = TimelineIndex(ORDERS)
+    
+    assert timeline.lookup('year', date(2000, 1, 1), date(2030, 1, 1)) == [
+        {'start': '2020-01-01', 'end': '2020-12-31', 'first_date': '2020-12-31', 'last_date': '2020-12-31',
+         'count': 1, 'ids': ['EO-1']},
+        {'start': '2021-01-01', 'end': '2021-12-31', 'first_date': '2021-01-18', 'last_date': '2021-04-02',
+         'count': 6, 'ids': ['EO-2', 'EO-4', 'EO-7']},
+    ]
+    
+    # Buckets overlapping the range are included whole
+    months = timeline.lookup('month', date(2021, 1, 20), date(2021, 3, 31))
+    assert [(bucket['start'], bucket['count']) for bucket in months] == [('2021-01-01', 5)]
+    
+    days = timeline.lookup('day', date(2021, 1, 19), date(2021, 1, 20))
+    assert [(bucket['start'], bucket['count'], bucket['ids']) for bucket in days] == [
+        ('2021-01-19', 1, ['EO-3']),
+        ('2021-01-20', 3, ['EO-4', 'EO-5', 'EO-6']),
+    ]
+    
+    assert timeline.lookup('week', date(2022, 1, 1), date(2022, 12, 31)) == []
+    assert (timeline.first_date, timeline.last_date) == (date(2020, 12, 31), date(2021, 4, 2))
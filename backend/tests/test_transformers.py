@@ -1,4 +1,4 @@
-from app.utils.data_transformers import transform_federal_register_document_to_model, transform_federal_register_response
+from app.utils.data_transformers import transform_federal_register_document_to_model, transform_federal_register_response, compute_content_hash
 from datetime import date
 
 def test_transform_document_with_complete_data():
@@ -106,4 +106,26 @@ def test_transform_empty_response():
     
     # Response with no results
     results = transform_federal_register_response({"count": 0})
-    assert len(results) == 0
\ No newline at end of file
+    assert len(results) == 0
+
+def test_compute_content_hash():
+    """Test that content hashes track content and ignore the ID."""
+    document = {
+        "executive_order_number": "13985",
+        "title": "Advancing Racial Equity",
+        "signing_date": "2021-01-20",
+        "president": "Joseph R. Biden Jr."
+    }
+    
+    first = transform_federal_register_document_to_model(document)
+    second = transform_federal_register_document_to_model(dict(document))
+    
+    assert compute_content_hash(first) == compute_content_hash(second)
+    assert len(compute_content_hash(first)) == 64
+    
+    # The ID is the key, not part of the content
+    assert compute_content_hash(first) == compute_content_hash({**first, "id": "EO-1"})
+    
+    # Any content change produces a different hash
+    assert compute_content_hash(first) != compute_content_hash({**first, "title": "Amended"})
+    assert compute_content_hash(first) != compute_content_hash({**first, "issuance_date": date(2021, 1, 21)})
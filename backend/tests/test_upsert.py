@@ -0,0 +1,99 @@
+from app.models.executive_order import ExecutiveOrder
+from app.services.upsert import upsert_executive_orders, upsert_executive_orders_in_batches
+from app.utils.data_transformers import compute_content_hash
+from datetime import date
+
+def make_record(eo_id, title="Test Executive Order", issued=date(2021, 1, 20)):
+    """Build a record shaped like transform_federal_register_document_to_model output."""
+    return {
+        "id": eo_id,
+        "title": title,
+        "issuance_date": issued,
+        "president": "Joseph R. Biden Jr.",
+        "federal_register_citation": "86 FR 7009",
+        "url": f"https://www.federalregister.gov/documents/{eo_id}",
+        "plain_language_summary": None
+    }
+
+def test_upsert_inserts_new_records(session):
+    """Test that unseen records are inserted."""
+    counts = upsert_executive_orders([make_record("EO-1"), make_record("EO-2")])
+    session.commit()
+    
+    assert counts == {"new": 2, "updated": 0, "unchanged": 0}
+    assert session.get(ExecutiveOrder, "EO-1").title == "Test Executive Order"
+    assert session.get(ExecutiveOrder, "EO-2").created_at is not None
+
+def test_upsert_updates_and_skips(session):
+    """Test that changed records are updated and identical ones are left alone."""
+    upsert_executive_orders([make_record("EO-1"), make_record("EO-2")])
+    session.commit()
+    original_updated_at = session.get(ExecutiveOrder, "EO-2").updated_at
+    session.expire_all()
+    
+    counts = upsert_executive_orders([
+        make_record("EO-1", title="Amended Title"),
+        make_record("EO-2"),
+        make_record("EO-3")
+    ])
+    session.commit()
+    session.expire_all()
+    
+    assert counts == {"new": 1, "updated": 1, "unchanged": 1}
+    assert session.get(ExecutiveOrder, "EO-1").title == "Amended Title"
+    assert session.get(ExecutiveOrder, "EO-2").updated_at == original_updated_at
+
+def test_upsert_deduplicates_batch(session):
+    """Test that a repeated id within one batch is written once, last value winning."""
+    counts = upsert_executive_orders([
+        make_record("EO-1", title="First"),
+        make_record("EO-1", title="Second"),
+        {"id": None, "title": "No ID"}
+    ])
+    session.commit()
+    
+    assert counts == {"new": 1, "updated": 0, "unchanged": 0}
+    assert session.get(ExecutiveOrder, "EO-1").title == "Second"
+
+def test_upsert_empty_batch(session):
+    """Test that an empty batch does nothing."""
+    assert upsert_executive_orders([]) == {"new": 0, "updated": 0, "unchanged": 0}
+
+def test_upsert_stores_content_hash(session):
+    """Test that rows written by ingest carry the hash of their content."""
+    record = make_record("EO-1")
+    upsert_executive_orders([record])
+    session.commit()
+    
+    stored = session.get(ExecutiveOrder, "EO-1")
+    
+    assert stored.content_hash == compute_content_hash(record)
+
+def test_upsert_backfills_missing_hash(session):
+    """Test that rows created before content hashing are rewritten once, then skipped."""
+    session.add(ExecutiveOrder(**make_record("EO-1")))
+    session.commit()
+    
+    assert upsert_executive_orders([make_record("EO-1")])["updated"] == 1
+    session.commit()
+    
+    assert upsert_executive_orders([make_record("EO-1")])["unchanged"] == 1
+
+def test_upsert_in_batches_consumes_lazily(session, monkeypatch):
+    """Test that a record stream is written in fixed-size batches and counts are summed."""
+    batch_sizes = []
+    original = upsert_executive_orders
+    
+    def recording_upsert(records, session=None):
+        batch_sizes.append(len(records))
+        return original(records, session=session)
+    
+    monkeypatch.setattr('app.services.upsert.upsert_executive_orders', recording_upsert)
+    
+    records = (make_record(f"EO-{i}") for i in range(7))
+    counts = upsert_executive_orders_in_batches(records, batch_size=3)
+    session.commit()
+    
+    assert batch_sizes == [3, 3, 1]
+    assert counts == {"new": 7, "updated": 0, "unchanged": 0}
+    assert session.query(ExecutiveOrder).count() == 7